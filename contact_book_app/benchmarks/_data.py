@@ -0,0 +1,34 @@
+# contact_book_app/benchmarks/_data.py
+"""
+Synthetic data generators shared by the benchmark scripts.
+"""
+import random
+import uuid
+from typing import Iterator, List, Optional
+
+from contact_book_app.domain.repository import Contact
+
+_FIRST_NAMES = ["Alice", "Bob", "Carol", "Dave", "Erin", "Frank", "Grace", "Heidi",
+                "Ivan", "Judy", "Mallory", "Niaj", "Olivia", "Peggy", "Rupert", "Sybil"]
+_LAST_NAMES = ["Smith", "Jones", "Taylor", "Brown", "Williams", "Wilson", "Johnson",
+               "Davies", "Robinson", "Wright", "Thompson", "Evans", "Walker", "White"]
+_DOMAINS = ["example.com", "example.org", "mail.test", "corp.test"]
+
+
+def make_contacts(count: int, seed: int = 42) -> List[Contact]:
+    """Builds a reproducible list of contacts with unique emails."""
+    return list(iter_contacts(count, seed))
+
+
+def iter_contacts(count: int, seed: int = 42) -> Iterator[Contact]:
+    """Yields a reproducible stream of contacts with unique emails."""
+    rng = random.Random(seed)
+    for i in range(count):
+        first = rng.choice(_FIRST_NAMES)
+        last = rng.choice(_LAST_NAMES)
+        email: Optional[str] = f"{first}.{last}.{i}@{rng.choice(_DOMAINS)}".lower()
+        yield Contact(
+            contact_id=uuid.UUID(int=rng.getrandbits(128), version=4),
+            name=f"{first} {last}",
+            email=email,
+        )
@@ -0,0 +1,101 @@
+# contact_book_app/benchmarks/bench_async.py
+"""
+Compares request throughput of the synchronous ContactService, serving one
+request at a time, with the AsyncContactService serving many concurrent
+requests through the thread pool adapter, over a file-backed SQLite book.
+
+Usage:
+    python benchmarks/bench_async.py [--requests 20000] [--concurrency 64] [--workers 4]
+"""
+import argparse
+import asyncio
+import os
+import random
+import tempfile
+import time
+
+from _data import make_contacts
+from contact_book_app.domain.async_model import AsyncContactService
+from contact_book_app.domain.model import ContactService
+from contact_book_app.infrastructure.async_adapter import ThreadPoolContactRepository
+from contact_book_app.infrastructure.sqlite_repository import SqliteContactRepository
+
+PRELOADED = 50_000
+WRITE_RATIO = 0.1
+
+
+def _plan(requests: int):
+    """Returns a reproducible list of (is_write, argument) requests."""
+    contacts = make_contacts(PRELOADED)
+    rng = random.Random(0)
+    plan = []
+    for i in range(requests):
+        if rng.random() < WRITE_RATIO:
+            plan.append((True, f"bench.{i}@example.com"))
+        else:
+            plan.append((False, rng.choice(contacts).email))
+    return contacts, plan
+
+
+def bench_sync(path: str, requests: int) -> float:
+    contacts, plan = _plan(requests)
+    repo = SqliteContactRepository(path)
+    repo.add_many(contacts)
+    service = ContactService(repo)
+    start = time.perf_counter()
+    for is_write, email in plan:
+        if is_write:
+            service.add_contact("Bench", email)
+        else:
+            repo.find_by_email(email)
+    elapsed = time.perf_counter() - start
+    repo.close()
+    return requests / elapsed
+
+
+def bench_async(path: str, requests: int, concurrency: int, workers: int) -> float:
+    contacts, plan = _plan(requests)
+    sqlite_repo = SqliteContactRepository(path, check_same_thread=False)
+    sqlite_repo.add_many(contacts)
+    adapter = ThreadPoolContactRepository(sqlite_repo, max_workers=workers)
+    service = AsyncContactService(adapter)
+
+    async def serve() -> float:
+        queue = iter(plan)
+
+        async def client() -> None:
+            for is_write, email in queue:
+                if is_write:
+                    await service.add_contact("Bench", email)
+                else:
+                    await adapter.find_by_email(email)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(client() for _ in range(concurrency)))
+        return time.perf_counter() - start
+
+    elapsed = asyncio.run(serve())
+    adapter.close()
+    sqlite_repo.close()
+    return requests / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        sync_rate = bench_sync(os.path.join(tmp, "sync.db"), args.requests)
+        async_rate = bench_async(os.path.join(tmp, "async.db"), args.requests,
+                                 args.concurrency, args.workers)
+    print(f"{'path':<6} {'requests/s':>12}")
+    print(f"{'sync':<6} {sync_rate:>12,.0f}")
+    print(f"{'async':<6} {async_rate:>12,.0f}  "
+          f"({args.concurrency} concurrent clients, {args.workers} workers)")
+
+
+if __name__ == "__main__":
+    main()
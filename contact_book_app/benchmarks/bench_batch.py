@@ -0,0 +1,51 @@
+# contact_book_app/benchmarks/bench_batch.py
+"""
+Measures how many batch-mode commands per second a single script run can
+execute against a file-backed SQLite book, for add, update and delete.
+
+Usage:
+    python benchmarks/bench_batch.py [--commands 10000] [--format json]
+"""
+import argparse
+import io
+import os
+import tempfile
+import time
+
+from _data import make_contacts
+from contact_book_app.domain.model import ContactService
+from contact_book_app.infrastructure.sqlite_repository import SqliteContactRepository
+from contact_book_app.presentation.batch_cli import BatchRunner
+
+
+def _scripts(commands: int):
+    """Returns (label, script) pairs that add, update and delete `commands` contacts."""
+    contacts = make_contacts(commands)
+    adds = "".join(f"add '{c.name}' --email {c.email}\n" for c in contacts)
+    updates = "".join(f"update {c.email} --name '{c.name} Jr'\n" for c in contacts)
+    deletes = "".join(f"delete {c.email}\n" for c in contacts)
+    return [("add", adds), ("update", updates), ("delete", deletes)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--commands", type=int, default=10_000)
+    parser.add_argument("--format", choices=("json", "tsv"), default="json")
+    args = parser.parse_args()
+
+    print(f"{'command':<8} {'commands/s':>12}")
+    with tempfile.TemporaryDirectory() as tmp, open(os.devnull, "w") as sink:
+        repo = SqliteContactRepository(os.path.join(tmp, "book.db"))
+        runner = BatchRunner(ContactService(repo), output_format=args.format,
+                             stdout=sink, stderr=sink)
+        for label, script in _scripts(args.commands):
+            start = time.perf_counter()
+            if not runner.run_script(io.StringIO(script)):
+                raise SystemExit(f"{label} script reported errors")
+            elapsed = time.perf_counter() - start
+            print(f"{label:<8} {args.commands / elapsed:>12,.0f}")
+        repo.close()
+
+
+if __name__ == "__main__":
+    main()
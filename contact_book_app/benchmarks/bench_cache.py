@@ -0,0 +1,57 @@
+# contact_book_app/benchmarks/bench_cache.py
+"""
+Compares get() throughput of a file-backed SQLite book with and without a
+CachingContactRepository in front, for a skewed (80/20) access pattern.
+
+Usage:
+    python benchmarks/bench_cache.py [--size 100000] [--lookups 200000] [--cache-size 10000]
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from _data import make_contacts
+from contact_book_app.infrastructure.caching_repository import CachingContactRepository
+from contact_book_app.infrastructure.sqlite_repository import SqliteContactRepository
+
+
+def _workload(ids, lookups: int):
+    """Returns lookups where 80% go to 20% of the contacts."""
+    rng = random.Random(0)
+    hot = ids[:len(ids) // 5]
+    return [rng.choice(hot) if rng.random() < 0.8 else rng.choice(ids) for _ in range(lookups)]
+
+
+def _rate(repo, workload) -> float:
+    start = time.perf_counter()
+    for contact_id in workload:
+        repo.get(contact_id)
+    return len(workload) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--lookups", type=int, default=200_000)
+    parser.add_argument("--cache-size", type=int, default=10_000)
+    args = parser.parse_args()
+
+    contacts = make_contacts(args.size)
+    workload = _workload([c.contact_id for c in contacts], args.lookups)
+    with tempfile.TemporaryDirectory() as tmp:
+        sqlite_repo = SqliteContactRepository(os.path.join(tmp, "book.db"))
+        sqlite_repo.add_many(contacts)
+        cached = CachingContactRepository(sqlite_repo, max_size=args.cache_size)
+        print(f"{'repository':<10} {'gets/s':>12}")
+        print(f"{'sqlite':<10} {_rate(sqlite_repo, workload):>12,.0f}")
+        print(f"{'cached':<10} {_rate(cached, workload):>12,.0f}")
+        sqlite_repo.close()
+    stats = cached.stats
+    print(f"hit ratio {stats.hit_ratio:.1%}, {stats.evictions:,} evictions, "
+          f"{stats.size:,} cached")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# contact_book_app/benchmarks/bench_concurrency.py
+"""
+Measures how the throughput of a thread-safe ContactService scales with
+the number of threads, on a mixed workload of email lookups, point reads
+and adds.
+
+Usage:
+    python benchmarks/bench_concurrency.py [--threads 1 2 4 8] [--operations 200000]
+"""
+import argparse
+import random
+import threading
+import time
+from typing import List
+
+from _data import make_contacts
+from contact_book_app.domain.model import ContactService
+from contact_book_app.infrastructure.in_memory_repository import InMemoryContactRepository
+from contact_book_app.infrastructure.thread_safe_repository import ThreadSafeContactRepository
+
+PRELOADED = 100_000
+WRITE_RATIO = 0.2
+
+
+def run(threads: int, operations: int) -> float:
+    """Runs `operations` spread over `threads` threads; returns operations per second."""
+    contacts = make_contacts(PRELOADED)
+    repo = ThreadSafeContactRepository(InMemoryContactRepository())
+    repo.add_many(contacts)
+    service = ContactService(repo=repo, thread_safe=True)
+    per_thread = operations // threads
+    start_line = threading.Barrier(threads + 1)
+
+    def worker(seed: int) -> None:
+        rng = random.Random(seed)
+        start_line.wait()
+        for i in range(per_thread):
+            if rng.random() < WRITE_RATIO:
+                service.add_contact(name="Bench", email=f"bench.{seed}.{i}@example.com")
+            else:
+                contact = rng.choice(contacts)
+                repo.email_exists(contact.email)
+                repo.get(contact.contact_id)
+
+    workers: List[threading.Thread] = [
+        threading.Thread(target=worker, args=(seed,)) for seed in range(threads)]
+    for thread in workers:
+        thread.start()
+    start_line.wait()
+    started = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    return per_thread * threads / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--operations", type=int, default=200_000)
+    args = parser.parse_args()
+
+    print(f"{'threads':>7} {'ops/s':>12} {'scaling':>8}")
+    baseline = None
+    for threads in args.threads:
+        throughput = run(threads, args.operations)
+        baseline = baseline or throughput
+        print(f"{threads:>7} {throughput:>12,.0f} {throughput / baseline:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
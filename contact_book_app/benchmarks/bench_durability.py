@@ -0,0 +1,60 @@
+# contact_book_app/benchmarks/bench_durability.py
+"""
+Measures the durable in-memory repository: write throughput for several
+group-commit sizes, and recovery time from a snapshot versus from the log.
+
+Usage:
+    python benchmarks/bench_durability.py [--writes 20000] [--size 100000]
+"""
+import argparse
+import tempfile
+import time
+
+from _data import iter_contacts, make_contacts
+from contact_book_app.infrastructure.durable_repository import DurableContactRepository
+
+
+def write_throughput(sync_every: int, writes: int) -> float:
+    """Returns single-contact adds per second with the given group-commit size."""
+    contacts = make_contacts(writes)
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = DurableContactRepository(tmp, sync_every=sync_every, sync_interval=60)
+        start = time.perf_counter()
+        for contact in contacts:
+            repo.add(contact)
+        repo.sync()
+        elapsed = time.perf_counter() - start
+        repo.close()
+    return writes / elapsed
+
+
+def recovery_time(size: int, from_snapshot: bool) -> float:
+    """Returns the seconds needed to reopen a book of `size` contacts."""
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = DurableContactRepository(tmp, sync_every=10_000, snapshot_every=size * 2)
+        repo.add_many(iter_contacts(size))
+        if from_snapshot:
+            repo.snapshot()
+        repo.close()
+        start = time.perf_counter()
+        DurableContactRepository(tmp).close()
+        return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--writes", type=int, default=20_000)
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--sync-every", type=int, nargs="+", default=[1, 10, 100, 1000])
+    args = parser.parse_args()
+
+    print(f"{'sync_every':>10} {'adds/s':>12}")
+    for sync_every in args.sync_every:
+        print(f"{sync_every:>10} {write_throughput(sync_every, args.writes):>12,.0f}")
+    print(f"\nrecovery of {args.size} contacts (seconds)")
+    print(f"{'log only':<14} {recovery_time(args.size, from_snapshot=False):>8.3f}")
+    print(f"{'snapshot':<14} {recovery_time(args.size, from_snapshot=True):>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
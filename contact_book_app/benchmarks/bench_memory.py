@@ -0,0 +1,61 @@
+# contact_book_app/benchmarks/bench_memory.py
+"""
+Measures the memory cost per contact of the in-memory storage options:
+plain Contact objects in InMemoryContactRepository, SlottedContact records,
+and the columnar ColumnarContactRepository.
+
+Usage:
+    python benchmarks/bench_memory.py [--sizes 100000 1000000]
+"""
+import argparse
+import gc
+import tracemalloc
+from typing import Callable
+
+from _data import iter_contacts
+from contact_book_app.infrastructure.compact_repository import ColumnarContactRepository, SlottedContact
+from contact_book_app.infrastructure.in_memory_repository import InMemoryContactRepository
+
+
+def _in_memory(size: int) -> object:
+    repo = InMemoryContactRepository()
+    repo.add_many(iter_contacts(size))
+    return repo
+
+
+def _slotted(size: int) -> object:
+    return {record.id_int: record for record in map(SlottedContact.from_contact, iter_contacts(size))}
+
+
+def _columnar(size: int) -> object:
+    repo = ColumnarContactRepository()
+    repo.add_many(iter_contacts(size))
+    return repo
+
+
+def bytes_per_contact(build: Callable[[int], object], size: int) -> float:
+    """Returns the memory retained by build(size), divided by size."""
+    gc.collect()
+    tracemalloc.start()
+    store = build(size)
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del store
+    return retained / size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    args = parser.parse_args()
+
+    layouts = {"dataclass": _in_memory, "slotted": _slotted, "columnar": _columnar}
+    print(f"{'layout':<10} {'size':>9} {'bytes/contact':>14}")
+    for size in args.sizes:
+        for name, build in layouts.items():
+            print(f"{name:<10} {size:>9} {bytes_per_contact(build, size):>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+# contact_book_app/benchmarks/bench_metrics.py
+"""
+Measures the overhead of instrumentation on ContactService operations over
+an in-memory book: without metrics, and with a MetricsRegistry attached to
+the service and an instrumented repository.
+
+Usage:
+    python benchmarks/bench_metrics.py [--operations 50000]
+"""
+import argparse
+import time
+
+from contact_book_app.domain.metrics import MetricsRegistry
+from contact_book_app.domain.model import ContactService
+from contact_book_app.infrastructure.in_memory_repository import InMemoryContactRepository
+from contact_book_app.infrastructure.instrumented_repository import InstrumentedContactRepository
+
+
+def _run(service: ContactService, operations: int) -> float:
+    """Returns microseconds per add_contact + get_contact pair."""
+    start = time.perf_counter()
+    for i in range(operations):
+        contact = service.add_contact(f"Person {i}", f"person{i}@example.com")
+        service.get_contact(contact.contact_id)
+    return (time.perf_counter() - start) / operations * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--operations", type=int, default=50_000)
+    args = parser.parse_args()
+
+    plain = _run(ContactService(InMemoryContactRepository()), args.operations)
+    registry = MetricsRegistry()
+    instrumented = _run(ContactService(
+        InstrumentedContactRepository(InMemoryContactRepository(), registry),
+        metrics=registry), args.operations)
+    print(f"{'metrics':<10} {'us/op pair':>11}")
+    print(f"{'disabled':<10} {plain:>11.2f}")
+    print(f"{'enabled':<10} {instrumented:>11.2f}  (+{instrumented / plain - 1:.0%})")
+    latency = registry.histogram("contact_service_seconds", operation="add_contact")
+    print(f"add_contact p50 <= {latency.quantile(0.5) * 1e6:.0f} us, "
+          f"p99 <= {latency.quantile(0.99) * 1e6:.0f} us")
+
+
+if __name__ == "__main__":
+    main()
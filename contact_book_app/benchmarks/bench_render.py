@@ -0,0 +1,94 @@
+# contact_book_app/benchmarks/bench_render.py
+"""
+Measures CLIView refresh latency and bytes written per refresh over a book
+of contacts, for full repaints, patched redraws and refetched pages.
+
+Usage:
+    python benchmarks/bench_render.py [--size 10000] [--page-size 40] [--repeat 200]
+"""
+import argparse
+import shutil
+import statistics
+import subprocess
+import time
+
+from _data import make_contacts
+from contact_book_app.domain.events import ContactDeleted, ContactUpdated
+from contact_book_app.domain.model import ContactService
+from contact_book_app.domain.repository import Contact
+from contact_book_app.infrastructure.in_memory_repository import InMemoryContactRepository
+from contact_book_app.presentation.cli_view import CLIView
+from contact_book_app.presentation.terminal import Screen
+
+
+class _CountingSink:
+    """A text stream that only counts what is written to it."""
+
+    def __init__(self) -> None:
+        self.written = 0
+
+    def write(self, text: str) -> int:
+        self.written += len(text)
+        return len(text)
+
+    def flush(self) -> None:
+        pass
+
+
+def _measure(refresh, sink: _CountingSink, repeat: int):
+    """Returns the median latency in microseconds and bytes per refresh."""
+    timings = []
+    sink.written = 0
+    for i in range(repeat):
+        start = time.perf_counter()
+        refresh(i)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1e6, sink.written / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=10_000)
+    parser.add_argument("--page-size", type=int, default=40)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    repo = InMemoryContactRepository()
+    repo.add_many(make_contacts(args.size))
+    service = ContactService(repo)
+    sink = _CountingSink()
+    view = CLIView(service, page_size=args.page_size, screen=Screen(sink))
+    view.display_contacts()
+    first = service.list_page(0, 1)[0]
+    middle = args.size // 2
+
+    def full_repaint(i: int) -> None:
+        view.invalidate()
+        view.display_contacts()
+
+    def patched_row(i: int) -> None:
+        renamed = Contact(contact_id=first.contact_id, name=f"Renamed {i}", email=first.email)
+        view.update(service, [ContactUpdated(renamed, first)])
+
+    def refetched_page(i: int) -> None:
+        view.update(service, [ContactDeleted(first)])
+
+    print(f"{args.size:,} contacts, {args.page_size} rows per page")
+    print(f"{'refresh':<16} {'median us':>10} {'bytes':>8}")
+    for label, refresh in [("full repaint", full_repaint), ("patched row", patched_row),
+                           ("refetched page", refetched_page)]:
+        view.offset = 0 if label != "refetched page" else middle
+        view.display_contacts()
+        micros, size = _measure(refresh, sink, args.repeat)
+        print(f"{label:<16} {micros:>10,.1f} {size:>8,.0f}")
+
+    if shutil.which("clear"):
+        start = time.perf_counter()
+        for _ in range(20):
+            subprocess.run(["clear"], stdout=subprocess.DEVNULL, check=False)
+        micros = (time.perf_counter() - start) / 20 * 1e6
+        print(f"{'clear process':<16} {micros:>10,.1f}  (cost of the former os.system('clear') alone)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+# contact_book_app/benchmarks/bench_replication.py
+"""
+Measures read throughput of a book served by read replicas in 1..N reader
+processes, while the writer process keeps making changes, and how far
+behind the writer the replicas run.
+
+Usage:
+    python benchmarks/bench_replication.py [--size 100000] [--readers 1 2 4] [--lookups 100000]
+"""
+import argparse
+import multiprocessing
+import os
+import random
+import time
+
+from _data import make_contacts
+from contact_book_app.domain.model import ContactService
+from contact_book_app.infrastructure.in_memory_repository import InMemoryContactRepository
+from contact_book_app.infrastructure.replication import ReplicaContactRepository, ReplicationPublisher
+from contact_book_app.infrastructure.thread_safe_repository import ThreadSafeContactRepository
+
+
+def _reader(address, ids, lookups: int, ready, start, results) -> None:
+    """Runs in a reader process: follows the writer and times random get()s."""
+    replica = ReplicaContactRepository(address, timeout=60)
+    rng = random.Random(os.getpid())
+    sample = [rng.choice(ids) for _ in range(lookups)]
+    ready.put(None)
+    start.wait()
+    began = time.perf_counter()
+    for contact_id in sample:
+        replica.get(contact_id)
+    results.put((lookups, time.perf_counter() - began))
+    replica.close()
+
+
+def _run(service, publisher, ids, readers: int, lookups: int) -> float:
+    """Returns the combined get()s per second of `readers` reader processes."""
+    ready, results = multiprocessing.Queue(), multiprocessing.Queue()
+    start = multiprocessing.Event()
+    processes = [multiprocessing.Process(target=_reader,
+                                         args=(publisher.address, ids, lookups, ready, start, results))
+                 for _ in range(readers)]
+    for process in processes:
+        process.start()
+    for _ in processes:
+        ready.get()
+    start.set()
+    began = time.perf_counter()
+    i = 0
+    while any(process.is_alive() for process in processes):
+        service.add_contact(f"Writer {readers}.{i}", f"writer.{readers}.{i}@example.com")
+        i += 1
+        time.sleep(0.001)
+    total = sum(results.get()[0] for _ in processes)
+    elapsed = time.perf_counter() - began
+    for process in processes:
+        process.join()
+    return total / elapsed
+
+
+def _lag(service, publisher, writes: int) -> float:
+    """Returns the mean seconds from a write to a replica having applied it."""
+    replica = ReplicaContactRepository(publisher.address)
+    total = 0.0
+    for i in range(writes):
+        start = time.perf_counter()
+        service.add_contact(f"Lag {i}", f"lag.{i}@example.com")
+        replica.wait_for(publisher.sequence)
+        total += time.perf_counter() - start
+    replica.close()
+    return total / writes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--readers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--lookups", type=int, default=100_000)
+    args = parser.parse_args()
+
+    repo = ThreadSafeContactRepository(InMemoryContactRepository())
+    contacts = make_contacts(args.size)
+    repo.add_many(contacts)
+    service = ContactService(repo)
+    publisher = ReplicationPublisher(service)
+    ids = [contact.contact_id for contact in contacts]
+    print(f"{args.size:,} contacts, {os.cpu_count()} CPUs")
+    print(f"{'readers':<8} {'gets/s':>12}")
+    for readers in args.readers:
+        print(f"{readers:<8} {_run(service, publisher, ids, readers, args.lookups):>12,.0f}")
+    print(f"replication lag {_lag(service, publisher, 1000) * 1e6:,.0f} us per write")
+    publisher.close()
+
+
+if __name__ == "__main__":
+    main()
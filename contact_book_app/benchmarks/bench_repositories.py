@@ -0,0 +1,63 @@
+# contact_book_app/benchmarks/bench_repositories.py
+"""
+Compares the in-memory and SQLite repositories on bulk insert, point lookups
+and a full scan.
+
+Usage:
+    python benchmarks/bench_repositories.py [--sizes 10000 100000 1000000]
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+from typing import Callable, Dict
+
+from _data import make_contacts
+from contact_book_app.domain.repository import AbstractContactRepository
+from contact_book_app.infrastructure.in_memory_repository import InMemoryContactRepository
+from contact_book_app.infrastructure.sqlite_repository import SqliteContactRepository
+
+LOOKUPS = 10_000
+
+
+def _timed(func: Callable[[], object]) -> float:
+    """Runs func once and returns the elapsed wall time in seconds."""
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def bench(repo: AbstractContactRepository, size: int) -> Dict[str, float]:
+    """Runs every scenario against an empty repository and returns timings."""
+    contacts = make_contacts(size)
+    sample = random.Random(0).sample(contacts, min(LOOKUPS, size))
+    results = {"add_many": _timed(lambda: repo.add_many(contacts))}
+    results["get"] = _timed(lambda: [repo.get(c.contact_id) for c in sample])
+    results["email_exists"] = _timed(lambda: [repo.email_exists(c.email) for c in sample])
+    results["full_scan"] = _timed(repo.list)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+
+    print(f"{'backend':<10} {'size':>9} {'add_many':>10} {'get':>10} {'email':>10} {'scan':>10}  (seconds)")
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            backends = {
+                "memory": InMemoryContactRepository(),
+                "sqlite": SqliteContactRepository(os.path.join(tmp, "bench.db")),
+            }
+            for name, repo in backends.items():
+                r = bench(repo, size)
+                print(f"{name:<10} {size:>9} {r['add_many']:>10.3f} {r['get']:>10.3f} "
+                      f"{r['email_exists']:>10.3f} {r['full_scan']:>10.3f}")
+                if isinstance(repo, SqliteContactRepository):
+                    repo.close()
+
+
+if __name__ == "__main__":
+    main()
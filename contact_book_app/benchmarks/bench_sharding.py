@@ -0,0 +1,70 @@
+# contact_book_app/benchmarks/bench_sharding.py
+"""
+Compares one SQLite book with the same book sharded across several SQLite
+files, in-process and with each shard in its own process.
+
+Usage:
+    python benchmarks/bench_sharding.py [--size 200000] [--shards 4] [--lookups 5000]
+"""
+import argparse
+import functools
+import os
+import random
+import tempfile
+import time
+
+from _data import make_contacts
+from contact_book_app.infrastructure.sharded_repository import ProcessShard, ShardedContactRepository
+from contact_book_app.infrastructure.sqlite_repository import SqliteContactRepository
+
+SEARCHES = 5  # Scanning searches, since SQLite has no search index
+
+
+def _bench(repo, contacts, sample):
+    timings = {}
+    start = time.perf_counter()
+    repo.add_many(contacts)
+    timings["add_many"] = time.perf_counter() - start
+    start = time.perf_counter()
+    for contact in sample:
+        repo.get(contact.contact_id)
+    timings["get"] = (time.perf_counter() - start) / len(sample)
+    start = time.perf_counter()
+    for query in ("smith", "ali", "example.org", "zz", "walker.1"):
+        repo.search(query, 10)
+    timings["search"] = (time.perf_counter() - start) / SEARCHES
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=200_000)
+    parser.add_argument("--shards", type=int, default=4)
+    parser.add_argument("--lookups", type=int, default=5_000)
+    args = parser.parse_args()
+
+    contacts = make_contacts(args.size)
+    sample = random.Random(0).sample(contacts, min(args.lookups, args.size))
+    print(f"{args.size:,} contacts, {args.shards} shards")
+    print(f"{'layout':<18} {'add_many s':>11} {'get us':>8} {'search s':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        def path(name):
+            return os.path.join(tmp, f"{name}.db")
+
+        layouts = {
+            "single": lambda: SqliteContactRepository(path("single")),
+            "sharded": lambda: ShardedContactRepository(
+                [SqliteContactRepository(path(f"inproc{i}")) for i in range(args.shards)]),
+            "sharded+processes": lambda: ShardedContactRepository(
+                [ProcessShard(functools.partial(SqliteContactRepository, path(f"proc{i}")))
+                 for i in range(args.shards)]),
+        }
+        for name, build in layouts.items():
+            repo = build()
+            t = _bench(repo, contacts, sample)
+            print(f"{name:<18} {t['add_many']:>11.2f} {t['get'] * 1e6:>8.1f} {t['search']:>9.3f}")
+            repo.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# contact_book_app/benchmarks/bench_snapshot.py
+"""
+Compares handing a book to another process by pickling it against mapping
+a shared snapshot file, and times lookups and pages served from each.
+
+Usage:
+    python benchmarks/bench_snapshot.py [--size 100000] [--lookups 100000]
+"""
+import argparse
+import os
+import pickle
+import random
+import tempfile
+import time
+
+from _data import make_contacts
+from contact_book_app.infrastructure.in_memory_repository import InMemoryContactRepository
+from contact_book_app.infrastructure.shared_snapshot import SharedSnapshotRepository, export_snapshot
+
+
+def _seconds(operation) -> float:
+    start = time.perf_counter()
+    operation()
+    return time.perf_counter() - start
+
+
+def _per_op(operation, items) -> float:
+    start = time.perf_counter()
+    for item in items:
+        operation(item)
+    return (time.perf_counter() - start) / len(items)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--lookups", type=int, default=100_000)
+    args = parser.parse_args()
+
+    contacts = make_contacts(args.size)
+    directory = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    path = os.path.join(directory, f"bench_snapshot.{os.getpid()}.snap")
+    sample = [c.contact_id for c in random.Random(0).choices(contacts, k=args.lookups)]
+    try:
+        export = _seconds(lambda: export_snapshot(contacts, path, 1))
+        payload = pickle.dumps(contacts)
+
+        copies = InMemoryContactRepository()
+        unpickle = _seconds(lambda: copies.add_many(pickle.loads(payload)))
+        mapped = []
+        open_snapshot = _seconds(lambda: mapped.append(SharedSnapshotRepository(path, 3600)))
+        snapshot = mapped[0]
+
+        print(f"{args.size:,} contacts, snapshot {os.path.getsize(path) / 2**20:,.1f} MiB "
+              f"written in {export * 1e3:,.0f} ms, pickle {len(payload) / 2**20:,.1f} MiB")
+        print(f"{'':<24} {'in-memory copy':>16} {'snapshot':>16}")
+        print(f"{'load (ms)':<24} {unpickle * 1e3:>16,.1f} {open_snapshot * 1e3:>16,.3f}")
+        print(f"{'get (us)':<24} {_per_op(copies.get, sample) * 1e6:>16,.2f} "
+              f"{_per_op(snapshot.get, sample) * 1e6:>16,.2f}")
+        offsets = [random.Random(1).randrange(args.size) for _ in range(1000)]
+        print(f"{'page of 40 (us)':<24} {_per_op(lambda o: copies.list_page(o, 40), offsets) * 1e6:>16,.1f} "
+              f"{_per_op(lambda o: snapshot.list_page(o, 40), offsets) * 1e6:>16,.1f}")
+        snapshot.close()
+    finally:
+        if os.path.exists(path):
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
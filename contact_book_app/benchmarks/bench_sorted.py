@@ -0,0 +1,62 @@
+# contact_book_app/benchmarks/bench_sorted.py
+"""
+Compares reading the first page of contacts sorted by name by sorting the
+whole book against reading it from the service's sorted views, and
+measures what keeping the views up to date adds to each write.
+
+Usage:
+    python benchmarks/bench_sorted.py [--size 100000] [--page 40] [--operations 2000]
+"""
+import argparse
+import time
+
+from _data import make_contacts
+from contact_book_app.domain.model import ContactService
+from contact_book_app.domain.repository import Contact
+from contact_book_app.infrastructure.in_memory_repository import InMemoryContactRepository
+
+
+def _new_service(contacts) -> ContactService:
+    repo = InMemoryContactRepository()
+    repo.add_many(Contact(c.contact_id, c.name, c.email) for c in contacts)
+    return ContactService(repo)
+
+
+def _per_op(operation, count: int) -> float:
+    start = time.perf_counter()
+    for i in range(count):
+        operation(i)
+    return (time.perf_counter() - start) / count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--page", type=int, default=40)
+    parser.add_argument("--operations", type=int, default=2000)
+    args = parser.parse_args()
+
+    contacts = make_contacts(args.size)
+    service = _new_service(contacts)
+    pages = max(1, args.operations // 100)  # Full sorts are slow; time fewer of them
+    sort_all = _per_op(lambda i: sorted(service.get_all_contacts(),
+                                        key=lambda c: c.name.casefold())[:args.page], pages)
+    start = time.perf_counter()
+    service.list_sorted("name", 0, args.page)
+    build = time.perf_counter() - start
+    from_views = _per_op(lambda i: service.list_sorted("name", 0, args.page), args.operations)
+    print(f"{'first page of ' + str(args.page):<28} {'us':>12}")
+    print(f"{'sort the book':<28} {sort_all * 1e6:>12,.1f}")
+    print(f"{'sorted views':<28} {from_views * 1e6:>12,.1f}")
+    print(f"views built in {build:.2f}s for {args.size:,} contacts")
+
+    plain = _new_service(contacts)
+    print(f"\n{'add_contact':<28} {'us':>12}")
+    print(f"{'without views':<28} "
+          f"{_per_op(lambda i: plain.add_contact(f'P {i}', f'p.{i}@x.com'), args.operations) * 1e6:>12,.1f}")
+    print(f"{'with views':<28} "
+          f"{_per_op(lambda i: service.add_contact(f'P {i}', f'p.{i}@x.com'), args.operations) * 1e6:>12,.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,301 @@
+# contact_book_app/benchmarks/suite.py
+"""
+Runs the regression benchmark suite over synthetic books of several sizes
+and optionally compares the results with a saved baseline.
+
+Each benchmark times one operation against a book already holding `size`
+contacts and reports the time per operation of the fastest of several
+rounds, which, as with timeit, is the figure least disturbed by noise.
+Memory is measured separately with tracemalloc, since tracing slows every
+allocation down: the bytes retained per stored contact, and the peak
+allocated while building the book. Startup is timed in fresh interpreters:
+the import of the entry point, and the time from launching the interactive
+app on a SQLite book of each size to its first prompt.
+
+Save a baseline, then compare a later run against it; the comparison exits
+with status 1 if any benchmark got slower (or any memory figure larger) by
+more than the threshold. Each timed round is preceded by a fixed
+calibration workload, and a timing must be worse both in seconds and as
+a ratio to its calibration to count, which keeps a machine that happens
+to run slower from failing the comparison.
+
+Usage:
+    python benchmarks/suite.py [--sizes 1000 10000 100000] [--rounds 5] [--save baseline.json]
+    python benchmarks/suite.py --compare baseline.json [--threshold 0.25]
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import uuid
+from typing import Callable, Dict, List, Optional, Tuple
+
+import contact_book_app
+from _data import make_contacts
+from contact_book_app.domain.events import ContactAdded
+from contact_book_app.domain.model import ContactService
+from contact_book_app.domain.observer import Observable, Observer
+from contact_book_app.domain.repository import Contact
+from contact_book_app.infrastructure.in_memory_repository import InMemoryContactRepository
+from contact_book_app.infrastructure.sqlite_repository import SqliteContactRepository
+from contact_book_app.presentation.cli_view import CLIView
+from contact_book_app.presentation.terminal import Screen
+
+OPERATIONS = 500  # Operations timed per round
+FAN_OUT = 100  # Observers notified by the notify benchmark
+
+# A benchmark gets a fresh service holding `size` contacts and returns the
+# operation to time, called with the index of each operation in the round.
+Setup = Callable[[ContactService, List[Contact]], Callable[[int], object]]
+
+
+class _Sink:
+    """A text stream that discards what is written to it."""
+
+    def write(self, text: str) -> int:
+        return len(text)
+
+    def flush(self) -> None:
+        pass
+
+
+class _NullObserver(Observer):
+    def update(self, subject, events=()) -> None:
+        pass
+
+
+def _add_contact(service: ContactService, book: List[Contact]) -> Callable[[int], object]:
+    suffix = uuid.uuid4().hex[:8]
+    return lambda i: service.add_contact(f"New Person {i}", f"new.{suffix}.{i}@example.com")
+
+
+def _update_contact(service: ContactService, book: List[Contact]) -> Callable[[int], object]:
+    return lambda i: service.update_contact(
+        book[i % len(book)].contact_id, f"Renamed {i}", book[i % len(book)].email)
+
+
+def _delete_contact(service: ContactService, book: List[Contact]) -> Callable[[int], object]:
+    return lambda i: service.delete_contact(book[i % len(book)].contact_id)
+
+
+def _get_all_contacts(service: ContactService, book: List[Contact]) -> Callable[[int], object]:
+    return lambda i: service.get_all_contacts()
+
+
+def _notify_fan_out(service: ContactService, book: List[Contact]) -> Callable[[int], object]:
+    observable = Observable()
+    for _ in range(FAN_OUT):
+        observable.attach(_NullObserver())
+    events = [ContactAdded(book[0])]
+    return lambda i: observable.notify(service, events)
+
+
+def _display_contacts(service: ContactService, book: List[Contact]) -> Callable[[int], object]:
+    view = CLIView(service, page_size=40, screen=Screen(_Sink()))
+    view.offset = len(book) // 2  # A page in the middle of the book
+
+    def display(i: int) -> None:
+        view.invalidate()
+        view.display_contacts()
+    return display
+
+
+BENCHMARKS: Dict[str, Setup] = {
+    "add_contact": _add_contact,
+    "update_contact": _update_contact,
+    "delete_contact": _delete_contact,
+    "get_all_contacts": _get_all_contacts,
+    "notify_fan_out": _notify_fan_out,
+    "display_contacts": _display_contacts,
+}
+
+
+def _new_service(book: List[Contact]) -> ContactService:
+    repo = InMemoryContactRepository()
+    repo.add_many(Contact(c.contact_id, c.name, c.email) for c in book)
+    return ContactService(repo)
+
+
+def _calibration_round() -> float:
+    """
+    Times a fixed pure-Python workload (dict and list churn), used as the
+    yardstick for how fast the machine is running at that moment.
+    """
+    start = time.perf_counter()
+    table: Dict[int, List[int]] = {}
+    for i in range(50_000):
+        table.setdefault(i % 1000, []).append(i)
+    return time.perf_counter() - start
+
+
+def time_benchmark(setup: Setup, book: List[Contact], rounds: int) -> Tuple[float, float]:
+    """
+    Returns the best seconds per operation over `rounds` fresh books, and
+    the best ratio of a round's time per operation to a calibration round
+    run just before it.
+    """
+    operations = min(OPERATIONS, len(book))
+    per_op, relative = [], []
+    for _ in range(rounds):
+        operation = setup(_new_service(book), book)
+        gc.collect()
+        gc.disable()
+        try:
+            calibration = _calibration_round()
+            start = time.perf_counter()
+            for i in range(operations):
+                operation(i)
+            seconds = (time.perf_counter() - start) / operations
+        finally:
+            gc.enable()
+        per_op.append(seconds)
+        relative.append(seconds / calibration)
+    return min(per_op), min(relative)
+
+
+def measure_memory(book: List[Contact]) -> Tuple[float, float]:
+    """Returns (bytes retained per contact, peak bytes) for storing the book."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        service = _new_service(book)
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del service
+    return (retained - before) / len(book), float(peak - before)
+
+
+def _python(*args: str, **kwargs) -> subprocess.Popen:
+    """Starts a fresh interpreter that can import the package under test."""
+    src = os.path.dirname(os.path.dirname(contact_book_app.__file__))
+    return subprocess.Popen([sys.executable, *args], env=dict(os.environ, PYTHONPATH=src),
+                            **kwargs)
+
+
+def measure_import(rounds: int) -> float:
+    """Returns the best seconds taken to import the entry point in a fresh interpreter."""
+    code = ("import time; start = time.perf_counter(); import contact_book_app.main; "
+            "print(time.perf_counter() - start)")
+    times = []
+    for _ in range(rounds):
+        process = _python("-c", code, stdout=subprocess.PIPE)
+        times.append(float(process.communicate()[0]))
+    return min(times)
+
+
+def measure_first_prompt(book: List[Contact], rounds: int) -> float:
+    """
+    Returns the best seconds from launching the interactive app on a SQLite
+    file holding the book to its first "Enter command:" prompt.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "book.db")
+        database = SqliteContactRepository(path)
+        database.add_many(book)
+        database.close()
+        times = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            process = _python("-m", "contact_book_app.main", "--db", path,
+                              stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+            output = b""
+            while b"Enter command:" not in output:
+                chunk = os.read(process.stdout.fileno(), 65536)
+                if not chunk:
+                    raise RuntimeError("The app exited before prompting.")
+                output += chunk
+            times.append(time.perf_counter() - start)
+            process.communicate(b"exit\n")
+    return min(times)
+
+
+def run(sizes: List[int], rounds: int,
+        only: Optional[List[str]] = None) -> Tuple[Dict[str, float], Dict[str, float]]:
+    """
+    Runs the suite and returns two maps keyed by "name[size]": the timings
+    in seconds and memory in bytes, and the timings relative to calibration.
+    """
+    results: Dict[str, float] = {}
+    relative: Dict[str, float] = {}
+    results["startup_import"] = measure_import(rounds)
+    print(f"{'startup_import':<28} {results['startup_import'] * 1e3:>12,.1f} ms", flush=True)
+    for size in sizes:
+        book = make_contacts(size)
+        for name, setup in BENCHMARKS.items():
+            if only and name not in only:
+                continue
+            key = f"{name}[{size}]"
+            results[key], relative[key] = time_benchmark(setup, book, rounds)
+            print(f"{key:<28} {results[key] * 1e6:>12,.2f} us/op", flush=True)
+        per_contact, peak = measure_memory(book)
+        results[f"memory_per_contact[{size}]"] = per_contact
+        results[f"memory_peak[{size}]"] = peak
+        print(f"{f'memory_per_contact[{size}]':<28} {per_contact:>12,.0f} bytes")
+        print(f"{f'memory_peak[{size}]':<28} {peak / 1e6:>12,.1f} MB", flush=True)
+        key = f"startup_first_prompt[{size}]"
+        results[key] = measure_first_prompt(book, rounds)
+        print(f"{key:<28} {results[key] * 1e3:>12,.1f} ms", flush=True)
+    return results, relative
+
+
+def compare(baseline: Dict[str, Dict[str, float]], results: Dict[str, float],
+            relative: Dict[str, float], threshold: float) -> List[str]:
+    """
+    Returns a description of every result worse than baseline * (1 + threshold).
+    A timing only counts as a regression if it is worse both in seconds and
+    relative to its calibration rounds: a real slowdown shows up in both,
+    while the machine running slower (or the calibration itself being
+    disturbed) only shows up in one of them.
+    """
+    limit = 1 + threshold
+    regressions = []
+    for key, value in sorted(results.items()):
+        before = baseline["results"].get(key)
+        if not before or value <= before * limit:
+            continue
+        if key in relative:
+            before_relative = baseline["relative"].get(key)
+            if before_relative and relative[key] <= before_relative * limit:
+                continue
+        regressions.append(f"{key}: {before:.6g} -> {value:.6g} (+{value / before - 1:.0%})")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS),
+                        help="run only these benchmarks")
+    parser.add_argument("--save", metavar="PATH", help="write the results to a JSON file")
+    parser.add_argument("--compare", metavar="PATH", help="compare with a saved JSON baseline")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed slowdown before a result counts as a regression")
+    args = parser.parse_args()
+
+    results, relative = run(args.sizes, args.rounds, args.only)
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump({"python": platform.python_version(), "machine": platform.machine(),
+                       "results": results, "relative": relative}, f, indent=2, sort_keys=True)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(baseline, results, relative, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+            for line in regressions:
+                print("  " + line)
+            sys.exit(1)
+        print(f"\nNo regressions beyond {args.threshold:.0%}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+# contact_book_app/src/domain/async_model.py
+"""This module defines the asynchronous counterpart of the ContactService."""
+
+import asyncio
+import uuid
+from dataclasses import replace
+from typing import AsyncIterator, List, Optional
+
+from .async_repository import AsyncAbstractContactRepository
+from .events import ContactAdded, ContactDeleted, ContactUpdated
+from .observer import AsyncObservable, AsyncObserver
+from .repository import Contact
+
+_EMAIL_LOCK_STRIPES = 64
+
+
+class AsyncContactService:
+    """
+    The service layer for asyncio applications, applying the same business
+    rules as ContactService over an AsyncAbstractContactRepository.
+
+    Many requests may be in flight at once, so each email-uniqueness check
+    and the write that depends on it hold an asyncio lock striped by email.
+    """
+
+    def __init__(self, repo: AsyncAbstractContactRepository):
+        self.repo = repo
+        self._observable = AsyncObservable()
+        # Created on first use so that they belong to the running event loop.
+        self._email_locks: Optional[List[asyncio.Lock]] = None
+
+    def attach(self, observer: AsyncObserver) -> None:
+        """Attach an observer to the service."""
+        self._observable.attach(observer)
+
+    def detach(self, observer: AsyncObserver) -> None:
+        """Detach an observer from the service."""
+        self._observable.detach(observer)
+
+    def _lock_for(self, email: Optional[str]) -> asyncio.Lock:
+        """Returns the lock guarding an email; a private lock if there is none."""
+        if not email:
+            return asyncio.Lock()
+        if self._email_locks is None:
+            self._email_locks = [asyncio.Lock() for _ in range(_EMAIL_LOCK_STRIPES)]
+        return self._email_locks[hash(email) % _EMAIL_LOCK_STRIPES]
+
+    async def add_contact(self, name: str, email: Optional[str] = None) -> Contact:
+        """Creates and adds a new contact, enforcing a unique email."""
+        if not name:
+            raise ValueError("Name cannot be empty.")
+
+        new_contact = Contact(contact_id=uuid.uuid4(), name=name, email=email)
+        async with self._lock_for(email):
+            if email and await self.repo.email_exists(email):
+                raise ValueError("Email already exists.")
+            await self.repo.add(new_contact)
+        await self._observable.notify(self, [ContactAdded(new_contact)])
+        return new_contact
+
+    async def get_all_contacts(self) -> List[Contact]:
+        """Returns all contacts."""
+        return await self.repo.list()
+
+    def iter_contacts(self) -> AsyncIterator[Contact]:
+        """Streams all contacts a page at a time."""
+        return self.repo.iter_contacts()
+
+    async def list_page(self, offset: int, limit: int) -> List[Contact]:
+        """Returns at most `limit` contacts starting at position `offset`."""
+        return await self.repo.list_page(offset, limit)
+
+    async def search(self, query: str, limit: int = 10) -> List[Contact]:
+        """Returns at most `limit` contacts matching `query`, ordered by name."""
+        return await self.repo.search(query, limit)
+
+    async def delete_contact(self, contact_id: uuid.UUID) -> None:
+        """
+        Deletes a contact by their ID.
+        Observers are only notified if the contact existed.
+        """
+        contact_to_delete = await self.repo.get(contact_id)
+        if contact_to_delete is None:
+            return
+        await self.repo.delete(contact_id)
+        await self._observable.notify(self, [ContactDeleted(contact_to_delete)])
+
+    async def update_contact(self, contact_id: uuid.UUID, name: str, email: Optional[str]) -> Contact:
+        """Updates an existing contact's details, enforcing a unique email."""
+        contact_to_update = await self.repo.get(contact_id)
+        if not contact_to_update:
+            raise ValueError("Contact not found.")
+
+        if not name:
+            raise ValueError("Name cannot be empty.")
+
+        async with self._lock_for(email):
+            if email and email != contact_to_update.email:
+                owner = await self.repo.find_by_email(email)
+                if owner is not None and owner.contact_id != contact_id:
+                    raise ValueError("Email already exists.")
+
+            previous = replace(contact_to_update)
+            contact_to_update.name = name
+            contact_to_update.email = email
+            await self.repo.update(contact_to_update)
+        await self._observable.notify(self, [ContactUpdated(contact_to_update, previous)])
+        return contact_to_update
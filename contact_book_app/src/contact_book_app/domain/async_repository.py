@@ -0,0 +1,84 @@
+# contact_book_app/src/domain/async_repository.py
+"""
+This module defines the asynchronous counterpart of the repository
+interface, for data sources that should not block an asyncio event loop.
+"""
+import uuid
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, Iterable, List, Optional
+
+from .repository import Contact
+
+
+class AsyncAbstractContactRepository(ABC):
+    """Abstract base class defining the asynchronous repository interface."""
+
+    @abstractmethod
+    async def add(self, contact: Contact) -> None:
+        """Adds a new contact to the repository."""
+        raise NotImplementedError
+
+    async def add_many(self, contacts: Iterable[Contact]) -> None:
+        """
+        Adds several contacts in one call.
+
+        The default implementation simply awaits add() for each contact;
+        concrete repositories may override it with a batched write.
+        """
+        for contact in contacts:
+            await self.add(contact)
+
+    @abstractmethod
+    async def get(self, contact_id: uuid.UUID) -> Optional[Contact]:
+        """Retrieves a contact by its unique ID."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_by_email(self, email: str) -> Optional[Contact]:
+        """Retrieves the contact that owns the given email address, if any."""
+        raise NotImplementedError
+
+    async def email_exists(self, email: str) -> bool:
+        """Returns True if a contact with the given email address exists."""
+        return await self.find_by_email(email) is not None
+
+    @abstractmethod
+    async def list(self) -> List[Contact]:
+        """Lists all contacts in the repository."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_page(self, offset: int, limit: int) -> List[Contact]:
+        """Returns at most `limit` contacts, skipping the first `offset`."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_after(self, cursor: Optional[uuid.UUID], limit: int) -> List[Contact]:
+        """Returns at most `limit` contacts following the contact `cursor`."""
+        raise NotImplementedError
+
+    async def iter_contacts(self, page_size: int = 1000) -> AsyncIterator[Contact]:
+        """Yields every contact in listing order, fetching a page at a time."""
+        cursor = None
+        while True:
+            page = await self.list_after(cursor, page_size)
+            for contact in page:
+                yield contact
+            if len(page) < page_size:
+                return
+            cursor = page[-1].contact_id
+
+    @abstractmethod
+    async def search(self, query: str, limit: int) -> List[Contact]:
+        """Returns at most `limit` contacts matching `query`, ordered by name."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete(self, contact_id: uuid.UUID) -> None:
+        """Deletes a contact by its unique ID."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def update(self, contact: Contact) -> None:
+        """Updates an existing contact."""
+        raise NotImplementedError
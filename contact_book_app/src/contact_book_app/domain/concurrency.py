@@ -0,0 +1,80 @@
+# contact_book_app/src/domain/concurrency.py
+"""
+This module contains the locks used to run the contact book safely with
+several threads: a reader/writer lock for repositories and a striped lock
+for making the service's check-then-write sequences atomic.
+"""
+import threading
+from contextlib import contextmanager
+from typing import Iterable, Iterator, List
+
+
+class ReadWriteLock:
+    """
+    A lock that lets any number of readers in at once, or a single writer.
+
+    Waiting writers are preferred over new readers so that a steady stream
+    of reads cannot starve writes. The lock is not re-entrant: a thread
+    holding it must not acquire it again.
+    """
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition()
+        self._readers = 0
+        self._writing = False
+        self._waiting_writers = 0
+
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        """Holds the lock shared for the duration of the block."""
+        with self._condition:
+            self._condition.wait_for(lambda: not self._writing and not self._waiting_writers)
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._readers -= 1
+                if not self._readers:
+                    self._condition.notify_all()
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        """Holds the lock exclusively for the duration of the block."""
+        with self._condition:
+            self._waiting_writers += 1
+            self._condition.wait_for(lambda: not self._writing and not self._readers)
+            self._waiting_writers -= 1
+            self._writing = True
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._writing = False
+                self._condition.notify_all()
+
+
+class StripedLock:
+    """
+    A fixed set of locks selected by hashing a key, so that operations on
+    different keys rarely contend while operations on the same key are
+    serialized. Several keys are locked in stripe order to avoid deadlocks.
+    """
+
+    def __init__(self, stripes: int = 64) -> None:
+        self._locks = [threading.Lock() for _ in range(stripes)]
+
+    @contextmanager
+    def hold(self, keys: Iterable[str]) -> Iterator[None]:
+        """Holds the stripes of every key for the duration of the block."""
+        stripes = sorted({hash(key) % len(self._locks) for key in keys})
+        acquired: List[threading.Lock] = []
+        try:
+            for stripe in stripes:
+                lock = self._locks[stripe]
+                lock.acquire()
+                acquired.append(lock)
+            yield
+        finally:
+            for lock in reversed(acquired):
+                lock.release()
@@ -0,0 +1,179 @@
+# contact_book_app/src/domain/duplicates.py
+"""
+This module finds contacts that are probably the same person.
+
+Comparing every pair of contacts is quadratic, so detection runs in two
+stages. Blocking first groups contacts by cheap keys (a normalized email and
+a phonetic key of the name) and only contacts sharing a block become
+candidate pairs. Each candidate pair is then scored with Jaro-Winkler
+string similarity, optionally across a pool of worker processes.
+"""
+import os
+from dataclasses import dataclass
+from itertools import combinations
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from . import search
+from .repository import Contact
+
+# Mail providers that ignore dots in the local part of an address.
+_DOTLESS_DOMAINS = {"gmail.com": "gmail.com", "googlemail.com": "gmail.com"}
+
+_SOUNDEX_CODES = {
+    **dict.fromkeys("bfpv", "1"), **dict.fromkeys("cgjkqsxz", "2"),
+    **dict.fromkeys("dt", "3"), "l": "4", **dict.fromkeys("mn", "5"), "r": "6",
+}
+
+# (name, normalized email) as compared by the scoring stage.
+_Fields = Tuple[str, str]
+
+
+@dataclass
+class DuplicateSuggestion:
+    """A pair of contacts that look like duplicates, with a score in [0, 1]."""
+    first: Contact
+    second: Contact
+    score: float
+
+
+def normalize_email(email: Optional[str]) -> str:
+    """
+    Reduces an email to the mailbox it is delivered to: case-folded, with
+    any "+tag" removed and, for providers that ignore them, dots dropped.
+    """
+    folded = search.fold_email(email)
+    local, at, domain = folded.partition("@")
+    if not at:
+        return folded
+    local = local.split("+", 1)[0]
+    if domain in _DOTLESS_DOMAINS:
+        local, domain = local.replace(".", ""), _DOTLESS_DOMAINS[domain]
+    return f"{local}@{domain}"
+
+
+def soundex(word: str) -> str:
+    """Returns the American Soundex code of a word, e.g. "Robert" -> "R163"."""
+    letters = [c for c in word.casefold() if "a" <= c <= "z"]
+    if not letters:
+        return ""
+    code = letters[0].upper()
+    previous = _SOUNDEX_CODES.get(letters[0], "")
+    for c in letters[1:]:
+        digit = _SOUNDEX_CODES.get(c, "")
+        if digit and digit != previous:
+            code += digit
+            if len(code) == 4:
+                break
+        if c not in "hw":
+            previous = digit
+    return code.ljust(4, "0")
+
+
+def jaro_winkler(a: str, b: str) -> float:
+    """Returns the Jaro-Winkler similarity of two strings, from 0 to 1."""
+    if a == b:
+        return 1.0
+    if not a or not b:
+        return 0.0
+    window = max(len(a), len(b)) // 2 - 1
+    b_used = [False] * len(b)
+    a_matches = []
+    for i, c in enumerate(a):
+        for j in range(max(0, i - window), min(len(b), i + window + 1)):
+            if not b_used[j] and b[j] == c:
+                b_used[j] = True
+                a_matches.append(c)
+                break
+    if not a_matches:
+        return 0.0
+    b_matches = [c for c, used in zip(b, b_used) if used]
+    transpositions = sum(x != y for x, y in zip(a_matches, b_matches)) / 2
+    m = len(a_matches)
+    jaro = (m / len(a) + m / len(b) + (m - transpositions) / m) / 3
+    prefix = 0
+    for x, y in zip(a[:4], b[:4]):
+        if x != y:
+            break
+        prefix += 1
+    return jaro + prefix * 0.1 * (1 - jaro)
+
+
+def blocking_keys(name: str, email: str) -> Set[str]:
+    """Returns the blocks a contact with a normalized name and email falls into."""
+    keys = set()
+    if email:
+        keys.add("e:" + email)
+    parts = search.words(name)
+    if parts:
+        keys.add("n:" + soundex(parts[0]) + soundex(parts[-1]))
+    return keys
+
+
+def score_pair(a: _Fields, b: _Fields) -> float:
+    """
+    Scores how likely two contacts are the same person. Matching normalized
+    emails are conclusive; otherwise names dominate and the local parts of
+    the emails, when both have one, refine the score.
+    """
+    (name_a, email_a), (name_b, email_b) = a, b
+    if email_a and email_a == email_b:
+        return 1.0
+    name_score = jaro_winkler(name_a, name_b)
+    if not (email_a and email_b):
+        return name_score
+    local_score = jaro_winkler(email_a.partition("@")[0], email_b.partition("@")[0])
+    return 0.8 * name_score + 0.2 * local_score
+
+
+def _score_chunk(chunk: Sequence[Tuple[int, int, _Fields, _Fields]],
+                 threshold: float) -> List[Tuple[int, int, float]]:
+    """Scores a chunk of candidate pairs; runs inside worker processes."""
+    scored = []
+    for i, j, a, b in chunk:
+        score = score_pair(a, b)
+        if score >= threshold:
+            scored.append((i, j, score))
+    return scored
+
+
+def find_duplicates(contacts: Iterable[Contact], threshold: float = 0.9,
+                    max_block_size: int = 1000, workers: Optional[int] = None,
+                    parallel_threshold: int = 50_000) -> List[DuplicateSuggestion]:
+    """
+    Returns likely duplicate pairs scoring at least `threshold`, best first.
+
+    Blocks larger than `max_block_size` are skipped, since a key shared by
+    that many contacts (e.g. a very common name) says little about any one
+    pair. Scoring is spread over `workers` processes (default: CPU count)
+    once there are at least `parallel_threshold` candidate pairs.
+    """
+    book: List[Contact] = []
+    fields: List[_Fields] = []
+    blocks: Dict[str, List[int]] = {}
+    for index, contact in enumerate(contacts):
+        name, email = search.normalize(contact.name), normalize_email(contact.email)
+        book.append(contact)
+        fields.append((name, email))
+        for key in blocking_keys(name, email):
+            blocks.setdefault(key, []).append(index)
+
+    pairs: Set[Tuple[int, int]] = set()
+    for members in blocks.values():
+        if 1 < len(members) <= max_block_size:
+            pairs.update(combinations(members, 2))
+    candidates = [(i, j, fields[i], fields[j]) for i, j in sorted(pairs)]
+
+    workers = workers or os.cpu_count() or 1
+    if workers > 1 and len(candidates) >= parallel_threshold:
+        size = -(-len(candidates) // (workers * 4))
+        chunks = [candidates[k:k + size] for k in range(0, len(candidates), size)]
+        from concurrent.futures import ProcessPoolExecutor  # Pulls in multiprocessing
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = pool.map(_score_chunk, chunks, [threshold] * len(chunks))
+            scored = [hit for chunk in results for hit in chunk]
+    else:
+        scored = _score_chunk(candidates, threshold)
+
+    scored.sort(key=lambda hit: (-hit[2], hit[0], hit[1]))
+    return [DuplicateSuggestion(first=book[i], second=book[j], score=score)
+            for i, j, score in scored]
@@ -0,0 +1,31 @@
+# contact_book_app/src/domain/events.py
+"""
+This module defines the change events that the ContactService sends to its
+observers, so that an observer can react to exactly what changed instead
+of re-reading the whole book.
+"""
+from dataclasses import dataclass
+
+from .repository import Contact
+
+
+@dataclass(frozen=True)
+class ChangeEvent:
+    """Base class for all change events; `contact` is the affected contact."""
+    contact: Contact
+
+
+@dataclass(frozen=True)
+class ContactAdded(ChangeEvent):
+    """A contact was added to the book."""
+
+
+@dataclass(frozen=True)
+class ContactUpdated(ChangeEvent):
+    """A contact was changed; `previous` holds its values before the change."""
+    previous: Contact
+
+
+@dataclass(frozen=True)
+class ContactDeleted(ChangeEvent):
+    """A contact was removed from the book; `contact` is its last state."""
@@ -0,0 +1,39 @@
+# contact_book_app/src/domain/handles.py
+"""
+This module defines contact handles: short, stable references to a contact
+made of the leading hex digits of its ID, like an abbreviated commit hash.
+
+Unlike a position in the listing, a handle keeps referring to the same
+contact however the book changes. Handles are shown with HANDLE_LENGTH
+digits; any prefix of at least MIN_HANDLE_LENGTH digits is accepted, and
+a longer prefix disambiguates the rare case where two IDs share one.
+"""
+import string
+import uuid
+from typing import Tuple
+
+HANDLE_LENGTH = 8
+MIN_HANDLE_LENGTH = 4
+
+_HEX_DIGITS = set(string.hexdigits)
+
+
+def handle_of(contact_id: uuid.UUID) -> str:
+    """Returns the handle shown for a contact ID."""
+    return contact_id.hex[:HANDLE_LENGTH]
+
+
+def normalize_handle(handle: str) -> str:
+    """
+    Turns user input into a lowercase hex ID prefix, accepting the dashes
+    of a full UUID. Raises ValueError if it cannot be a handle.
+    """
+    prefix = handle.strip().replace("-", "").lower()
+    if not MIN_HANDLE_LENGTH <= len(prefix) <= 32 or not _HEX_DIGITS.issuperset(prefix):
+        raise ValueError("Invalid contact handle.")
+    return prefix
+
+
+def id_range(prefix: str) -> Tuple[uuid.UUID, uuid.UUID]:
+    """Returns the lowest and highest IDs starting with a hex prefix."""
+    return uuid.UUID(hex=prefix.ljust(32, "0")), uuid.UUID(hex=prefix.ljust(32, "f"))
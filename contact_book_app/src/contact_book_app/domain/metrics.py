@@ -0,0 +1,167 @@
+# contact_book_app/src/domain/metrics.py
+"""
+This module defines how the application reports measurements about itself.
+
+Instrumented components (ContactService, Observable and the instrumented
+repository decorator) take an optional MetricsSink and report latencies
+and counters to it, each identified by a metric name and string labels.
+When no sink is given they skip measuring altogether, so instrumentation
+costs nothing unless it is switched on.
+
+MetricsRegistry is the in-process sink: it aggregates latencies into
+histograms and can dump everything in the Prometheus text format.
+"""
+import sys
+import threading
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Dict, IO, Iterator, List, Optional, Sequence, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import cProfile
+
+# Upper bounds, in seconds, of the latency histogram buckets.
+DEFAULT_BUCKETS = (0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005,
+                   0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+class MetricsSink:
+    """
+    The interface through which components report measurements.
+    This base class discards them; subclass it to send them elsewhere.
+    """
+
+    def count(self, name: str, amount: int = 1, **labels: str) -> None:
+        """Adds `amount` to a counter."""
+
+    def observe(self, name: str, seconds: float, **labels: str) -> None:
+        """Records one latency measurement."""
+
+
+class Histogram:
+    """Counts observations into cumulative buckets, Prometheus-style."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # The last one is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimates a quantile as the upper bound of the bucket holding it
+        (the largest finite bound if it falls in the +Inf bucket).
+        """
+        if not self.count:
+            return 0.0
+        rank, seen = q * self.count, 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return self.buckets[-1]
+
+
+def _labels(labels: Dict[str, str]) -> Labels:
+    return tuple(sorted(labels.items()))
+
+
+def _format_labels(labels: Labels, extra: str = "") -> str:
+    parts = [f'{key}="{_escape(value)}"' for key, value in labels]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class MetricsRegistry(MetricsSink):
+    """
+    A thread-safe in-process sink keeping a counter or a histogram per
+    metric name and label set.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self._buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[Labels, int]] = {}
+        self._histograms: Dict[str, Dict[Labels, Histogram]] = {}
+
+    def count(self, name: str, amount: int = 1, **labels: str) -> None:
+        key = _labels(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + amount
+
+    def observe(self, name: str, seconds: float, **labels: str) -> None:
+        key = _labels(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = Histogram(self._buckets)
+            histogram.observe(seconds)
+
+    def counter(self, name: str, **labels: str) -> int:
+        """Returns the current value of a counter (0 if never counted)."""
+        with self._lock:
+            return self._counters.get(name, {}).get(_labels(labels), 0)
+
+    def histogram(self, name: str, **labels: str) -> Optional[Histogram]:
+        """Returns the histogram of a latency metric, if anything was observed."""
+        with self._lock:
+            return self._histograms.get(name, {}).get(_labels(labels))
+
+    def to_prometheus(self) -> str:
+        """Renders every metric in the Prometheus text exposition format."""
+        lines: List[str] = []
+        with self._lock:
+            for name in sorted(self._counters):
+                lines.append(f"# TYPE {name} counter")
+                for labels, value in sorted(self._counters[name].items()):
+                    lines.append(f"{name}{_format_labels(labels)} {value}")
+            for name in sorted(self._histograms):
+                lines.append(f"# TYPE {name} histogram")
+                for labels, histogram in sorted(self._histograms[name].items()):
+                    cumulative = 0
+                    bounds = [repr(b) for b in histogram.buckets] + ["+Inf"]
+                    for bound, count in zip(bounds, histogram.counts):
+                        cumulative += count
+                        le = _format_labels(labels, f'le="{bound}"')
+                        lines.append(f"{name}_bucket{le} {cumulative}")
+                    lines.append(f"{name}_sum{_format_labels(labels)} {histogram.sum!r}")
+                    lines.append(f"{name}_count{_format_labels(labels)} {histogram.count}")
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+@contextmanager
+def profiled(path: Optional[str] = None, stream: Optional[IO[str]] = None,
+             limit: int = 25) -> Iterator['cProfile.Profile']:
+    """
+    Runs the block under cProfile. The statistics are saved to `path` for
+    pstats or snakeviz if given, otherwise the `limit` functions with the
+    highest cumulative time are printed to `stream` (default: stderr).
+    """
+    # Imported here rather than at the top, as pstats is slow to import.
+    import cProfile
+    import pstats
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        if path is not None:
+            profiler.dump_stats(path)
+        else:
+            stats = pstats.Stats(profiler, stream=stream or sys.stderr)
+            stats.sort_stats("cumulative").print_stats(limit)
@@ -1,11 +1,64 @@
 # contact_book_app/src/domain/model.py
 """This module defines the core business logic (domain model)."""
 
+import functools
+import threading
+import time
 import uuid
-from typing import List, Optional
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field, replace
+from typing import (Any, Callable, ContextManager, Iterable, Iterator, List, Optional, Sequence,
+                    Set, Tuple)
 
+from .concurrency import StripedLock
+from .duplicates import DuplicateSuggestion, find_duplicates
+from .events import ChangeEvent, ContactAdded, ContactDeleted, ContactUpdated
+from .handles import normalize_handle
+from .metrics import MetricsSink
 from .repository import AbstractContactRepository, Contact
 from .observer import Observable, Observer
+from .sorted_views import SortedViews
+from .transaction import Transaction
+
+
+@dataclass
+class BulkAddError:
+    """Describes a single row rejected by ContactService.add_contacts_bulk."""
+    row: int
+    name: str
+    email: Optional[str]
+    message: str
+
+
+@dataclass
+class BulkAddResult:
+    """The outcome of a bulk add: the contacts created and the rejected rows."""
+    added: List[Contact] = field(default_factory=list)
+    errors: List[BulkAddError] = field(default_factory=list)
+
+
+# Service methods timed when a metrics sink is given.
+_TIMED_OPERATIONS = (
+    "add_contact", "add_contacts_bulk", "get_contact", "find_by_email", "find_by_handle",
+    "get_all_contacts", "list_page", "list_after", "list_sorted", "search", "find_duplicates",
+    "delete_contact", "update_contact",
+)
+
+
+def _timed(method: Callable[..., Any], metrics: MetricsSink, operation: str) -> Callable[..., Any]:
+    """Wraps a bound method to observe its latency and count validation failures."""
+    @functools.wraps(method)
+    def timed(*args: Any, **kwargs: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        except ValueError:
+            metrics.count("contact_validation_failures_total", operation=operation)
+            raise
+        finally:
+            metrics.observe("contact_service_seconds", time.perf_counter() - start,
+                            operation=operation)
+    return timed
 
 
 class ContactService:
@@ -13,11 +66,105 @@ class ContactService:
     The service layer containing the core application logic.
     This class uses the Observable pattern to notify interested parties
     (like the UI) of changes.
+
+    With thread_safe=True the service may be shared between threads: each
+    email-uniqueness check and the write that depends on it run under a lock
+    striped by email, so two threads cannot both claim the same address. The
+    repository must then be thread-safe too, e.g. a ThreadSafeContactRepository.
+
+    With a metrics sink, the latency of each operation is observed as
+    "contact_service_seconds" labelled by operation, ValueErrors are counted
+    as "contact_validation_failures_total", and the contacts written as
+    "contacts_added_total", "contacts_updated_total" and
+    "contacts_deleted_total". The default Observable then also times its
+    observers. Without a sink none of this code runs.
+
+    Inside `with service.transaction():` the add, update and delete methods
+    stage their changes instead of writing them; see transaction().
     """
 
-    def __init__(self, repo: AbstractContactRepository):
+    def __init__(self, repo: AbstractContactRepository, observable: Optional[Observable] = None,
+                 thread_safe: bool = False, metrics: Optional[MetricsSink] = None):
         self.repo = repo
-        self._observable = Observable()
+        # Pass a BackgroundObservable to keep observers off the write path.
+        self._observable = observable if observable is not None else Observable(metrics)
+        self._email_locks = StripedLock() if thread_safe else None
+        self._metrics = metrics
+        self._local = threading.local()  # Holds the calling thread's open transaction
+        self._views: Optional[SortedViews] = None  # Built by the first list_sorted()
+        self._views_lock = threading.Lock()
+        if metrics is not None:
+            # Shadow the methods on this instance only, so that a service
+            # without metrics calls them directly.
+            for operation in _TIMED_OPERATIONS:
+                setattr(self, operation, _timed(getattr(self, operation), metrics, operation))
+
+    def _count(self, name: str, amount: int = 1, **labels: str) -> None:
+        """Adds to a counter if metrics are enabled."""
+        if self._metrics is not None and amount:
+            self._metrics.count(name, amount, **labels)
+
+    def _publish(self, events: Sequence[ChangeEvent]) -> None:
+        """Brings the sorted views up to date with a change, then notifies observers."""
+        with self._views_lock:
+            if self._views is not None:
+                self._views.apply(events)
+        self._observable.notify(self, events)
+
+    def _claiming(self, emails: Iterable[str]) -> ContextManager[None]:
+        """Serializes the block with any other block claiming the same emails."""
+        if self._email_locks is None:
+            return nullcontext()
+        return self._email_locks.hold(emails)
+
+    def _transaction(self) -> Optional[Transaction]:
+        """Returns the transaction open on the calling thread, if any."""
+        return getattr(self._local, "transaction", None)
+
+    @contextmanager
+    def transaction(self) -> Iterator[Transaction]:
+        """
+        Groups changes into a unit of work committed when the block exits.
+
+        Within the block, add_contact(), add_contacts_bulk(), update_contact()
+        and delete_contact() on this thread validate against the book as it
+        will look after the changes staged so far (so an email given up
+        earlier in the block can be reused) and stage them in memory. On a
+        normal exit the net changes are written with one repository
+        apply_changes() call, which is a single SQL transaction or log
+        record for the persistent backends, and observers receive one
+        notification. If the block raises, nothing is written or notified.
+        Other service methods read the committed book. A nested
+        transaction() joins the enclosing one.
+        """
+        current = self._transaction()
+        if current is not None:
+            yield current
+            return
+        transaction = self._local.transaction = Transaction(self.repo)
+        try:
+            yield transaction
+        finally:
+            self._local.transaction = None
+        self._commit(transaction)
+
+    def _commit(self, transaction: Transaction) -> None:
+        """Writes a transaction's net changes and notifies observers once."""
+        added, updated, deleted, events = transaction.changes()
+        if not events:
+            return
+        with self._claiming(transaction.emails):
+            if self._email_locks is not None:
+                # Another thread may have taken one of the emails since it was staged.
+                for email in transaction.emails:
+                    owner = self.repo.find_by_email(email)
+                    if owner is not None and owner.contact_id not in transaction:
+                        raise ValueError("Email already exists.")
+            self.repo.apply_changes(added, updated, deleted)
+        self._count("contacts_added_total", len(added))
+        self._count("contacts_updated_total", len(updated))
+        self._count("contacts_deleted_total", len(deleted))
+        self._publish(events)
 
     def attach(self, observer: Observer) -> None:
         """Attach an observer to the service."""
@@ -37,29 +184,157 @@ class ContactService:
         if not name:
             raise ValueError("Name cannot be empty.")
 
-        if email:
-            existing_contacts = self.repo.list()
-            for contact in existing_contacts:
-                if contact.email == email:
-                    raise ValueError("Email already exists.")
-
         new_contact = Contact(
             contact_id=uuid.uuid4(),
             name=name,
             email=email
         )
-        self.repo.add(new_contact)
-        self._observable.notify(self)  # NOTIFY with self (the service instance)
+        transaction = self._transaction()
+        if transaction is not None:
+            if email and transaction.email_exists(email):
+                raise ValueError("Email already exists.")
+            transaction.stage(new_contact.contact_id, new_contact, None)
+            return new_contact
+        with self._claiming([email] if email else []):
+            if email and self.repo.email_exists(email):
+                raise ValueError("Email already exists.")
+            self.repo.add(new_contact)
+        self._count("contacts_added_total")
+        self._publish([ContactAdded(new_contact)])  # NOTIFY with self and the change
         return new_contact
 
+    def add_contacts_bulk(self, rows: Iterable[Tuple[str, Optional[str]]]) -> BulkAddResult:
+        """
+        Creates and adds many contacts from (name, email) rows.
+
+        The whole batch is validated in a single pass, including emails that
+        are repeated within the batch itself. Invalid rows are reported in the
+        result instead of aborting the import; valid rows are written with one
+        repository call and observers are notified once at the end. Empty
+        email strings are stored as None.
+        """
+        result = BulkAddResult()
+        seen_emails: Set[str] = set()
+        claimed: List[str] = []
+        transaction = self._transaction()
+        lookup = self.repo if transaction is None else transaction
+        if self._email_locks is not None and transaction is None:
+            rows = list(rows)  # The emails must be known to lock them up front
+            claimed = [email for _, email in rows if email]
+
+        with self._claiming(claimed):
+            for row, (name, email) in enumerate(rows, 1):
+                email = email or None
+                if not name:
+                    message = "Name cannot be empty."
+                elif email and (email in seen_emails or lookup.email_exists(email)):
+                    message = "Email already exists."
+                else:
+                    if email:
+                        seen_emails.add(email)
+                    result.added.append(Contact(contact_id=uuid.uuid4(), name=name, email=email))
+                    continue
+                result.errors.append(BulkAddError(row=row, name=name, email=email, message=message))
+
+            if transaction is not None:
+                for contact in result.added:
+                    transaction.stage(contact.contact_id, contact, None)
+            elif result.added:
+                self.repo.add_many(result.added)
+        self._count("contact_validation_failures_total", len(result.errors),
+                    operation="add_contacts_bulk")
+        if transaction is not None:
+            return result
+        self._count("contacts_added_total", len(result.added))
+        if result.added:
+            self._publish([ContactAdded(contact) for contact in result.added])
+        return result
+
+    def get_contact(self, contact_id: uuid.UUID) -> Optional[Contact]:
+        """Returns the contact with the given ID, if any."""
+        return self.repo.get(contact_id)
+
+    def find_by_email(self, email: str) -> Optional[Contact]:
+        """Returns the contact that owns the given email address, if any."""
+        return self.repo.find_by_email(email)
+
+    def find_by_handle(self, handle: str) -> Contact:
+        """
+        Returns the contact whose ID starts with the given handle.
+        Raises ValueError if the handle is malformed, matches no contact,
+        or is too short to tell two contacts apart.
+        """
+        matches = self.repo.find_by_id_prefix(normalize_handle(handle), 2)
+        if not matches:
+            raise ValueError("Contact not found.")
+        if len(matches) > 1:
+            raise ValueError("Ambiguous contact handle; enter more of the ID.")
+        return matches[0]
+
     def get_all_contacts(self) -> List[Contact]:
         """Returns all contacts."""
         return self.repo.list()
 
+    def iter_contacts(self) -> Iterator[Contact]:
+        """Streams all contacts without materializing them as a list."""
+        return self.repo.iter_contacts()
+
+    def list_page(self, offset: int, limit: int) -> List[Contact]:
+        """Returns at most `limit` contacts starting at position `offset`."""
+        return self.repo.list_page(offset, limit)
+
+    def list_after(self, cursor: Optional[uuid.UUID], limit: int) -> List[Contact]:
+        """Returns at most `limit` contacts following the contact `cursor`."""
+        return self.repo.list_after(cursor, limit)
+
+    def list_sorted(self, order: str, offset: int, limit: int,
+                    domain: Optional[str] = None) -> List[Contact]:
+        """
+        Returns at most `limit` contacts starting at position `offset`,
+        ordered by "name", "email" or "domain" (see SORT_ORDERS), and
+        optionally only those with an email in `domain`.
+
+        The views are built from the repository on the first call and then
+        kept up to date with every change made through this service, so a
+        page of k contacts costs O(k) to read rather than a sort of the book.
+        Changes made to the repository by other means are not seen.
+        """
+        with self._views_lock:
+            if self._views is None:
+                self._views = SortedViews(self.repo.iter_contacts())
+            return self._views.page(order, offset, limit, domain)
+
+    def search(self, query: str, limit: int = 10) -> List[Contact]:
+        """
+        Returns at most `limit` contacts whose name or email matches `query`,
+        ignoring case, ordered by name.
+        """
+        return self.repo.search(query, limit)
+
+    def find_duplicates(self, threshold: float = 0.9,
+                        workers: Optional[int] = None) -> List[DuplicateSuggestion]:
+        """
+        Returns pairs of contacts that are probably the same person, most
+        likely first, as suggestions for merging. See the duplicates module
+        for how candidates are found and scored.
+        """
+        return find_duplicates(self.repo.iter_contacts(), threshold=threshold, workers=workers)
+
     def delete_contact(self, contact_id: uuid.UUID) -> None:
-        """Deletes a contact by their ID."""
+        """
+        Deletes a contact by their ID.
+        Observers are only notified if the contact existed.
+        """
+        transaction = self._transaction()
+        contact_to_delete = (self.repo if transaction is None else transaction).get(contact_id)
+        if contact_to_delete is None:
+            return
+        if transaction is not None:
+            transaction.stage(contact_id, None, contact_to_delete)
+            return
         self.repo.delete(contact_id)
-        self._observable.notify(self)  # NOTIFY with self
+        self._count("contacts_deleted_total")
+        self._publish([ContactDeleted(contact_to_delete)])  # NOTIFY with self
 
     def update_contact(self, contact_id: uuid.UUID, name: str, email: Optional[str]) -> Contact:
         """
@@ -68,21 +343,36 @@ class ContactService:
         This method retrieves a contact, applies the new data, checks for
         business rule violations, and then persists the changes.
         """
-        contact_to_update = self.repo.get(contact_id)
+        transaction = self._transaction()
+        contact_to_update = (self.repo if transaction is None else transaction).get(contact_id)
         if not contact_to_update:
             raise ValueError("Contact not found.")
 
         if not name:
             raise ValueError("Name cannot be empty.")
 
-        if email and email != contact_to_update.email:
-            for contact in self.repo.list():
-                if contact.contact_id != contact_id and contact.email == email:
+        if transaction is not None:
+            # Staged contacts are replaced rather than mutated, so the state
+            # the transaction started from stays intact for the event.
+            if email and email != contact_to_update.email:
+                owner = transaction.find_by_email(email)
+                if owner is not None and owner.contact_id != contact_id:
+                    raise ValueError("Email already exists.")
+            staged = replace(contact_to_update, name=name, email=email)
+            transaction.stage(contact_id, staged, contact_to_update)
+            return staged
+
+        with self._claiming([email] if email else []):
+            if email and email != contact_to_update.email:
+                owner = self.repo.find_by_email(email)
+                if owner is not None and owner.contact_id != contact_id:
                     raise ValueError("Email already exists.")
 
-        contact_to_update.name = name
-        contact_to_update.email = email
+            previous = replace(contact_to_update)
+            contact_to_update.name = name
+            contact_to_update.email = email
 
-        self.repo.update(contact_to_update)
-        self._observable.notify(self)  # NOTIFY with self
+            self.repo.update(contact_to_update)
+        self._count("contacts_updated_total")
+        self._publish([ContactUpdated(contact_to_update, previous)])  # NOTIFY with self
         return contact_to_update
\ No newline at end of file
@@ -3,21 +3,35 @@
 This module defines the classic Observer design pattern components.
 """
 from __future__ import annotations
+import logging
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import List, TYPE_CHECKING
+from dataclasses import dataclass, replace
+from typing import Dict, List, Optional, Sequence, Tuple, TYPE_CHECKING
+
+from .events import ChangeEvent
+from .metrics import MetricsSink
 
 # Use a forward reference for the Observable type hint in the Observer
 if TYPE_CHECKING:
+    from .async_model import AsyncContactService
     from .model import ContactService
 
+logger = logging.getLogger(__name__)
+
 
 class Observer(ABC):
     """
     The Observer interface declares the update method, used by subjects.
     """
     @abstractmethod
-    def update(self, subject: ContactService) -> None:
-        """Receive update from subject."""
+    def update(self, subject: ContactService, events: Sequence[ChangeEvent] = ()) -> None:
+        """
+        Receive update from subject, with the events describing the change.
+        An empty sequence means the change is unknown and any cached state
+        derived from the subject should be rebuilt.
+        """
         raise NotImplementedError
 
 
@@ -25,10 +39,15 @@ class Observable:
     """
     The Observable (or Subject) owns some important state and notifies observers
     when the state changes.
+
+    With a metrics sink, the time each observer takes to handle a
+    notification is observed as "observer_dispatch_seconds", labelled
+    with the observer's class name.
     """
 
-    def __init__(self):
+    def __init__(self, metrics: Optional[MetricsSink] = None):
         self._observers: List[Observer] = []
+        self.metrics = metrics
 
     def attach(self, observer: Observer) -> None:
         """Attaches an observer to the subject."""
@@ -42,7 +61,201 @@ class Observable:
         except ValueError:
             pass  # Fails silently if observer is not attached
 
-    def notify(self, subject: 'ContactService') -> None:
-        """Notify all observers about an event, passing the subject."""
+    def notify(self, subject: 'ContactService', events: Sequence[ChangeEvent] = ()) -> None:
+        """Notify all observers about an event, passing the subject and the changes."""
+        metrics = self.metrics
+        if metrics is None:
+            for observer in self._observers:
+                observer.update(subject, events)
+            return
         for observer in self._observers:
-            observer.update(subject)
\ No newline at end of file
+            start = time.perf_counter()
+            observer.update(subject, events)
+            metrics.observe("observer_dispatch_seconds", time.perf_counter() - start,
+                            observer=type(observer).__name__)
+
+
+@dataclass
+class NotificationStats:
+    """Counters describing the delivery backlog of a BackgroundObservable."""
+    notified: int = 0  # Calls to notify()
+    delivered: int = 0  # Successful observer.update() calls
+    coalesced: int = 0  # Notifications folded into one already pending
+    failed: int = 0  # observer.update() calls that raised
+    pending: int = 0  # Observers currently waiting for a delivery
+    max_pending: int = 0
+    max_lag_seconds: float = 0.0  # Longest wait from notify() to delivery
+
+
+class BackgroundObservable(Observable):
+    """
+    An Observable that delivers notifications on a background thread, so
+    notify() returns immediately instead of waiting for every observer.
+
+    Notifications are debounced: delivery waits until `debounce` seconds
+    pass without a further notify(), each of which restarts the wait, and
+    then each observer receives one update with the latest subject and the
+    events of the whole burst in order. So that a steady stream of changes
+    is still delivered, a burst is never held back more than `max_wait`
+    seconds (by default ten debounce windows) after its first notification.
+
+    An observer that raises is logged and counted without affecting the
+    others or the caller of notify(). Because at most one delivery per
+    observer is ever pending, the backlog is bounded by the number of
+    observers; stats reports how large and how old it gets.
+    """
+
+    def __init__(self, debounce: float = 0.05, metrics: Optional[MetricsSink] = None,
+                 max_wait: Optional[float] = None):
+        super().__init__(metrics)
+        self._debounce = debounce
+        self._max_wait = max_wait if max_wait is not None else 10 * debounce
+        self._last_notified = 0.0
+        self._condition = threading.Condition()
+        # observer -> (time first queued, latest subject, events so far)
+        self._pending: Dict[Observer, Tuple[float, 'ContactService', List[ChangeEvent]]] = {}
+        self._delivering = False
+        self._closed = False
+        self._stats = NotificationStats()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def stats(self) -> NotificationStats:
+        """A snapshot of the delivery counters."""
+        with self._condition:
+            return replace(self._stats, pending=len(self._pending))
+
+    def detach(self, observer: Observer) -> None:
+        """Detaches an observer and drops any delivery still pending for it."""
+        with self._condition:
+            super().detach(observer)
+            self._pending.pop(observer, None)
+
+    def notify(self, subject: 'ContactService', events: Sequence[ChangeEvent] = ()) -> None:
+        """Queues a notification for every observer and returns immediately."""
+        now = time.monotonic()
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Observable is closed.")
+            self._stats.notified += 1
+            self._last_notified = now
+            for observer in self._observers:
+                queued = self._pending.get(observer)
+                if queued is not None:
+                    self._stats.coalesced += 1
+                    queued[2].extend(events)
+                    self._pending[observer] = (queued[0], subject, queued[2])
+                else:
+                    self._pending[observer] = (now, subject, list(events))
+            self._stats.max_pending = max(self._stats.max_pending, len(self._pending))
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="observer-dispatch", daemon=True)
+                self._thread.start()
+            self._condition.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits until every queued notification has been delivered.
+        Returns False if `timeout` expired first.
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self._pending and not self._delivering, timeout)
+
+    def close(self) -> None:
+        """Delivers what is queued, then stops the background thread."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+
+    def _run(self) -> None:
+        """The dispatch loop of the background thread."""
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending or self._closed)
+                if not self._pending:
+                    return
+                # Let a burst of changes settle: wait for a quiet window,
+                # but no longer than max_wait after its first notification.
+                first = min(queued[0] for queued in self._pending.values())
+                while not self._closed:
+                    due = min(self._last_notified + self._debounce, first + self._max_wait)
+                    remaining = due - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                batch, self._pending = self._pending, {}
+                self._delivering = True
+            try:
+                for observer, (queued_at, subject, events) in batch.items():
+                    self._deliver(observer, subject, events, queued_at)
+            finally:
+                with self._condition:
+                    self._delivering = False
+                    self._condition.notify_all()
+
+    def _deliver(self, observer: Observer, subject: 'ContactService',
+                 events: List[ChangeEvent], queued_at: float) -> None:
+        """Calls one observer, recording the outcome."""
+        start = time.perf_counter()
+        try:
+            observer.update(subject, events)
+        except Exception:
+            logger.exception("Observer %r failed to handle a notification", observer)
+            with self._condition:
+                self._stats.failed += 1
+            return
+        if self.metrics is not None:
+            self.metrics.observe("observer_dispatch_seconds", time.perf_counter() - start,
+                                 observer=type(observer).__name__)
+        lag = time.monotonic() - queued_at
+        with self._condition:
+            self._stats.delivered += 1
+            self._stats.max_lag_seconds = max(self._stats.max_lag_seconds, lag)
+
+
+class AsyncObserver(ABC):
+    """
+    The asynchronous Observer interface, for observers that do I/O when
+    notified (e.g. pushing changes to connected clients).
+    """
+    @abstractmethod
+    async def update(self, subject: AsyncContactService, events: Sequence[ChangeEvent] = ()) -> None:
+        """Receive update from subject, with the events describing the change."""
+        raise NotImplementedError
+
+
+class AsyncObservable:
+    """
+    The asynchronous Observable: notify() awaits all observers concurrently.
+    An observer that raises is logged without affecting the others.
+    """
+
+    def __init__(self):
+        self._observers: List[AsyncObserver] = []
+
+    def attach(self, observer: AsyncObserver) -> None:
+        """Attaches an observer to the subject."""
+        if observer not in self._observers:
+            self._observers.append(observer)
+
+    def detach(self, observer: AsyncObserver) -> None:
+        """Detaches an observer from the subject."""
+        try:
+            self._observers.remove(observer)
+        except ValueError:
+            pass  # Fails silently if observer is not attached
+
+    async def notify(self, subject: 'AsyncContactService', events: Sequence[ChangeEvent] = ()) -> None:
+        """Notify all observers concurrently, passing the subject and the changes."""
+        import asyncio  # Deferred so that synchronous users do not pay for it
+        observers = list(self._observers)
+        results = await asyncio.gather(
+            *(observer.update(subject, events) for observer in observers), return_exceptions=True)
+        for observer, result in zip(observers, results):
+            if isinstance(result, Exception):
+                logger.error("Observer %r failed to handle a notification", observer, exc_info=result)
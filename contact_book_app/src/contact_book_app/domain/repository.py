@@ -5,10 +5,14 @@ This module defines the abstract interface for our data persistence layer.
 It uses the Repository Pattern to decouple the application's business logic
 from the specific data source (e.g., database, in-memory list).
 """
+import heapq
 import uuid
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import List, Optional
+from dataclasses import dataclass, replace
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Sequence
+
+from . import search
 
 
 @dataclass
@@ -27,16 +31,99 @@ class AbstractContactRepository(ABC):
         """Adds a new contact to the repository."""
         raise NotImplementedError
 
+    def add_many(self, contacts: Iterable[Contact]) -> None:
+        """
+        Adds several contacts in one call.
+
+        The default implementation simply calls add() for each contact;
+        concrete repositories may override it with a batched write.
+        """
+        for contact in contacts:
+            self.add(contact)
+
     @abstractmethod
     def get(self, contact_id: uuid.UUID) -> Optional[Contact]:
         """Retrieves a contact by its unique ID."""
         raise NotImplementedError
 
+    @abstractmethod
+    def find_by_email(self, email: str) -> Optional[Contact]:
+        """Retrieves the contact that owns the given email address, if any."""
+        raise NotImplementedError
+
+    def email_exists(self, email: str) -> bool:
+        """Returns True if a contact with the given email address exists."""
+        return self.find_by_email(email) is not None
+
+    def find_by_id_prefix(self, prefix: str, limit: int) -> List[Contact]:
+        """
+        Returns at most `limit` contacts whose ID, as 32 lowercase hex
+        digits, starts with `prefix`. See the handles module.
+
+        The default implementation scans every contact; concrete
+        repositories may override it with an index.
+        """
+        return list(islice((contact for contact in self.iter_contacts()
+                            if contact.contact_id.hex.startswith(prefix)), limit))
+
     @abstractmethod
     def list(self) -> List[Contact]:
         """Lists all contacts in the repository."""
         raise NotImplementedError
 
+    def iter_contacts(self) -> Iterator[Contact]:
+        """
+        Yields every contact in listing order.
+
+        The default implementation iterates over list(); concrete repositories
+        should override it to stream contacts without building a full copy.
+        """
+        yield from self.list()
+
+    def list_page(self, offset: int, limit: int) -> List[Contact]:
+        """Returns at most `limit` contacts, skipping the first `offset`."""
+        if offset < 0 or limit < 0:
+            raise ValueError("Offset and limit must not be negative.")
+        return list(islice(self.iter_contacts(), offset, offset + limit))
+
+    def list_after(self, cursor: Optional[uuid.UUID], limit: int) -> List[Contact]:
+        """
+        Returns at most `limit` contacts that follow the contact whose ID is
+        `cursor` in listing order, or the first page if `cursor` is None.
+
+        Unlike list_page(), this keyset form stays stable when contacts before
+        the cursor are added or removed between calls. Raises ValueError if
+        the cursor does not refer to a stored contact.
+        """
+        if limit < 0:
+            raise ValueError("Limit must not be negative.")
+        contacts = self.iter_contacts()
+        if cursor is not None:
+            for contact in contacts:
+                if contact.contact_id == cursor:
+                    break
+            else:
+                raise ValueError("Contact not found.")
+        return list(islice(contacts, limit))
+
+    def search(self, query: str, limit: int) -> List[Contact]:
+        """
+        Returns at most `limit` contacts matching `query`, ordered by name.
+        See the search module for the matching rules.
+
+        The default implementation scans every contact; concrete
+        repositories may override it with an index.
+        """
+        needle = search.normalize(query)
+        if not needle or limit <= 0:
+            return []
+        hits = []
+        for contact in self.iter_contacts():
+            name, email = search.normalize(contact.name), search.fold_email(contact.email)
+            if search.matches(needle, name, email):
+                hits.append((search.sort_key(name, email, contact.contact_id), contact))
+        return [contact for _, contact in heapq.nsmallest(limit, hits, key=lambda hit: hit[0])]
+
     @abstractmethod
     def delete(self, contact_id: uuid.UUID) -> None:
         """Deletes a contact by its unique ID."""
@@ -45,4 +132,27 @@ class AbstractContactRepository(ABC):
     @abstractmethod
     def update(self, contact: Contact) -> None:
         """Updates an existing contact."""
-        raise NotImplementedError
\ No newline at end of file
+        raise NotImplementedError
+
+    def apply_changes(self, added: Sequence[Contact], updated: Sequence[Contact],
+                      deleted: Sequence[uuid.UUID]) -> None:
+        """
+        Writes a batch of changes, as committed by a ContactService
+        transaction: the deletions first, then the updates, then the adds.
+        Emails may move between contacts within the batch, e.g. two
+        contacts swapping addresses.
+
+        The default implementation makes one call per change, clearing the
+        email of every updated contact before setting any, so that a
+        repository enforcing uniqueness accepts an address moving to a
+        contact updated earlier in the batch. It is not atomic; concrete
+        repositories should override it with a single write.
+        """
+        for contact_id in deleted:
+            self.delete(contact_id)
+        for contact in updated:
+            self.update(replace(contact, email=None))
+        for contact in updated:
+            self.update(contact)
+        if added:
+            self.add_many(added)
\ No newline at end of file
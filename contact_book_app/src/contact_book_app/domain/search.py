@@ -0,0 +1,49 @@
+# contact_book_app/src/domain/search.py
+"""
+This module defines how contacts are matched and ordered by a search, so
+that every repository implementation answers a query the same way.
+
+Matching is case-insensitive. Queries of at least MIN_SUBSTRING_LENGTH
+characters match anywhere in a contact's name or email; shorter queries
+only match the start of a word, since almost every contact would contain
+them somewhere.
+"""
+import re
+import uuid
+from typing import List, Optional, Tuple
+
+MIN_SUBSTRING_LENGTH = 3
+
+_WORD_SEPARATOR = re.compile(r"[\W_]+")
+
+SortKey = Tuple[str, str, uuid.UUID]
+
+
+def normalize(text: str) -> str:
+    """Case-folds text and strips surrounding whitespace."""
+    return text.strip().casefold()
+
+
+def words(folded: str) -> List[str]:
+    """Splits normalized text into words, e.g. an email into its parts."""
+    return [word for word in _WORD_SEPARATOR.split(folded) if word]
+
+
+def matches(needle: str, name: str, email: str) -> bool:
+    """
+    Returns True if the normalized query matches the normalized name or
+    email (an empty string for contacts without one).
+    """
+    if len(needle) >= MIN_SUBSTRING_LENGTH:
+        return needle in name or needle in email
+    return any(word.startswith(needle) for word in words(name) + words(email))
+
+
+def sort_key(name: str, email: str, contact_id: uuid.UUID) -> SortKey:
+    """Orders results by normalized name, then email, then ID."""
+    return (name, email, contact_id)
+
+
+def fold_email(email: Optional[str]) -> str:
+    """Normalizes an optional email, mapping None to an empty string."""
+    return normalize(email) if email else ""
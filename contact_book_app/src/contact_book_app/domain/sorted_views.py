@@ -0,0 +1,233 @@
+# contact_book_app/src/domain/sorted_views.py
+"""
+This module defines ordered views of the contact book: the contacts sorted
+by name, by email or by email domain, optionally narrowed to one domain.
+
+The views are kept up to date from the service's change events instead of
+being sorted again for every page, so reading the first k rows of a view
+costs O(k) however large the book is.
+"""
+import uuid
+from bisect import bisect_left, insort
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from . import search
+from .events import ChangeEvent, ContactDeleted
+from .repository import Contact
+
+SORT_ORDERS = ("name", "email", "domain")
+
+Keys = Tuple[Tuple[Any, ...], ...]  # One sort key per order, in SORT_ORDERS order
+_DOMAIN = 2  # The order whose key holds the email domain, at index 1
+
+
+def normalize_domain(domain: str) -> str:
+    """Normalizes a domain typed by a user, e.g. " @Example.COM" to "example.com"."""
+    return search.normalize(domain).lstrip("@")
+
+
+def _keys(contact: Contact) -> Keys:
+    """Returns the contact's sort key in each order. Contacts without an email sort last."""
+    name, email = search.normalize(contact.name), search.fold_email(contact.email)
+    no_email = not email
+    domain = email.rpartition("@")[2] if "@" in email else ""
+    # IDs are compared as integers, which order the same as UUIDs; keys made
+    # only of atomic values are untracked by the garbage collector, which
+    # would otherwise rescan every key of a large book.
+    contact_id = contact.contact_id.int
+    return (
+        (name, email, contact_id),
+        (no_email, email, name, contact_id),
+        (no_email, domain, email, name, contact_id),
+    )
+
+
+class SortedList:
+    """
+    A list of values kept in sorted order.
+
+    Values are stored in a list of sorted blocks of between 1 and
+    2 * `load` values, with the largest value of each block kept in a
+    separate list. Adding or removing a value bisects the block maxima and
+    then the one block, so the cost is O(log n) comparisons plus moving at
+    most 2 * `load` references, rather than shifting a list of the whole
+    book as bisect.insort would. Reading k values from a position skips
+    whole blocks, then copies only those k.
+    """
+
+    def __init__(self, values: Iterable[Any] = (), load: int = 512) -> None:
+        self._load = load
+        ordered = sorted(values)
+        self._blocks: List[List[Any]] = [ordered[i:i + load] for i in range(0, len(ordered), load)]
+        self._maxes: List[Any] = [block[-1] for block in self._blocks]
+        self._length = len(ordered)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[Any]:
+        for block in self._blocks:
+            yield from block
+
+    def add(self, value: Any) -> None:
+        """Inserts a value at its sorted position."""
+        blocks, maxes = self._blocks, self._maxes
+        if not blocks:
+            blocks.append([value])
+            maxes.append(value)
+        else:
+            i = bisect_left(maxes, value)
+            if i == len(maxes):
+                i -= 1
+                blocks[i].append(value)
+                maxes[i] = value
+            else:
+                insort(blocks[i], value)
+            block = blocks[i]
+            if len(block) > 2 * self._load:
+                half = block[self._load:]
+                del block[self._load:]
+                blocks.insert(i + 1, half)
+                maxes[i] = block[-1]
+                maxes.insert(i + 1, half[-1])
+        self._length += 1
+
+    def remove(self, value: Any) -> None:
+        """Removes a value. Raises ValueError if it is not in the list."""
+        blocks, maxes = self._blocks, self._maxes
+        i = bisect_left(maxes, value)
+        if i == len(maxes):
+            raise ValueError("Value not in list.")
+        block = blocks[i]
+        j = bisect_left(block, value)
+        if block[j] != value:
+            raise ValueError("Value not in list.")
+        del block[j]
+        self._length -= 1
+        if not block:
+            del blocks[i]
+            del maxes[i]
+        elif j == len(block):
+            maxes[i] = block[-1]
+
+    def slice(self, start: int, stop: int) -> List[Any]:
+        """Returns the values at positions start to stop, like list[start:stop]."""
+        values: List[Any] = []
+        for block in self._blocks:
+            if start >= len(block):
+                start -= len(block)
+                stop -= len(block)
+                continue
+            values.extend(block[start:stop])
+            stop -= len(block)
+            start = 0
+            if stop <= 0:
+                break
+        return values
+
+
+class _Orderings:
+    """One SortedList of keys per sort order, over the same contacts."""
+
+    def __init__(self, columns: Sequence[Iterable[Any]] = ()) -> None:
+        self.lists = [SortedList(column) for column in columns or [() for _ in SORT_ORDERS]]
+
+    def __len__(self) -> int:
+        return len(self.lists[0])
+
+    def add(self, keys: Keys) -> None:
+        for ordered, key in zip(self.lists, keys):
+            ordered.add(key)
+
+    def remove(self, keys: Keys) -> None:
+        for ordered, key in zip(self.lists, keys):
+            ordered.remove(key)
+
+
+class SortedViews:
+    """
+    The contacts of a book in each of SORT_ORDERS, over the whole book and
+    within each email domain.
+
+    Each contact is filed under one key per order, in the book-wide
+    orderings and in those of its domain, so an add, update or delete costs
+    a few SortedList changes, and a page is read without sorting. Not
+    thread-safe; ContactService guards its views with a lock.
+    """
+
+    def __init__(self, contacts: Iterable[Contact] = ()) -> None:
+        # Both keyed by the integer form of the contact ID, as in the keys.
+        self._contacts: Dict[int, Contact] = {}
+        self._keys: Dict[int, Keys] = {}
+        for contact in contacts:
+            self._contacts[contact.contact_id.int] = contact
+            self._keys[contact.contact_id.int] = _keys(contact)
+        self._all = _Orderings(list(zip(*self._keys.values())))
+        # Split the sorted book-wide lists by domain, so each part is
+        # already sorted and costs a linear pass rather than another sort.
+        by_domain: Dict[str, List[List[Any]]] = {}
+        for order, ordered in enumerate(self._all.lists):
+            for key in ordered:
+                domain = self._keys[key[-1]][_DOMAIN][1]
+                columns = by_domain.get(domain)
+                if columns is None:
+                    columns = by_domain[domain] = [[] for _ in SORT_ORDERS]
+                columns[order].append(key)
+        self._domains = {domain: _Orderings(columns) for domain, columns in by_domain.items()}
+
+    def __len__(self) -> int:
+        return len(self._contacts)
+
+    def add(self, contact: Contact) -> None:
+        """Files a contact in every view, replacing any previous entry for its ID."""
+        self.remove(contact.contact_id)
+        keys = _keys(contact)
+        self._contacts[contact.contact_id.int] = contact
+        self._keys[contact.contact_id.int] = keys
+        self._all.add(keys)
+        domain = keys[_DOMAIN][1]
+        orderings = self._domains.get(domain)
+        if orderings is None:
+            orderings = self._domains[domain] = _Orderings()
+        orderings.add(keys)
+
+    def remove(self, contact_id: uuid.UUID) -> None:
+        """
+        Removes a contact from every view. Does nothing if it is absent.
+        Works from the keys it was filed under, as the contact itself may
+        have been changed in place since.
+        """
+        keys = self._keys.pop(contact_id.int, None)
+        if keys is None:
+            return
+        del self._contacts[contact_id.int]
+        self._all.remove(keys)
+        domain = keys[_DOMAIN][1]
+        orderings = self._domains[domain]
+        orderings.remove(keys)
+        if not orderings:
+            del self._domains[domain]
+
+    def apply(self, events: Sequence[ChangeEvent]) -> None:
+        """Brings the views up to date with a batch of change events."""
+        for event in events:
+            if isinstance(event, ContactDeleted):
+                self.remove(event.contact.contact_id)
+            else:
+                self.add(event.contact)
+
+    def page(self, order: str, offset: int, limit: int,
+             domain: Optional[str] = None) -> List[Contact]:
+        """
+        Returns at most `limit` contacts in the given order, skipping the
+        first `offset`, optionally only those whose email is in `domain`.
+        """
+        if order not in SORT_ORDERS:
+            raise ValueError("Unknown sort order.")
+        if offset < 0 or limit < 0:
+            raise ValueError("Offset and limit must not be negative.")
+        orderings = self._all if domain is None else self._domains.get(normalize_domain(domain))
+        if orderings is None:
+            return []
+        keys = orderings.lists[SORT_ORDERS.index(order)].slice(offset, offset + limit)
+        return [self._contacts[key[-1]] for key in keys]
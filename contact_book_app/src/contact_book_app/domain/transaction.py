@@ -0,0 +1,100 @@
+# contact_book_app/src/domain/transaction.py
+"""
+This module defines the unit of work behind ContactService.transaction():
+the changes staged by a transaction, kept in memory until it commits.
+"""
+import uuid
+from typing import Dict, List, Optional, Tuple
+
+from .events import ChangeEvent, ContactAdded, ContactDeleted, ContactUpdated
+from .repository import AbstractContactRepository, Contact
+
+Changes = Tuple[List[Contact], List[Contact], List[uuid.UUID], List[ChangeEvent]]
+
+
+class Transaction:
+    """
+    The contacts a transaction has added, updated or deleted, layered over
+    the repository it will be committed to.
+
+    For each contact it touched, the transaction keeps the final staged
+    state (None once deleted) and the committed state it started from
+    (None for a new contact), so that committing writes and reports only
+    the net change of each contact: a contact added and then deleted
+    again is neither written nor reported.
+
+    get(), find_by_email() and email_exists() answer as the book would look
+    after committing, which is what uniqueness is validated against.
+    """
+
+    def __init__(self, repo: AbstractContactRepository) -> None:
+        self._repo = repo
+        self._staged: Dict[uuid.UUID, Optional[Contact]] = {}  # In the order first touched
+        self._original: Dict[uuid.UUID, Optional[Contact]] = {}
+        self._claimed: Dict[str, uuid.UUID] = {}  # email -> staged contact holding it
+
+    def __contains__(self, contact_id: uuid.UUID) -> bool:
+        """Returns True if the transaction has staged a change to the contact."""
+        return contact_id in self._staged
+
+    def get(self, contact_id: uuid.UUID) -> Optional[Contact]:
+        """Returns the contact's staged state, or its committed one if untouched."""
+        if contact_id in self._staged:
+            return self._staged[contact_id]
+        return self._repo.get(contact_id)
+
+    def find_by_email(self, email: str) -> Optional[Contact]:
+        """Returns the contact that will own the email once committed, if any."""
+        contact_id = self._claimed.get(email)
+        if contact_id is not None:
+            return self._staged[contact_id]
+        owner = self._repo.find_by_email(email)
+        if owner is not None and owner.contact_id in self._staged:
+            return None  # The owner gives the email up in this transaction
+        return owner
+
+    def email_exists(self, email: str) -> bool:
+        """Returns True if some contact will own the email once committed."""
+        return self.find_by_email(email) is not None
+
+    @property
+    def emails(self) -> List[str]:
+        """The emails that staged contacts will hold once committed."""
+        return list(self._claimed)
+
+    def stage(self, contact_id: uuid.UUID, contact: Optional[Contact],
+              current: Optional[Contact]) -> None:
+        """
+        Records the new state of a contact (None to delete it). `current` is
+        its state as returned by get() before this change, None if new.
+        """
+        if contact_id not in self._staged:
+            self._original[contact_id] = current
+        elif current is not None and current.email and self._claimed.get(current.email) == contact_id:
+            del self._claimed[current.email]
+        self._staged[contact_id] = contact
+        if contact is not None and contact.email:
+            self._claimed[contact.email] = contact_id
+
+    def changes(self) -> Changes:
+        """
+        Returns the net (added, updated, deleted) changes to write, and the
+        events describing them, in the order the contacts were first touched.
+        """
+        added: List[Contact] = []
+        updated: List[Contact] = []
+        deleted: List[uuid.UUID] = []
+        events: List[ChangeEvent] = []
+        for contact_id, contact in self._staged.items():
+            original = self._original[contact_id]
+            if original is None:
+                if contact is not None:
+                    added.append(contact)
+                    events.append(ContactAdded(contact))
+            elif contact is None:
+                deleted.append(contact_id)
+                events.append(ContactDeleted(original))
+            else:
+                updated.append(contact)
+                events.append(ContactUpdated(contact, original))
+        return added, updated, deleted, events
@@ -0,0 +1,75 @@
+# contact_book_app/src/infrastructure/async_adapter.py
+"""
+This module adapts any synchronous Contact Repository to the asynchronous
+repository interface by running its calls in a thread pool.
+"""
+import asyncio
+import functools
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, List, Optional, TypeVar
+
+from ..domain.async_repository import AsyncAbstractContactRepository
+from ..domain.repository import AbstractContactRepository, Contact
+from .thread_safe_repository import ThreadSafeContactRepository
+
+T = TypeVar("T")
+
+
+class ThreadPoolContactRepository(AsyncAbstractContactRepository):
+    """
+    Runs a synchronous repository in a pool of worker threads, so slow calls
+    (disk or database access) do not block the event loop.
+
+    With more than one worker the repository is used from several threads
+    at once, so it is wrapped in a ThreadSafeContactRepository. Repositories
+    bound to the thread that created them (such as SQLite connections by
+    default) must allow use from other threads.
+    """
+
+    def __init__(self, repo: AbstractContactRepository, max_workers: int = 4) -> None:
+        self._repo = repo if max_workers == 1 else ThreadSafeContactRepository(repo)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                            thread_name_prefix="contact-repo")
+
+    def close(self) -> None:
+        """Waits for pending calls and shuts the thread pool down."""
+        self._executor.shutdown(wait=True)
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args))
+
+    async def add(self, contact: Contact) -> None:
+        await self._run(self._repo.add, contact)
+
+    async def add_many(self, contacts: Iterable[Contact]) -> None:
+        """Adds the batch with a single call on a worker thread."""
+        await self._run(self._repo.add_many, list(contacts))
+
+    async def get(self, contact_id: uuid.UUID) -> Optional[Contact]:
+        return await self._run(self._repo.get, contact_id)
+
+    async def find_by_email(self, email: str) -> Optional[Contact]:
+        return await self._run(self._repo.find_by_email, email)
+
+    async def email_exists(self, email: str) -> bool:
+        return await self._run(self._repo.email_exists, email)
+
+    async def list(self) -> List[Contact]:
+        return await self._run(self._repo.list)
+
+    async def list_page(self, offset: int, limit: int) -> List[Contact]:
+        return await self._run(self._repo.list_page, offset, limit)
+
+    async def list_after(self, cursor: Optional[uuid.UUID], limit: int) -> List[Contact]:
+        return await self._run(self._repo.list_after, cursor, limit)
+
+    async def search(self, query: str, limit: int) -> List[Contact]:
+        return await self._run(self._repo.search, query, limit)
+
+    async def delete(self, contact_id: uuid.UUID) -> None:
+        await self._run(self._repo.delete, contact_id)
+
+    async def update(self, contact: Contact) -> None:
+        await self._run(self._repo.update, contact)
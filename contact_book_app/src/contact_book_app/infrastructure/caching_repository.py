@@ -0,0 +1,176 @@
+# contact_book_app/src/infrastructure/caching_repository.py
+"""
+This module contains a decorator that caches reads from any Contact
+Repository in memory, for backends where each lookup is costly.
+"""
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from ..domain.repository import AbstractContactRepository, Contact
+
+
+@dataclass
+class CacheStats:
+    """Counters describing how well a CachingContactRepository is doing."""
+    hits: int = 0  # get() and list() calls answered from the cache
+    misses: int = 0  # Calls passed on to the wrapped repository
+    evictions: int = 0  # Contacts dropped to stay within max_size
+    expirations: int = 0  # Entries found older than the TTL
+    invalidations: int = 0  # Entries dropped because of a write
+    size: int = 0  # Contacts currently cached
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class CachingContactRepository(AbstractContactRepository):
+    """
+    Wraps a repository with a read-through cache of contacts by ID and of
+    the full list() result.
+
+    Contacts are kept in a least-recently-used cache of at most `max_size`
+    entries. With a `ttl` in seconds, entries older than that are fetched
+    again, which bounds staleness when other processes write to the same
+    backend. Writes go straight to the wrapped repository and drop exactly
+    what they make stale: the written contact, and the cached list.
+
+    Cached contacts are copied on the way out, so callers that mutate a
+    contact before calling update() (as ContactService does) cannot change
+    the cache if the update then fails. Other reads are passed through
+    uncached. Like the repositories it wraps, the cache is not thread-safe;
+    put a ThreadSafeContactRepository in front of it to share it.
+    """
+
+    def __init__(self, inner: AbstractContactRepository, max_size: int = 10_000,
+                 ttl: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        if max_size < 1:
+            raise ValueError("Cache size must be at least 1.")
+        self._inner = inner
+        self._max_size = max_size
+        self._ttl = ttl
+        self._clock = clock
+        # contact_id -> (contact, time cached), least recently used first
+        self._contacts: "OrderedDict[uuid.UUID, Tuple[Contact, float]]" = OrderedDict()
+        self._list: Optional[Tuple[List[Contact], float]] = None
+        self._stats = CacheStats()
+
+    @property
+    def stats(self) -> CacheStats:
+        """A snapshot of the cache counters."""
+        return replace(self._stats, size=len(self._contacts))
+
+    def clear(self) -> None:
+        """Drops every cached entry, keeping the counters."""
+        self._contacts.clear()
+        self._list = None
+
+    def close(self) -> None:
+        """Closes the wrapped repository if it can be closed, e.g. a database."""
+        close = getattr(self._inner, "close", None)
+        if close is not None:
+            close()
+
+    def _fresh(self, cached_at: float) -> bool:
+        """Returns True if an entry cached at the given time has not expired."""
+        if self._ttl is None or self._clock() - cached_at < self._ttl:
+            return True
+        self._stats.expirations += 1
+        return False
+
+    def _invalidate(self, contact_id: Optional[uuid.UUID] = None) -> None:
+        """Drops the cached list and, if given, one cached contact."""
+        if contact_id is not None and self._contacts.pop(contact_id, None) is not None:
+            self._stats.invalidations += 1
+        if self._list is not None:
+            self._list = None
+            self._stats.invalidations += 1
+
+    def add(self, contact: Contact) -> None:
+        self._inner.add(contact)
+        self._invalidate(contact.contact_id)
+
+    def add_many(self, contacts: Iterable[Contact]) -> None:
+        """Adds a batch without caching it, so an import does not flush the cache."""
+        self._inner.add_many(contacts)
+        self._invalidate()
+
+    def get(self, contact_id: uuid.UUID) -> Optional[Contact]:
+        """Returns a copy of the contact, from the cache when possible."""
+        entry = self._contacts.get(contact_id)
+        if entry is not None and self._fresh(entry[1]):
+            self._contacts.move_to_end(contact_id)
+            self._stats.hits += 1
+            return replace(entry[0])
+        self._stats.misses += 1
+        contact = self._inner.get(contact_id)
+        if contact is None:
+            self._contacts.pop(contact_id, None)
+            return None
+        self._contacts[contact_id] = (replace(contact), self._clock())
+        self._contacts.move_to_end(contact_id)
+        if len(self._contacts) > self._max_size:
+            self._contacts.popitem(last=False)
+            self._stats.evictions += 1
+        return contact
+
+    def find_by_email(self, email: str) -> Optional[Contact]:
+        return self._inner.find_by_email(email)
+
+    def email_exists(self, email: str) -> bool:
+        return self._inner.email_exists(email)
+
+    def find_by_id_prefix(self, prefix: str, limit: int) -> List[Contact]:
+        return self._inner.find_by_id_prefix(prefix, limit)
+
+    def list(self) -> List[Contact]:
+        """
+        Returns all contacts, from the cache when possible. The contacts
+        are shared with the cache and must be treated as read-only.
+        """
+        if self._list is not None and self._fresh(self._list[1]):
+            self._stats.hits += 1
+            return list(self._list[0])
+        self._stats.misses += 1
+        contacts = self._inner.list()
+        self._list = (list(contacts), self._clock())
+        return contacts
+
+    def iter_contacts(self) -> Iterator[Contact]:
+        """Streams the cached list if there is one, otherwise the wrapped repository."""
+        if self._list is not None and self._fresh(self._list[1]):
+            self._stats.hits += 1
+            return iter(self._list[0])
+        return self._inner.iter_contacts()
+
+    def list_page(self, offset: int, limit: int) -> List[Contact]:
+        return self._inner.list_page(offset, limit)
+
+    def list_after(self, cursor: Optional[uuid.UUID], limit: int) -> List[Contact]:
+        return self._inner.list_after(cursor, limit)
+
+    def search(self, query: str, limit: int) -> List[Contact]:
+        return self._inner.search(query, limit)
+
+    def delete(self, contact_id: uuid.UUID) -> None:
+        self._inner.delete(contact_id)
+        self._invalidate(contact_id)
+
+    def update(self, contact: Contact) -> None:
+        self._inner.update(contact)
+        self._invalidate(contact.contact_id)
+
+    def apply_changes(self, added: Sequence[Contact], updated: Sequence[Contact],
+                      deleted: Sequence[uuid.UUID]) -> None:
+        """Applies a batch and drops the updated and deleted contacts from the cache."""
+        self._inner.apply_changes(added, updated, deleted)
+        for contact_id in deleted:
+            self._invalidate(contact_id)
+        for contact in updated:
+            self._invalidate(contact.contact_id)
+        self._invalidate()
@@ -0,0 +1,374 @@
+# contact_book_app/src/infrastructure/compact_repository.py
+"""
+This module contains a memory-compact, in-memory implementation of the
+Contact Repository for very large books.
+
+Instead of one Contact object (plus its __dict__ and uuid.UUID) per entry,
+contacts are stored column by column: IDs as raw 128-bit values in a single
+byte buffer, names as indices into an interned string table, and emails as
+UTF-8 slices of one contiguous byte heap. Lookups by ID and by email go
+through open-addressing hash tables of slot numbers, so no Python object is
+kept per contact. Contact objects are only built when a caller asks for them.
+"""
+import uuid
+from array import array
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+from ..domain.repository import AbstractContactRepository, Contact
+
+_ID_SIZE = 16  # Bytes per contact ID in the ID buffer
+_DELETED = -1  # Name index marking a deleted slot
+_NO_EMAIL = -1  # Email length for contacts without an email
+_EMPTY = -1  # Unused bucket in a _SlotIndex
+_REMOVED = -2  # Bucket whose entry was removed from a _SlotIndex
+
+
+class SlottedContact:
+    """
+    A compact record of a contact that has no per-instance __dict__ and
+    keeps the ID as a plain 128-bit int instead of a uuid.UUID object.
+    """
+    __slots__ = ("id_int", "name", "email")
+
+    def __init__(self, id_int: int, name: str, email: Optional[str] = None):
+        self.id_int = id_int
+        self.name = name
+        self.email = email
+
+    @classmethod
+    def from_contact(cls, contact: Contact) -> "SlottedContact":
+        """Builds a compact record from a Contact."""
+        return cls(contact.contact_id.int, contact.name, contact.email)
+
+    def to_contact(self) -> Contact:
+        """Builds a Contact from the compact record."""
+        return Contact(contact_id=uuid.UUID(int=self.id_int), name=self.name, email=self.email)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SlottedContact):
+            return NotImplemented
+        return (self.id_int, self.name, self.email) == (other.id_int, other.name, other.email)
+
+    def __repr__(self) -> str:
+        return f"SlottedContact(id_int={self.id_int!r}, name={self.name!r}, email={self.email!r})"
+
+
+class _StringTable:
+    """
+    Interns strings behind small integer indices with reference counting,
+    so that repeated values (e.g. common names) are stored only once.
+    """
+
+    def __init__(self) -> None:
+        self._strings: List[Optional[str]] = []
+        self._index: Dict[str, int] = {}
+        self._refs = array("i")
+        self._free: List[int] = []
+
+    def __getitem__(self, index: int) -> str:
+        return self._strings[index]
+
+    def find(self, value: str) -> Optional[int]:
+        """Returns the index of an interned string, or None if absent."""
+        return self._index.get(value)
+
+    def intern(self, value: str) -> int:
+        """Returns the index of `value`, adding it if needed, and takes a reference."""
+        index = self._index.get(value)
+        if index is None:
+            if self._free:
+                index = self._free.pop()
+                self._strings[index] = value
+                self._refs[index] = 0
+            else:
+                index = len(self._strings)
+                self._strings.append(value)
+                self._refs.append(0)
+            self._index[value] = index
+        self._refs[index] += 1
+        return index
+
+    def release(self, index: int) -> None:
+        """Drops a reference, freeing the entry when none remain."""
+        self._refs[index] -= 1
+        if self._refs[index] == 0:
+            del self._index[self._strings[index]]
+            self._strings[index] = None
+            self._free.append(index)
+
+
+class _SlotIndex:
+    """
+    An open-addressing hash table mapping keys to repository slots.
+
+    Only slot numbers are stored; the key of a slot is read back from the
+    columns through `key_of`, so the table costs a few bytes per entry.
+    """
+
+    def __init__(self, key_of: Callable[[int], bytes]) -> None:
+        self._key_of = key_of
+        self._clear(8)
+
+    def _clear(self, capacity: int) -> None:
+        self._buckets = array("q", [_EMPTY]) * capacity
+        self._mask = capacity - 1
+        self._used = 0  # Buckets that are not _EMPTY, including _REMOVED ones
+
+    def _probe(self, key: bytes) -> Iterator[int]:
+        """Yields bucket positions in probe order for `key`."""
+        position = hash(key) & self._mask
+        while True:
+            yield position
+            position = (position + 1) & self._mask
+
+    def _position(self, key: bytes) -> Optional[int]:
+        """Returns the bucket position holding `key`, or None if absent."""
+        buckets = self._buckets
+        for position in self._probe(key):
+            slot = buckets[position]
+            if slot == _EMPTY:
+                return None
+            if slot != _REMOVED and self._key_of(slot) == key:
+                return position
+        return None  # pragma: no cover - the probe sequence never ends
+
+    def find(self, key: bytes) -> Optional[int]:
+        """Returns the slot stored for `key`, or None if absent."""
+        position = self._position(key)
+        return self._buckets[position] if position is not None else None
+
+    def insert(self, key: bytes, slot: int) -> None:
+        """Stores `slot` under `key`, which must not already be present."""
+        if (self._used + 1) * 3 > len(self._buckets) * 2:
+            live = [s for s in self._buckets if s >= 0]
+            self.rebuild(live, len(live))
+        buckets = self._buckets
+        for position in self._probe(key):
+            if buckets[position] < 0:
+                if buckets[position] == _EMPTY:
+                    self._used += 1
+                buckets[position] = slot
+                return
+
+    def remove(self, key: bytes) -> None:
+        """Removes `key` if present."""
+        position = self._position(key)
+        if position is not None:
+            self._buckets[position] = _REMOVED
+
+    def rebuild(self, slots: Iterable[int], count: int) -> None:
+        """Replaces the contents with `slots`, sized for `count` entries."""
+        capacity = 8
+        while capacity * 2 < count * 3 + 3:
+            capacity *= 2
+        self._clear(capacity * 2)
+        for slot in slots:
+            self.insert(self._key_of(slot), slot)
+
+
+class ColumnarContactRepository(AbstractContactRepository):
+    """
+    Concrete repository implementation that stores contacts in memory as
+    parallel columns rather than as individual objects.
+
+    Every read returns a freshly built Contact, so changes to a returned
+    object only take effect once passed to update(). Emails are unique
+    within the repository; adding or updating a contact to an email owned by
+    another contact raises ValueError. Contacts are listed in insertion order.
+    """
+
+    def __init__(self) -> None:
+        self._ids = bytearray()
+        self._names = array("i")
+        self._name_table = _StringTable()
+        self._email_heap = bytearray()
+        self._email_starts = array("q")
+        self._email_lengths = array("i")
+        self._id_index = _SlotIndex(self._id_at)
+        self._email_index = _SlotIndex(self._email_bytes_at)
+        self._holes = 0
+        self._heap_garbage = 0  # Heap bytes no longer referenced by any slot
+
+    def _id_at(self, slot: int) -> bytes:
+        """Returns the raw 16-byte ID stored in the given slot."""
+        offset = slot * _ID_SIZE
+        return bytes(self._ids[offset:offset + _ID_SIZE])
+
+    def _email_bytes_at(self, slot: int) -> bytes:
+        """Returns the UTF-8 email stored in the given slot, or b"" if it has none."""
+        length = self._email_lengths[slot]
+        if length == _NO_EMAIL:
+            return b""
+        start = self._email_starts[slot]
+        return bytes(self._email_heap[start:start + length])
+
+    def _contact_at(self, slot: int) -> Contact:
+        """Builds the Contact stored in the given slot."""
+        has_email = self._email_lengths[slot] != _NO_EMAIL
+        return Contact(
+            contact_id=uuid.UUID(bytes=self._id_at(slot)),
+            name=self._name_table[self._names[slot]],
+            email=self._email_bytes_at(slot).decode() if has_email else None,
+        )
+
+    def _live_slots(self, start: int = 0) -> Iterator[int]:
+        """Yields the slots from `start` onward that hold a contact."""
+        names = self._names
+        for slot in range(start, len(names)):
+            if names[slot] != _DELETED:
+                yield slot
+
+    def _check_email(self, email: Optional[str], slot: int) -> Optional[bytes]:
+        """Encodes `email`, raising ValueError if another slot owns it."""
+        if not email:
+            return None
+        encoded = email.encode()
+        owner = self._email_index.find(encoded)
+        if owner is not None and owner != slot:
+            raise ValueError("Email already exists.")
+        return encoded
+
+    def _clear_email(self, slot: int) -> None:
+        """Removes the email of a slot from the index and the heap."""
+        length = self._email_lengths[slot]
+        if length != _NO_EMAIL:
+            self._email_index.remove(self._email_bytes_at(slot))
+            self._email_lengths[slot] = _NO_EMAIL
+            self._heap_garbage += length
+
+    def _set_email(self, slot: int, encoded: Optional[bytes]) -> None:
+        """Appends an email to the heap and indexes it for a slot."""
+        if encoded is None:
+            return
+        self._email_starts[slot] = len(self._email_heap)
+        self._email_lengths[slot] = len(encoded)
+        self._email_heap += encoded
+        self._email_index.insert(encoded, slot)
+
+    def _write(self, slot: int, contact: Contact) -> None:
+        """Replaces the name and email of an existing slot."""
+        encoded = self._check_email(contact.email, slot)
+        old_name = self._names[slot]
+        self._names[slot] = self._name_table.intern(contact.name)
+        self._name_table.release(old_name)
+        if encoded is None or encoded != self._email_bytes_at(slot):
+            self._clear_email(slot)
+            self._set_email(slot, encoded)
+        self._maybe_compact()
+
+    def _maybe_compact(self) -> None:
+        """Compacts once deleted slots or dead heap bytes dominate."""
+        if self._holes * 2 > len(self._names) or self._heap_garbage * 2 > len(self._email_heap):
+            self._compact()
+
+    def _compact(self) -> None:
+        """Drops deleted slots and dead email bytes, keeping insertion order."""
+        live = list(self._live_slots())
+        heap = bytearray()
+        starts = array("q")
+        for slot in live:
+            starts.append(len(heap))
+            heap += self._email_bytes_at(slot)
+        self._ids = bytearray(b"".join(map(self._id_at, live)))
+        self._names = array("i", (self._names[slot] for slot in live))
+        self._email_lengths = array("i", (self._email_lengths[slot] for slot in live))
+        self._email_starts = starts
+        self._email_heap = heap
+        self._holes = 0
+        self._heap_garbage = 0
+        self._id_index.rebuild(range(len(live)), len(live))
+        with_email = [slot for slot in range(len(live)) if self._email_lengths[slot] != _NO_EMAIL]
+        self._email_index.rebuild(with_email, len(with_email))
+
+    def add(self, contact: Contact) -> None:
+        """Appends a contact to the columns, or overwrites it if the ID exists."""
+        key = contact.contact_id.bytes
+        slot = self._id_index.find(key)
+        if slot is not None:
+            self._write(slot, contact)
+            return
+        slot = len(self._names)
+        encoded = self._check_email(contact.email, slot)
+        self._ids += key
+        self._names.append(self._name_table.intern(contact.name))
+        self._email_starts.append(0)
+        self._email_lengths.append(_NO_EMAIL)
+        self._id_index.insert(key, slot)
+        self._set_email(slot, encoded)
+
+    def add_many(self, contacts: Iterable[Contact]) -> None:
+        """Appends a batch of contacts to the columns."""
+        for contact in contacts:
+            self.add(contact)
+
+    def get(self, contact_id: uuid.UUID) -> Optional[Contact]:
+        """Retrieves a contact by its ID through the ID hash table."""
+        slot = self._id_index.find(contact_id.bytes)
+        return self._contact_at(slot) if slot is not None else None
+
+    def find_by_email(self, email: str) -> Optional[Contact]:
+        """Retrieves a contact by email through the email hash table."""
+        slot = self._email_index.find(email.encode())
+        return self._contact_at(slot) if slot is not None else None
+
+    def email_exists(self, email: str) -> bool:
+        """Checks the email hash table for the given email."""
+        return self._email_index.find(email.encode()) is not None
+
+    def list(self) -> List[Contact]:
+        """Returns a list of all contacts."""
+        return list(self.iter_contacts())
+
+    def iter_contacts(self) -> Iterator[Contact]:
+        """
+        Yields every contact in insertion order, building each on demand.
+        The repository must not be modified while the iterator is in use.
+        """
+        for slot in self._live_slots():
+            yield self._contact_at(slot)
+
+    def list_page(self, offset: int, limit: int) -> List[Contact]:
+        """Returns a slice of the contacts in insertion order."""
+        if offset < 0 or limit < 0:
+            raise ValueError("Offset and limit must not be negative.")
+        return [self._contact_at(slot)
+                for slot in islice(self._live_slots(), offset, offset + limit)]
+
+    def list_after(self, cursor: Optional[uuid.UUID], limit: int) -> List[Contact]:
+        """Returns the contacts that follow `cursor`, starting from its slot."""
+        if limit < 0:
+            raise ValueError("Limit must not be negative.")
+        start = 0
+        if cursor is not None:
+            slot = self._id_index.find(cursor.bytes)
+            if slot is None:
+                raise ValueError("Contact not found.")
+            start = slot + 1
+        return [self._contact_at(slot)
+                for slot in islice(self._live_slots(start), limit)]
+
+    def delete(self, contact_id: uuid.UUID) -> None:
+        """
+        Deletes a contact, leaving a hole that is reclaimed by compaction.
+        Fails silently if the ID does not exist.
+        """
+        key = contact_id.bytes
+        slot = self._id_index.find(key)
+        if slot is None:
+            return
+        self._id_index.remove(key)
+        self._clear_email(slot)
+        self._name_table.release(self._names[slot])
+        self._names[slot] = _DELETED
+        self._holes += 1
+        self._maybe_compact()
+
+    def update(self, contact: Contact) -> None:
+        """
+        Updates a contact's name and email.
+        Does nothing if the ID does not exist.
+        """
+        slot = self._id_index.find(contact.contact_id.bytes)
+        if slot is not None:
+            self._write(slot, contact)
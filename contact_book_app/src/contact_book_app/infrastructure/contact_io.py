@@ -0,0 +1,244 @@
+# contact_book_app/src/infrastructure/contact_io.py
+"""
+This module contains streaming importers and exporters for contact files in
+CSV, vCard (3.0 and 4.0) and JSON Lines format.
+
+Readers and writers work on one record at a time, so files of any size are
+processed in constant memory. Files whose name ends in ".gz" are written
+gzip-compressed, and gzip-compressed input is detected automatically.
+"""
+import csv
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Callable, Dict, IO, Iterable, Iterator, List, Optional, Tuple, Union
+
+from ..domain.model import BulkAddError, ContactService
+from ..domain.repository import Contact
+
+Row = Tuple[str, Optional[str]]  # (name, email) as accepted by add_contacts_bulk
+Progress = Callable[[int], None]  # Called with the number of rows processed so far
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_EXTENSIONS = {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl", ".vcf": "vcard", ".vcard": "vcard"}
+
+
+@dataclass
+class TransferReport:
+    """The outcome of an import or export."""
+    rows: int = 0
+    added: int = 0  # Imports only
+    errors: List[BulkAddError] = field(default_factory=list)  # Imports only
+    seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+@dataclass
+class InvalidRow:
+    """A record a reader could not parse, yielded in place of its row."""
+    message: str
+
+
+def detect_format(path: str) -> str:
+    """Returns "csv", "jsonl" or "vcard" based on the file extension."""
+    root, extension = os.path.splitext(path.lower())
+    if extension == ".gz":
+        extension = os.path.splitext(root)[1]
+    try:
+        return _EXTENSIONS[extension]
+    except KeyError:
+        raise ValueError(f"Unknown contact file format: {path}") from None
+
+
+def open_text(path: str, mode: str) -> IO[str]:
+    """
+    Opens a file for reading ("r") or writing ("w") as UTF-8 text,
+    decompressing gzip input and compressing output to "*.gz" paths.
+    """
+    if mode == "r":
+        with open(path, "rb") as f:
+            compressed = f.read(2) == _GZIP_MAGIC
+    else:
+        compressed = path.lower().endswith(".gz")
+    if compressed:
+        import gzip  # Only imported, along with zlib, when a file needs it
+        return gzip.open(path, mode + "t", encoding="utf-8", newline="")
+    return open(path, mode, encoding="utf-8", newline="")
+
+
+def read_csv(stream: IO[str]) -> Iterator[Row]:
+    """Yields rows from CSV with a header containing "name" and optionally "email"."""
+    reader = csv.reader(stream)
+    header = [column.strip().lower() for column in next(reader, [])]
+    if "name" not in header:
+        raise ValueError("CSV header must contain a 'name' column.")
+    name_at = header.index("name")
+    email_at = header.index("email") if "email" in header else None
+    for record in reader:
+        if not record:
+            continue
+        name = record[name_at].strip() if name_at < len(record) else ""
+        email = record[email_at].strip() if email_at is not None and email_at < len(record) else ""
+        yield name, email or None
+
+
+def write_csv(stream: IO[str], contacts: Iterable[Contact]) -> Iterator[None]:
+    """Writes contacts as CSV, yielding once per contact written."""
+    writer = csv.writer(stream)
+    writer.writerow(["name", "email"])
+    for contact in contacts:
+        writer.writerow([contact.name, contact.email or ""])
+        yield
+
+
+def read_jsonl(stream: IO[str]) -> Iterator[Union[Row, InvalidRow]]:
+    """
+    Yields rows from JSON Lines objects with "name" and optional "email"
+    keys, and an InvalidRow for each line that is not a JSON object.
+    """
+    for line in stream:
+        if line.strip():
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                yield InvalidRow(f"Invalid JSON: {e.msg}.")
+                continue
+            if not isinstance(record, dict):
+                yield InvalidRow("Expected a JSON object.")
+                continue
+            yield str(record.get("name") or "").strip(), record.get("email") or None
+
+
+def write_jsonl(stream: IO[str], contacts: Iterable[Contact]) -> Iterator[None]:
+    """Writes contacts as JSON Lines, yielding once per contact written."""
+    for contact in contacts:
+        record = {"id": str(contact.contact_id), "name": contact.name, "email": contact.email}
+        stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+        yield
+
+
+def _vcard_unescape(value: str) -> str:
+    out, chars = [], iter(value)
+    for c in chars:
+        if c == "\\":
+            c = next(chars, "")
+            out.append("\n" if c in "nN" else c)
+        else:
+            out.append(c)
+    return "".join(out)
+
+
+def _vcard_escape(value: str) -> str:
+    return (value.replace("\\", "\\\\").replace(",", "\\,")
+            .replace(";", "\\;").replace("\n", "\\n"))
+
+
+def _unfolded_lines(stream: IO[str]) -> Iterator[str]:
+    """Joins vCard continuation lines (starting with a space or tab) to their line."""
+    pending = None
+    for raw in stream:
+        line = raw.rstrip("\r\n")
+        if line[:1] in (" ", "\t") and pending is not None:
+            pending += line[1:]
+            continue
+        if pending is not None:
+            yield pending
+        pending = line
+    if pending is not None:
+        yield pending
+
+
+def read_vcard(stream: IO[str]) -> Iterator[Row]:
+    """Yields a row per vCard, from its FN (or N) and first EMAIL property."""
+    card: Optional[Dict[str, str]] = None
+    for line in _unfolded_lines(stream):
+        key, _, value = line.partition(":")
+        prop = key.split(";", 1)[0].split(".")[-1].upper()  # Drop parameters and groups
+        if prop == "BEGIN" and value.upper() == "VCARD":
+            card = {}
+        elif prop == "END" and value.upper() == "VCARD" and card is not None:
+            name = card.get("FN") or " ".join(
+                part for part in reversed(card.get("N", "").split(";")[:2]) if part)
+            yield _vcard_unescape(name).strip(), _vcard_unescape(card.get("EMAIL", "")).strip() or None
+            card = None
+        elif card is not None and prop in ("FN", "N", "EMAIL"):
+            card.setdefault(prop, value)
+
+
+def write_vcard(stream: IO[str], contacts: Iterable[Contact], version: str = "4.0") -> Iterator[None]:
+    """Writes contacts as vCard 3.0 or 4.0, yielding once per contact written."""
+    if version not in ("3.0", "4.0"):
+        raise ValueError("vCard version must be 3.0 or 4.0.")
+    for contact in contacts:
+        given, _, family = contact.name.rpartition(" ")
+        lines = ["BEGIN:VCARD", f"VERSION:{version}",
+                 f"FN:{_vcard_escape(contact.name)}",
+                 f"N:{_vcard_escape(family)};{_vcard_escape(given)};;;"]
+        if version == "4.0":
+            lines.append(f"UID:urn:uuid:{contact.contact_id}")
+        else:
+            lines.append(f"UID:{contact.contact_id}")
+        if contact.email:
+            lines.append(f"EMAIL:{_vcard_escape(contact.email)}")
+        lines.append("END:VCARD")
+        stream.write("\r\n".join(lines) + "\r\n")
+        yield
+
+
+_READERS = {"csv": read_csv, "jsonl": read_jsonl, "vcard": read_vcard}
+_WRITERS = {"csv": write_csv, "jsonl": write_jsonl, "vcard": write_vcard}
+
+
+def import_contacts(service: ContactService, path: str, file_format: Optional[str] = None,
+                    batch_size: int = 10_000, progress: Optional[Progress] = None) -> TransferReport:
+    """
+    Streams contacts from a file into the service, one add_contacts_bulk()
+    call per `batch_size` rows. Rejected rows, and records the reader could
+    not parse, are collected in the report with their row number in the
+    file rather than aborting the import.
+    """
+    reader = _READERS[file_format or detect_format(path)]
+    report = TransferReport()
+    start = time.perf_counter()
+    with open_text(path, "r") as stream:
+        rows = reader(stream)
+        while True:
+            batch = list(islice(rows, batch_size))
+            if not batch:
+                break
+            # Row numbers in the file of the rows passed on, which add_contacts_bulk() counts from 1.
+            numbers = [report.rows + i for i, row in enumerate(batch, 1) if not isinstance(row, InvalidRow)]
+            result = service.add_contacts_bulk(row for row in batch if not isinstance(row, InvalidRow))
+            for error in result.errors:
+                error.row = numbers[error.row - 1]
+            errors = [BulkAddError(row=report.rows + i, name="", email=None, message=row.message)
+                      for i, row in enumerate(batch, 1) if isinstance(row, InvalidRow)]
+            report.errors.extend(sorted(result.errors + errors, key=lambda error: error.row))
+            report.added += len(result.added)
+            report.rows += len(batch)
+            if progress is not None:
+                progress(report.rows)
+    report.seconds = time.perf_counter() - start
+    return report
+
+
+def export_contacts(service: ContactService, path: str, file_format: Optional[str] = None,
+                    progress: Optional[Progress] = None, progress_every: int = 10_000) -> TransferReport:
+    """Streams every contact in the service to a file."""
+    writer = _WRITERS[file_format or detect_format(path)]
+    report = TransferReport()
+    start = time.perf_counter()
+    with open_text(path, "w") as stream:
+        for _ in writer(stream, service.iter_contacts()):
+            report.rows += 1
+            if progress is not None and report.rows % progress_every == 0:
+                progress(report.rows)
+    if progress is not None:
+        progress(report.rows)
+    report.seconds = time.perf_counter() - start
+    return report
@@ -0,0 +1,249 @@
+# contact_book_app/src/infrastructure/durable_repository.py
+"""
+This module contains a durable variant of the in-memory Contact Repository.
+
+Contacts are still served from memory, but every change is appended to a
+write-ahead log in a directory, and the full state is periodically written
+to a snapshot so that the log can be truncated. On startup the latest
+snapshot is loaded and the log records written after it are replayed.
+"""
+import json
+import mmap
+import os
+import threading
+import time
+import uuid
+import weakref
+from typing import Any, Iterable, List, Sequence
+
+from ..domain.repository import Contact
+from .in_memory_repository import InMemoryContactRepository
+
+_LOG_NAME = "contacts.log"
+_SNAPSHOT_NAME = "contacts.snapshot"
+
+
+def _encode(record: Any) -> bytes:
+    """Serializes one log or snapshot record as a compact JSON line."""
+    return json.dumps(record, separators=(",", ":"), ensure_ascii=False).encode() + b"\n"
+
+
+class DurableContactRepository(InMemoryContactRepository):
+    """
+    An InMemoryContactRepository whose changes survive a restart.
+
+    Each add, update and delete is appended to a JSON-lines log as
+    [seq, op, id, name, email], and the changes of an apply_changes() batch
+    together as one [seq, "batch", [[op, id, name, email], ...]] record.
+    Every record is handed to the operating system as it is appended, so
+    it survives the process crashing. Against the machine crashing, writes
+    are made durable in groups: the log is fsynced once `sync_every`
+    records are pending, and a background thread fsyncs pending records
+    `sync_interval` seconds after the last fsync even if no further write
+    arrives, so a crash can lose at most that window of recent changes.
+    Call sync() to make every change so far durable immediately.
+
+    After `snapshot_every` logged changes the whole book is written to a
+    snapshot (atomically replaced via rename) and the log is truncated.
+    Snapshots are loaded through a read-only memory map, and log records
+    already covered by the snapshot are skipped by sequence number.
+    """
+
+    def __init__(self, directory: str, sync_every: int = 100, sync_interval: float = 0.1,
+                 snapshot_every: int = 100_000) -> None:
+        super().__init__()
+        os.makedirs(directory, exist_ok=True)
+        self._log_path = os.path.join(directory, _LOG_NAME)
+        self._snapshot_path = os.path.join(directory, _SNAPSHOT_NAME)
+        self._sync_every = sync_every
+        self._sync_interval = sync_interval
+        self._snapshot_every = snapshot_every
+        self._seq = self._load_snapshot()
+        self._replay_log()
+        self._log = open(self._log_path, "ab")
+        self._unsynced = 0
+        self._since_snapshot = 0
+        self._last_sync = time.monotonic()
+        self._log_lock = threading.Lock()  # Shared with the sync thread
+        self._closed = threading.Event()
+        # The thread holds a weak reference, so an unclosed repository can
+        # still be collected; the thread then exits at its next wake-up.
+        threading.Thread(target=self._sync_periodically, args=(weakref.ref(self), self._closed),
+                         name="durable-log-sync", daemon=True).start()
+
+    @staticmethod
+    def _sync_periodically(ref: "weakref.ref[DurableContactRepository]",
+                           closed: threading.Event) -> None:
+        """Fsyncs records left pending for `sync_interval` seconds."""
+        while True:
+            repo = ref()
+            if repo is None:
+                return
+            interval = repo._sync_interval
+            del repo
+            if closed.wait(interval):
+                return
+            repo = ref()
+            if repo is None:
+                return
+            with repo._log_lock:
+                if (not closed.is_set() and repo._unsynced
+                        and time.monotonic() - repo._last_sync >= interval):
+                    repo._fsync()
+            del repo
+
+    def _load_snapshot(self) -> int:
+        """Loads the snapshot, if any, and returns the sequence number it covers."""
+        if not os.path.exists(self._snapshot_path) or os.path.getsize(self._snapshot_path) == 0:
+            return 0
+        with open(self._snapshot_path, "rb") as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            seq = json.loads(data.readline())["seq"]
+            contacts = []
+            for line in iter(data.readline, b""):
+                contact_id, name, email = json.loads(line)
+                contacts.append(Contact(contact_id=uuid.UUID(hex=contact_id), name=name, email=email))
+        InMemoryContactRepository.add_many(self, contacts)
+        return seq
+
+    def _replay_log(self) -> None:
+        """
+        Applies the log records newer than the snapshot. A torn record left
+        by a crash during a write ends the log and is cut off.
+        """
+        if not os.path.exists(self._log_path):
+            return
+        valid_length = 0
+        with open(self._log_path, "rb") as f:
+            for line in f:
+                try:
+                    record = json.loads(line) if line.endswith(b"\n") else None
+                except ValueError:
+                    record = None
+                if record is None:
+                    break
+                valid_length += len(line)
+                if record[0] > self._seq:
+                    self._apply(record)
+                    self._seq = record[0]
+        if valid_length < os.path.getsize(self._log_path):
+            os.truncate(self._log_path, valid_length)
+
+    def _apply(self, record: List[Any]) -> None:
+        """Applies one log record to memory without logging it again."""
+        if record[1] == "batch":
+            for change in record[2]:
+                self._apply(record[:1] + change)
+            return
+        op, contact_id = record[1], uuid.UUID(hex=record[2])
+        if op == "delete":
+            InMemoryContactRepository.delete(self, contact_id)
+            return
+        contact = Contact(contact_id=contact_id, name=record[3], email=record[4])
+        if op == "add":
+            InMemoryContactRepository.add(self, contact)
+        else:
+            InMemoryContactRepository.update(self, contact)
+
+    def _append(self, records: Iterable[List[Any]]) -> None:
+        """
+        Appends records to the log and flushes them to the operating
+        system, then syncs or snapshots when due.
+        """
+        with self._log_lock:
+            count = 0
+            for record in records:
+                self._seq += 1
+                self._log.write(_encode([self._seq] + record))
+                count += 1
+            self._log.flush()
+            self._unsynced += count
+            self._since_snapshot += count
+            if self._since_snapshot >= self._snapshot_every:
+                self._snapshot()
+            elif (self._unsynced >= self._sync_every
+                  or time.monotonic() - self._last_sync >= self._sync_interval):
+                self._fsync()
+
+    def sync(self) -> None:
+        """Makes every logged change durable with a single fsync."""
+        with self._log_lock:
+            self._fsync()
+
+    def _fsync(self) -> None:
+        self._log.flush()
+        os.fsync(self._log.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def snapshot(self) -> None:
+        """Writes the whole book to a new snapshot and truncates the log."""
+        with self._log_lock:
+            self._snapshot()
+
+    def _snapshot(self) -> None:
+        temporary = self._snapshot_path + ".tmp"
+        with open(temporary, "wb") as f:
+            f.write(_encode({"seq": self._seq, "count": len(self._contacts)}))
+            for contact in self._contacts.values():
+                f.write(_encode([contact.contact_id.hex, contact.name, contact.email]))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary, self._snapshot_path)
+        # Records up to self._seq are now covered by the snapshot, so a crash
+        # before the truncation below only leaves records that are skipped.
+        self._log.close()
+        self._log = open(self._log_path, "wb")
+        self._unsynced = 0
+        self._since_snapshot = 0
+        self._last_sync = time.monotonic()
+
+    def close(self) -> None:
+        """Makes pending changes durable and closes the log."""
+        with self._log_lock:
+            self._closed.set()
+            self._fsync()
+            self._log.close()
+
+    def add(self, contact: Contact) -> None:
+        """Adds a contact and logs the change."""
+        super().add(contact)
+        self._append([["add", contact.contact_id.hex, contact.name, contact.email]])
+
+    def add_many(self, contacts: Iterable[Contact]) -> None:
+        """Adds a batch of contacts and logs them as one group."""
+        batch = list(contacts)
+        super().add_many(batch)
+        self._append(["add", c.contact_id.hex, c.name, c.email] for c in batch)
+
+    def delete(self, contact_id: uuid.UUID) -> None:
+        """Deletes a contact and logs the change if it existed."""
+        if contact_id in self._contacts:
+            super().delete(contact_id)
+            self._append([["delete", contact_id.hex]])
+
+    def update(self, contact: Contact) -> None:
+        """Updates a contact and logs the change if it exists."""
+        if contact.contact_id in self._contacts:
+            super().update(contact)
+            self._append([["update", contact.contact_id.hex, contact.name, contact.email]])
+
+    def apply_changes(self, added: Sequence[Contact], updated: Sequence[Contact],
+                      deleted: Sequence[uuid.UUID]) -> None:
+        """
+        Applies a batch of changes and logs it as a single "batch" record,
+        so that after a crash the batch is replayed either whole or not at all.
+        """
+        records: List[List[Any]] = []
+        for contact_id in deleted:
+            if contact_id in self._contacts:
+                InMemoryContactRepository.delete(self, contact_id)
+                records.append(["delete", contact_id.hex])
+        for contact in updated:
+            if contact.contact_id in self._contacts:
+                InMemoryContactRepository.update(self, contact)
+                records.append(["update", contact.contact_id.hex, contact.name, contact.email])
+        InMemoryContactRepository.add_many(self, added)
+        records.extend(["add", c.contact_id.hex, c.name, c.email] for c in added)
+        if records:
+            self._append([["batch", records]])
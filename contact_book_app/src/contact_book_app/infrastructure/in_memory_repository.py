@@ -4,37 +4,187 @@ This module contains the concrete implementation of the Contact Repository
 using a simple in-memory dictionary as the data store.
 """
 import uuid
-from typing import Dict, List, Optional
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
 
+from ..domain.handles import MIN_HANDLE_LENGTH
 from ..domain.repository import AbstractContactRepository, Contact
+from .search_index import ContactSearchIndex
+
+# Bits of an ID that key the prefix index: its first MIN_HANDLE_LENGTH hex digits.
+_PREFIX_SHIFT = 128 - 4 * MIN_HANDLE_LENGTH
 
 class InMemoryContactRepository(AbstractContactRepository):
     """
     Concrete repository implementation that stores contacts in memory.
     Ideal for testing and simple applications.
+
+    A secondary hash index maps each email address to its owner's ID so
+    that email lookups do not need to scan every stored contact, and an
+    insertion-order slot list lets list_after() resume from a cursor
+    without walking the contacts that precede it. A bucket index of IDs by
+    their leading hex digits for handle lookups is maintained alongside both.
+
+    With `searchable=True` a search index over names and emails answers
+    search() too. It costs a few kilobytes per contact, so it is off by
+    default and search() scans every contact instead.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, searchable: bool = False) -> None:
         self._contacts: Dict[uuid.UUID, Contact] = {}
+        # email -> contact_id, plus the reverse mapping. The reverse map is
+        # needed because callers may mutate a stored Contact in place before
+        # calling update(), so the old email cannot be read back from it.
+        self._email_index: Dict[str, uuid.UUID] = {}
+        self._indexed_emails: Dict[uuid.UUID, str] = {}
+        # Contact IDs in insertion order. Deleted entries are left as None
+        # holes and compacted once they make up half of the list.
+        self._order: List[Optional[uuid.UUID]] = []
+        self._positions: Dict[uuid.UUID, int] = {}
+        self._holes = 0
+        self._search_index = ContactSearchIndex() if searchable else None
+        self._id_buckets: Dict[int, List[uuid.UUID]] = {}
+
+    def _append_order(self, contact_id: uuid.UUID) -> None:
+        """Records a newly stored contact at the end of the listing order."""
+        if contact_id not in self._positions:
+            self._positions[contact_id] = len(self._order)
+            self._order.append(contact_id)
+
+    def _remove_order(self, contact_id: uuid.UUID) -> None:
+        """Leaves a hole for a deleted contact, compacting when sparse."""
+        self._order[self._positions.pop(contact_id)] = None
+        self._holes += 1
+        if self._holes * 2 > len(self._order):
+            # The dict preserves insertion order, so it is the compacted list.
+            self._order = list(self._contacts)
+            self._positions = {cid: i for i, cid in enumerate(self._order)}
+            self._holes = 0
+
+    def _index_id(self, contact_id: uuid.UUID) -> None:
+        """Files a new ID in the prefix index."""
+        self._id_buckets.setdefault(contact_id.int >> _PREFIX_SHIFT, []).append(contact_id)
+
+    def _unindex_id(self, contact_id: uuid.UUID) -> None:
+        """Removes an ID from the prefix index."""
+        key = contact_id.int >> _PREFIX_SHIFT
+        bucket = self._id_buckets[key]
+        bucket.remove(contact_id)
+        if not bucket:
+            del self._id_buckets[key]
+
+    def _index_email(self, contact: Contact) -> None:
+        """Points the email index at the contact's current email."""
+        self._unindex_email(contact.contact_id)
+        if contact.email:
+            self._email_index[contact.email] = contact.contact_id
+            self._indexed_emails[contact.contact_id] = contact.email
+
+    def _unindex_email(self, contact_id: uuid.UUID) -> None:
+        """Removes whatever email is currently indexed for the given ID."""
+        old_email = self._indexed_emails.pop(contact_id, None)
+        if old_email is not None and self._email_index.get(old_email) == contact_id:
+            del self._email_index[old_email]
 
     def add(self, contact: Contact) -> None:
         """Adds a contact to the in-memory dictionary."""
+        if contact.contact_id not in self._contacts:
+            self._index_id(contact.contact_id)
         self._contacts[contact.contact_id] = contact
+        self._index_email(contact)
+        self._append_order(contact.contact_id)
+        if self._search_index is not None:
+            self._search_index.add(contact)
+
+    def add_many(self, contacts: Iterable[Contact]) -> None:
+        """Adds a batch of contacts to the dictionary and the email index."""
+        store = self._contacts
+        search_index = self._search_index
+        for contact in contacts:
+            if contact.contact_id not in store:
+                self._index_id(contact.contact_id)
+            store[contact.contact_id] = contact
+            self._index_email(contact)
+            self._append_order(contact.contact_id)
+            if search_index is not None:
+                search_index.add(contact)
 
     def get(self, contact_id: uuid.UUID) -> Optional[Contact]:
         """Retrieves a contact by its ID from the dictionary."""
         return self._contacts.get(contact_id)
 
+    def find_by_email(self, email: str) -> Optional[Contact]:
+        """Retrieves a contact by email using the secondary index."""
+        contact_id = self._email_index.get(email)
+        if contact_id is None:
+            return None
+        return self._contacts.get(contact_id)
+
+    def email_exists(self, email: str) -> bool:
+        """Checks the secondary index for the given email."""
+        return email in self._email_index
+
+    def find_by_id_prefix(self, prefix: str, limit: int) -> List[Contact]:
+        """Looks up an ID prefix in the bucket of IDs sharing its leading digits."""
+        if len(prefix) < MIN_HANDLE_LENGTH:
+            return super().find_by_id_prefix(prefix, limit)
+        bucket = self._id_buckets.get(int(prefix[:MIN_HANDLE_LENGTH], 16), ())
+        return [self._contacts[contact_id] for contact_id in bucket
+                if contact_id.hex.startswith(prefix)][:limit]
+
     def list(self) -> List[Contact]:
         """Returns a list of all contacts."""
         return list(self._contacts.values())
 
+    def iter_contacts(self) -> Iterator[Contact]:
+        """
+        Yields every contact in insertion order without copying the store.
+        The repository must not be modified while the iterator is in use.
+        """
+        yield from self._contacts.values()
+
+    def list_page(self, offset: int, limit: int) -> List[Contact]:
+        """Returns a slice of the contacts in insertion order."""
+        if offset < 0 or limit < 0:
+            raise ValueError("Offset and limit must not be negative.")
+        return list(islice(self._contacts.values(), offset, offset + limit))
+
+    def list_after(self, cursor: Optional[uuid.UUID], limit: int) -> List[Contact]:
+        """Returns the contacts that follow `cursor` using the slot list."""
+        if limit < 0:
+            raise ValueError("Limit must not be negative.")
+        if cursor is None:
+            position = 0
+        elif cursor in self._positions:
+            position = self._positions[cursor] + 1
+        else:
+            raise ValueError("Contact not found.")
+        page: List[Contact] = []
+        order = self._order
+        while len(page) < limit and position < len(order):
+            contact_id = order[position]
+            if contact_id is not None:
+                page.append(self._contacts[contact_id])
+            position += 1
+        return page
+
+    def search(self, query: str, limit: int) -> List[Contact]:
+        """Answers a search from the search index, or by a scan without one."""
+        if self._search_index is None:
+            return super().search(query, limit)
+        return [self._contacts[contact_id] for contact_id in self._search_index.search(query, limit)]
+
     def delete(self, contact_id: uuid.UUID) -> None:
         """
         Deletes a contact from the in-memory dictionary.
         Fails silently if the ID does not exist.
         """
-        self._contacts.pop(contact_id, None)
+        if self._contacts.pop(contact_id, None) is not None:
+            self._unindex_email(contact_id)
+            self._unindex_id(contact_id)
+            self._remove_order(contact_id)
+            if self._search_index is not None:
+                self._search_index.remove(contact_id)
 
     def update(self, contact: Contact) -> None:
         """
@@ -42,4 +192,20 @@ class InMemoryContactRepository(AbstractContactRepository):
         Assumes the contact ID already exists.
         """
         if contact.contact_id in self._contacts:
-            self._contacts[contact.contact_id] = contact
\ No newline at end of file
+            self._contacts[contact.contact_id] = contact
+            self._index_email(contact)
+            if self._search_index is not None:
+                self._search_index.add(contact)
+
+    def apply_changes(self, added: Sequence[Contact], updated: Sequence[Contact],
+                      deleted: Sequence[uuid.UUID]) -> None:
+        """
+        Applies the batch in one pass. The email index only forgets an
+        address if it still points at the contact giving it up, so contacts
+        can swap emails without clearing them first.
+        """
+        for contact_id in deleted:
+            self.delete(contact_id)
+        for contact in updated:
+            self.update(contact)
+        self.add_many(added)
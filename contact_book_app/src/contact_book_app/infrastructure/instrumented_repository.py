@@ -0,0 +1,84 @@
+# contact_book_app/src/infrastructure/instrumented_repository.py
+"""
+This module contains a decorator that times every call made to a Contact
+Repository and reports it to a metrics sink.
+"""
+import time
+import uuid
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Sequence
+
+from ..domain.metrics import MetricsSink
+from ..domain.repository import AbstractContactRepository, Contact
+
+
+class InstrumentedContactRepository(AbstractContactRepository):
+    """
+    Wraps a repository and observes the latency of each call as
+    "contact_repository_seconds", labelled with the method name and the
+    wrapped repository's class. Calls that raise are timed too.
+
+    iter_contacts() is passed through untimed, since its cost is spread
+    over however long the caller takes to consume it.
+    """
+
+    def __init__(self, inner: AbstractContactRepository, metrics: MetricsSink) -> None:
+        self._inner = inner
+        self._metrics = metrics
+        self._backend = type(inner).__name__
+
+    def close(self) -> None:
+        """Closes the wrapped repository if it can be closed, e.g. a database."""
+        close = getattr(self._inner, "close", None)
+        if close is not None:
+            close()
+
+    def _call(self, method: str, function: Callable[..., Any], *args: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            return function(*args)
+        finally:
+            self._metrics.observe("contact_repository_seconds", time.perf_counter() - start,
+                                  method=method, backend=self._backend)
+
+    def add(self, contact: Contact) -> None:
+        self._call("add", self._inner.add, contact)
+
+    def add_many(self, contacts: Iterable[Contact]) -> None:
+        self._call("add_many", self._inner.add_many, contacts)
+
+    def get(self, contact_id: uuid.UUID) -> Optional[Contact]:
+        return self._call("get", self._inner.get, contact_id)
+
+    def find_by_email(self, email: str) -> Optional[Contact]:
+        return self._call("find_by_email", self._inner.find_by_email, email)
+
+    def email_exists(self, email: str) -> bool:
+        return self._call("email_exists", self._inner.email_exists, email)
+
+    def find_by_id_prefix(self, prefix: str, limit: int) -> List[Contact]:
+        return self._call("find_by_id_prefix", self._inner.find_by_id_prefix, prefix, limit)
+
+    def list(self) -> List[Contact]:
+        return self._call("list", self._inner.list)
+
+    def iter_contacts(self) -> Iterator[Contact]:
+        return self._inner.iter_contacts()
+
+    def list_page(self, offset: int, limit: int) -> List[Contact]:
+        return self._call("list_page", self._inner.list_page, offset, limit)
+
+    def list_after(self, cursor: Optional[uuid.UUID], limit: int) -> List[Contact]:
+        return self._call("list_after", self._inner.list_after, cursor, limit)
+
+    def search(self, query: str, limit: int) -> List[Contact]:
+        return self._call("search", self._inner.search, query, limit)
+
+    def delete(self, contact_id: uuid.UUID) -> None:
+        self._call("delete", self._inner.delete, contact_id)
+
+    def update(self, contact: Contact) -> None:
+        self._call("update", self._inner.update, contact)
+
+    def apply_changes(self, added: Sequence[Contact], updated: Sequence[Contact],
+                      deleted: Sequence[uuid.UUID]) -> None:
+        self._call("apply_changes", self._inner.apply_changes, added, updated, deleted)
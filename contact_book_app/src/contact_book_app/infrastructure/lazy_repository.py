@@ -0,0 +1,120 @@
+# contact_book_app/src/infrastructure/lazy_repository.py
+"""
+This module contains a decorator that defers creating a Contact Repository
+until it is first used, or creates it on a background thread, so that an
+application can start before its backend has been opened and loaded.
+"""
+import threading
+import uuid
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence
+
+from ..domain.repository import AbstractContactRepository, Contact
+
+
+class LazyContactRepository(AbstractContactRepository):
+    """
+    Wraps a factory that creates the real repository, e.g. by opening a
+    database, and delegates every call to what it created.
+
+    The factory runs on the first call, or earlier on a background thread
+    once start() is called (or with `background=True`); a call made while
+    it runs waits for it. If the factory raises, every later call raises
+    the same error. The repository must tolerate being created on one
+    thread and used from another, e.g. SQLite with check_same_thread=False.
+    """
+
+    def __init__(self, factory: Callable[[], AbstractContactRepository],
+                 background: bool = False) -> None:
+        self._factory = factory
+        self._inner: Optional[AbstractContactRepository] = None
+        self._error: Optional[BaseException] = None
+        self._lock = threading.Lock()  # Held while the factory runs
+        self._thread: Optional[threading.Thread] = None
+        if background:
+            self.start()
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the repository has been created."""
+        return self._inner is not None
+
+    def start(self) -> None:
+        """Starts creating the repository on a background thread, if not started yet."""
+        if self._thread is None and self._inner is None:
+            self._thread = threading.Thread(target=self._load_in_background,
+                                            name="repository-loader", daemon=True)
+            self._thread.start()
+
+    def _load_in_background(self) -> None:
+        try:
+            self._load()
+        except Exception:
+            pass  # Kept in self._error and raised to the first caller
+
+    def _load(self) -> AbstractContactRepository:
+        """Returns the repository, creating it unless another thread already is."""
+        with self._lock:
+            if self._inner is None:
+                if self._error is not None:
+                    raise self._error
+                try:
+                    self._inner = self._factory()
+                except Exception as e:
+                    self._error = e
+                    raise
+            return self._inner
+
+    def _repo(self) -> AbstractContactRepository:
+        inner = self._inner
+        return inner if inner is not None else self._load()
+
+    def close(self) -> None:
+        """Waits for a background load and closes the repository if it can be closed."""
+        if self._thread is not None:
+            self._thread.join()
+        close = getattr(self._inner, "close", None)
+        if close is not None:
+            close()
+
+    def add(self, contact: Contact) -> None:
+        self._repo().add(contact)
+
+    def add_many(self, contacts: Iterable[Contact]) -> None:
+        self._repo().add_many(contacts)
+
+    def get(self, contact_id: uuid.UUID) -> Optional[Contact]:
+        return self._repo().get(contact_id)
+
+    def find_by_email(self, email: str) -> Optional[Contact]:
+        return self._repo().find_by_email(email)
+
+    def email_exists(self, email: str) -> bool:
+        return self._repo().email_exists(email)
+
+    def find_by_id_prefix(self, prefix: str, limit: int) -> List[Contact]:
+        return self._repo().find_by_id_prefix(prefix, limit)
+
+    def list(self) -> List[Contact]:
+        return self._repo().list()
+
+    def iter_contacts(self) -> Iterator[Contact]:
+        return self._repo().iter_contacts()
+
+    def list_page(self, offset: int, limit: int) -> List[Contact]:
+        return self._repo().list_page(offset, limit)
+
+    def list_after(self, cursor: Optional[uuid.UUID], limit: int) -> List[Contact]:
+        return self._repo().list_after(cursor, limit)
+
+    def search(self, query: str, limit: int) -> List[Contact]:
+        return self._repo().search(query, limit)
+
+    def delete(self, contact_id: uuid.UUID) -> None:
+        self._repo().delete(contact_id)
+
+    def update(self, contact: Contact) -> None:
+        self._repo().update(contact)
+
+    def apply_changes(self, added: Sequence[Contact], updated: Sequence[Contact],
+                      deleted: Sequence[uuid.UUID]) -> None:
+        self._repo().apply_changes(added, updated, deleted)
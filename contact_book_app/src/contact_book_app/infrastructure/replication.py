@@ -0,0 +1,314 @@
+# contact_book_app/src/infrastructure/replication.py
+"""
+This module replicates a contact book from the one process that writes it
+to read-only copies in other processes.
+
+A ReplicationPublisher observes the writer's ContactService and sends
+every change, numbered in sequence, to the replicas connected to it over
+a local socket. A ReplicaContactRepository keeps an in-memory copy that it
+first fills from a snapshot and then keeps up to date from those changes,
+so lookups can be served by as many reader processes as there are cores.
+"""
+import logging
+import threading
+import uuid
+from collections import deque
+from multiprocessing.connection import Client, Connection, Listener
+from typing import Any, Deque, Iterable, List, Optional, Sequence, Tuple
+
+from ..domain.events import ChangeEvent, ContactAdded, ContactDeleted
+from ..domain.observer import Observer
+from ..domain.repository import Contact
+from .in_memory_repository import InMemoryContactRepository
+from .thread_safe_repository import ThreadSafeContactRepository
+
+logger = logging.getLogger(__name__)
+
+# A change as sent to replicas: (op, id as int, name, email), op being
+# "add", "update" or "delete" (with name and email None).
+Record = Tuple[str, int, Optional[str], Optional[str]]
+
+# Messages from the publisher to a replica:
+#   ("snapshot", epoch, seq, rows, last) - part of the book as of seq;
+#       rows are (id as int, name, email) and the last part has last=True
+#   ("changes", epoch, seq, records) - the changes made by one notification
+# A replica opens with ("hello", epoch, seq): the last state it applied.
+
+
+def _records(events: Sequence[ChangeEvent]) -> List[Record]:
+    records: List[Record] = []
+    for event in events:
+        contact = event.contact
+        if isinstance(event, ContactDeleted):
+            records.append(("delete", contact.contact_id.int, None, None))
+        else:
+            op = "add" if isinstance(event, ContactAdded) else "update"
+            records.append((op, contact.contact_id.int, contact.name, contact.email))
+    return records
+
+
+class ReplicationPublisher(Observer):
+    """
+    Publishes the changes made through a ContactService to replicas.
+
+    Listens on `address` (a Unix socket path, or a (host, port) pair; by
+    default a fresh Unix socket) and attaches itself to the service. Each
+    notification becomes one "changes" message with the next sequence
+    number, sent to every connected replica and kept in a backlog of the
+    last `backlog` messages. A connecting replica is sent the backlog
+    messages it missed if they are all still there, and otherwise a
+    snapshot of the whole book followed by live changes.
+
+    Messages are sent from the thread that notifies, so a replica that
+    stops reading eventually blocks the writer; give the service a
+    BackgroundObservable to keep replication off the write path.
+    Snapshots are read on the publisher's own thread, so the service's
+    repository must be safe to read while it is written, e.g. a
+    ThreadSafeContactRepository. A change made while a snapshot is read
+    may reach a replica twice, which is harmless as applying a change is
+    idempotent. Connections are authenticated with `authkey`.
+    """
+
+    def __init__(self, service: Any, address: Optional[Any] = None, authkey: bytes = b"contacts",
+                 backlog: int = 10_000, snapshot_chunk: int = 10_000) -> None:
+        self._service = service
+        self._listener = Listener(address, authkey=authkey)
+        self._authkey = authkey
+        self._lock = threading.Lock()  # Orders sends and sequence numbers
+        self._epoch = uuid.uuid4().hex  # Tells replicas when a different writer took over
+        self._seq = 0
+        self._backlog: Deque[Tuple[int, List[Record]]] = deque(maxlen=backlog)
+        self._subscribers: List[Connection] = []
+        self._snapshot_chunk = snapshot_chunk
+        self._closed = False
+        self._thread = threading.Thread(target=self._accept, name="replication-publisher",
+                                        daemon=True)
+        self._thread.start()
+        service.attach(self)
+
+    @property
+    def address(self) -> Any:
+        """The address replicas connect to."""
+        return self._listener.address
+
+    @property
+    def sequence(self) -> int:
+        """The sequence number of the last change published."""
+        return self._seq
+
+    def close(self) -> None:
+        """Detaches from the service and disconnects every replica."""
+        self._service.detach(self)
+        with self._lock:
+            self._closed = True
+            for connection in self._subscribers:
+                connection.close()
+            self._subscribers.clear()
+        # Closing the listener does not interrupt a blocked accept(), so
+        # wake the accepting thread with a connection of our own.
+        Client(self.address, authkey=self._authkey).close()
+        self._thread.join()
+        self._listener.close()
+
+    def update(self, subject: Any, events: Sequence[ChangeEvent] = ()) -> None:
+        """Numbers the changes and sends them to every connected replica."""
+        with self._lock:
+            if not events:
+                # The change is unknown, so replicas must start over from a
+                # snapshot: forget the history and drop their connections.
+                self._epoch = uuid.uuid4().hex
+                self._backlog.clear()
+                for connection in self._subscribers:
+                    connection.close()
+                self._subscribers.clear()
+                return
+            self._seq += 1
+            records = _records(events)
+            self._backlog.append((self._seq, records))
+            self._broadcast(("changes", self._epoch, self._seq, records))
+
+    def _broadcast(self, message: Tuple[Any, ...]) -> None:
+        """Sends a message to every replica, dropping those that disconnected."""
+        alive = []
+        for connection in self._subscribers:
+            try:
+                connection.send(message)
+            except OSError:
+                connection.close()
+            else:
+                alive.append(connection)
+        self._subscribers = alive
+
+    def _accept(self) -> None:
+        """Accepts replicas until the publisher is closed."""
+        while True:
+            try:
+                connection = self._listener.accept()
+            except Exception:  # A failed handshake only loses that replica
+                logger.exception("Replica connection failed")
+                continue
+            if self._closed:
+                connection.close()
+                return
+            try:
+                self._subscribe(connection)
+            except (OSError, EOFError):
+                connection.close()
+
+    def _subscribe(self, connection: Connection) -> None:
+        """Brings a new replica up to date and adds it to the subscribers."""
+        _, epoch, seq = connection.recv()
+        with self._lock:
+            if self._closed:
+                connection.close()
+                return
+            backlog = self._backlog
+            if epoch == self._epoch and seq == self._seq:
+                pass  # Already up to date
+            elif epoch == self._epoch and backlog and backlog[0][0] <= seq + 1 <= self._seq:
+                for message_seq, records in backlog:
+                    if message_seq > seq:
+                        connection.send(("changes", self._epoch, message_seq, records))
+            else:
+                self._send_snapshot(connection)
+            self._subscribers.append(connection)
+
+    def _send_snapshot(self, connection: Connection) -> None:
+        """
+        Sends the whole book in chunks. Called under the lock, so no change
+        is published until the snapshot has been sent.
+        """
+        rows: List[Tuple[int, str, Optional[str]]] = []
+        for contact in self._service.iter_contacts():
+            rows.append((contact.contact_id.int, contact.name, contact.email))
+            if len(rows) >= self._snapshot_chunk:
+                connection.send(("snapshot", self._epoch, self._seq, rows, False))
+                rows = []
+        connection.send(("snapshot", self._epoch, self._seq, rows, True))
+
+
+class ReplicaContactRepository(ThreadSafeContactRepository):
+    """
+    A read-only, in-memory copy of a book published by a
+    ReplicationPublisher, safe to read from many threads.
+
+    The constructor connects to the publisher at `address` and returns once
+    the copy has caught up (or raises TimeoutError after `timeout`
+    seconds). A background thread then applies each published message
+    under the write lock, so readers see every notification's changes all
+    at once or not at all. A snapshot is loaded into a fresh repository and
+    swapped in whole. If the connection drops, the replica keeps serving
+    its copy and reconnects every `retry` seconds, asking for the changes
+    it missed.
+
+    Replicas trail the writer by however long a message takes to arrive;
+    use wait_for() with the publisher's sequence number to read a write
+    that is known to have been made. Writes raise ValueError.
+    """
+
+    def __init__(self, address: Any, authkey: bytes = b"contacts", timeout: float = 10.0,
+                 retry: float = 0.5) -> None:
+        super().__init__(InMemoryContactRepository())
+        self._address = address
+        self._authkey = authkey
+        self._retry = retry
+        self._epoch: Optional[str] = None
+        self._seq = 0
+        self._applied = threading.Condition()
+        self._loading: Optional[InMemoryContactRepository] = None  # A snapshot being received
+        self._closed = threading.Event()
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=self._follow, name="replica", daemon=True)
+        self._thread.start()
+        if not self._ready.wait(timeout):
+            self.close()
+            raise TimeoutError("Replica did not catch up with the publisher in time.")
+
+    @property
+    def sequence(self) -> int:
+        """The sequence number of the last change applied."""
+        return self._seq
+
+    def wait_for(self, sequence: int, timeout: Optional[float] = None) -> bool:
+        """Waits until the change numbered `sequence` is applied; returns False on timeout."""
+        with self._applied:
+            return self._applied.wait_for(lambda: self._seq >= sequence, timeout)
+
+    def close(self) -> None:
+        """Stops following the publisher. The copy can still be read."""
+        self._closed.set()
+        self._thread.join()
+
+    def _follow(self) -> None:
+        """Connects to the publisher and applies its messages, reconnecting as needed."""
+        while not self._closed.is_set():
+            connection: Optional[Connection] = None
+            try:
+                connection = Client(self._address, authkey=self._authkey)
+                connection.send(("hello", self._epoch, self._seq))
+                self._loading = None
+                # Poll rather than block, to notice close() between messages.
+                while not self._closed.is_set():
+                    if connection.poll(self._retry):
+                        self._receive(connection.recv())
+            except (OSError, EOFError):
+                pass
+            finally:
+                if connection is not None:
+                    connection.close()
+            if self._closed.wait(self._retry):
+                return
+
+    def _receive(self, message: Tuple[Any, ...]) -> None:
+        """Applies one message from the publisher."""
+        kind, epoch, seq = message[:3]
+        if kind == "snapshot":
+            self._load_snapshot(epoch, seq, message[3], message[4])
+            return
+        if epoch != self._epoch or seq != self._seq + 1:
+            raise EOFError("Replica is out of step with the publisher.")
+        with self._lock.write():
+            for op, id_int, name, email in message[3]:
+                contact_id = uuid.UUID(int=id_int)
+                if op == "delete":
+                    self._inner.delete(contact_id)
+                elif op == "add":
+                    self._inner.add(Contact(contact_id=contact_id, name=name, email=email))
+                else:
+                    self._inner.update(Contact(contact_id=contact_id, name=name, email=email))
+        self._advance(epoch, seq)
+
+    def _load_snapshot(self, epoch: str, seq: int, rows: Iterable[Tuple[int, str, Optional[str]]],
+                       last: bool) -> None:
+        """Collects snapshot parts, swapping the finished copy in with the last one."""
+        if self._loading is None:
+            self._loading = InMemoryContactRepository()
+        self._loading.add_many(Contact(contact_id=uuid.UUID(int=id_int), name=name, email=email)
+                               for id_int, name, email in rows)
+        if last:
+            with self._lock.write():
+                self._inner, self._loading = self._loading, None
+            self._advance(epoch, seq)
+
+    def _advance(self, epoch: str, seq: int) -> None:
+        with self._applied:
+            self._epoch, self._seq = epoch, seq
+            self._applied.notify_all()
+        self._ready.set()
+
+    def add(self, contact: Contact) -> None:
+        """Replicas cannot be written; raises ValueError."""
+        raise ValueError("Replica is read-only.")
+
+    def add_many(self, contacts: Iterable[Contact]) -> None:
+        raise ValueError("Replica is read-only.")
+
+    def delete(self, contact_id: uuid.UUID) -> None:
+        raise ValueError("Replica is read-only.")
+
+    def update(self, contact: Contact) -> None:
+        raise ValueError("Replica is read-only.")
+
+    def apply_changes(self, added: Sequence[Contact], updated: Sequence[Contact],
+                      deleted: Sequence[uuid.UUID]) -> None:
+        raise ValueError("Replica is read-only.")
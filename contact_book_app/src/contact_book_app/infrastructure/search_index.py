@@ -0,0 +1,95 @@
+# contact_book_app/src/infrastructure/search_index.py
+"""
+This module contains an incrementally maintained search index over contact
+names and emails, used by repositories to answer searches without scanning
+every contact.
+"""
+import heapq
+import uuid
+from typing import Dict, Iterable, List, Set, Tuple
+
+from ..domain import search
+from ..domain.repository import Contact
+
+
+def _trigrams(text: str) -> Set[str]:
+    """Returns every three-character substring of text."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _short_prefixes(text: str) -> Set[str]:
+    """Returns the prefixes shorter than MIN_SUBSTRING_LENGTH of every word."""
+    return {word[:length]
+            for word in search.words(text)
+            for length in range(1, search.MIN_SUBSTRING_LENGTH)}
+
+
+class ContactSearchIndex:
+    """
+    Maps case-folded name and email fragments to contact IDs.
+
+    Queries of MIN_SUBSTRING_LENGTH characters or more are answered from a
+    trigram inverted index: the posting sets of the query's trigrams are
+    intersected and the few surviving candidates are checked for the full
+    substring. Shorter queries are answered from a map of short word
+    prefixes. The index keeps its own normalized copy of each contact's
+    fields, so a contact can be removed even after it was mutated in place.
+    """
+
+    def __init__(self) -> None:
+        self._fields: Dict[uuid.UUID, Tuple[str, str]] = {}
+        self._postings: Dict[str, Set[uuid.UUID]] = {}
+
+    def _keys(self, name: str, email: str) -> Set[str]:
+        """Returns every posting key a contact with these fields is filed under."""
+        return _trigrams(name) | _trigrams(email) | _short_prefixes(name) | _short_prefixes(email)
+
+    def add(self, contact: Contact) -> None:
+        """Indexes a contact, replacing any previous entry for its ID."""
+        self.remove(contact.contact_id)
+        name, email = search.normalize(contact.name), search.fold_email(contact.email)
+        self._fields[contact.contact_id] = (name, email)
+        postings = self._postings
+        for key in self._keys(name, email):
+            ids = postings.get(key)
+            if ids is None:
+                postings[key] = {contact.contact_id}
+            else:
+                ids.add(contact.contact_id)
+
+    def add_many(self, contacts: Iterable[Contact]) -> None:
+        """Indexes a batch of contacts."""
+        for contact in contacts:
+            self.add(contact)
+
+    def remove(self, contact_id: uuid.UUID) -> None:
+        """Removes a contact from the index. Does nothing if it is absent."""
+        fields = self._fields.pop(contact_id, None)
+        if fields is None:
+            return
+        postings = self._postings
+        for key in self._keys(*fields):
+            ids = postings[key]
+            ids.discard(contact_id)
+            if not ids:
+                del postings[key]
+
+    def search(self, query: str, limit: int) -> List[uuid.UUID]:
+        """Returns the IDs of at most `limit` matching contacts, in result order."""
+        needle = search.normalize(query)
+        if not needle or limit <= 0:
+            return []
+        if len(needle) < search.MIN_SUBSTRING_LENGTH:
+            candidates: Iterable[uuid.UUID] = self._postings.get(needle, ())
+        else:
+            posting_sets = [self._postings.get(gram) for gram in _trigrams(needle)]
+            if not all(posting_sets):
+                return []
+            posting_sets.sort(key=len)
+            candidates = posting_sets[0].intersection(*posting_sets[1:])
+        hits = []
+        for contact_id in candidates:
+            name, email = self._fields[contact_id]
+            if search.matches(needle, name, email):
+                hits.append(search.sort_key(name, email, contact_id))
+        return [key[2] for key in heapq.nsmallest(limit, hits)]
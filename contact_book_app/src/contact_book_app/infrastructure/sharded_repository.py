@@ -0,0 +1,330 @@
+# contact_book_app/src/infrastructure/sharded_repository.py
+"""
+This module contains a Contact Repository that partitions the contacts of
+one book across several child repositories ("shards"), optionally each
+running in its own process.
+"""
+import functools
+import heapq
+import multiprocessing
+import uuid
+from itertools import chain, islice
+from multiprocessing.connection import Connection
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from ..domain import search
+from ..domain.repository import AbstractContactRepository, Contact
+
+RepositoryFactory = Callable[[], AbstractContactRepository]
+
+
+def _serve(connection: Connection, factory: RepositoryFactory) -> None:
+    """The request loop of a shard process: runs repository calls until told to stop."""
+    repo = factory()
+    try:
+        while True:
+            request = connection.recv()
+            if request is None:
+                break
+            method, args = request
+            try:
+                response: Tuple[bool, Any] = (True, getattr(repo, method)(*args))
+            except Exception as e:  # Sent back and raised in the parent
+                response = (False, e)
+            connection.send(response)
+    finally:
+        close = getattr(repo, "close", None)
+        if close is not None:
+            close()
+        connection.close()
+
+
+class ProcessShard(AbstractContactRepository):
+    """
+    A repository running in a child process, built there by calling
+    `factory` (e.g. InMemoryContactRepository, or a functools.partial of
+    SqliteContactRepository with a path). Every call is sent over a pipe and
+    its result or exception sent back, so contacts are copies.
+
+    submit() sends a call without waiting for its result, which lets a
+    ShardedContactRepository keep several shard processes busy at once.
+    A ProcessShard must only be used from one thread at a time.
+    """
+
+    def __init__(self, factory: RepositoryFactory, page_size: int = 1000) -> None:
+        self._connection, child = multiprocessing.Pipe()
+        self._process = multiprocessing.Process(
+            target=_serve, args=(child, factory), name="contact-shard", daemon=True)
+        self._process.start()
+        child.close()
+        self._page_size = page_size
+
+    def submit(self, method: str, *args: Any) -> Callable[[], Any]:
+        """Sends a call to the shard and returns a function that waits for its result."""
+        self._connection.send((method, args))
+
+        def result() -> Any:
+            ok, value = self._connection.recv()
+            if not ok:
+                raise value
+            return value
+        return result
+
+    def _call(self, method: str, *args: Any) -> Any:
+        return self.submit(method, *args)()
+
+    def close(self) -> None:
+        """Stops the shard process, letting its repository close."""
+        if self._process.is_alive():
+            self._connection.send(None)
+            self._process.join()
+        self._connection.close()
+
+    def add(self, contact: Contact) -> None:
+        self._call("add", contact)
+
+    def add_many(self, contacts: Iterable[Contact]) -> None:
+        self._call("add_many", list(contacts))
+
+    def get(self, contact_id: uuid.UUID) -> Optional[Contact]:
+        return self._call("get", contact_id)
+
+    def find_by_email(self, email: str) -> Optional[Contact]:
+        return self._call("find_by_email", email)
+
+    def email_exists(self, email: str) -> bool:
+        return self._call("email_exists", email)
+
+    def find_by_id_prefix(self, prefix: str, limit: int) -> List[Contact]:
+        return self._call("find_by_id_prefix", prefix, limit)
+
+    def list(self) -> List[Contact]:
+        return self._call("list")
+
+    def iter_contacts(self) -> Iterator[Contact]:
+        """Streams the contacts a page at a time, so no single message holds them all."""
+        cursor = None
+        while True:
+            page = self._call("list_after", cursor, self._page_size)
+            yield from page
+            if len(page) < self._page_size:
+                return
+            cursor = page[-1].contact_id
+
+    def list_page(self, offset: int, limit: int) -> List[Contact]:
+        return self._call("list_page", offset, limit)
+
+    def list_after(self, cursor: Optional[uuid.UUID], limit: int) -> List[Contact]:
+        return self._call("list_after", cursor, limit)
+
+    def search(self, query: str, limit: int) -> List[Contact]:
+        return self._call("search", query, limit)
+
+    def delete(self, contact_id: uuid.UUID) -> None:
+        self._call("delete", contact_id)
+
+    def update(self, contact: Contact) -> None:
+        self._call("update", contact)
+
+    def apply_changes(self, added: Sequence[Contact], updated: Sequence[Contact],
+                      deleted: Sequence[uuid.UUID]) -> None:
+        self._call("apply_changes", list(added), list(updated), list(deleted))
+
+
+def _search_key(contact: Contact) -> search.SortKey:
+    return search.sort_key(search.normalize(contact.name), search.fold_email(contact.email),
+                           contact.contact_id)
+
+
+class ShardedContactRepository(AbstractContactRepository):
+    """
+    Spreads contacts across child repositories by a hash of their ID.
+
+    Point operations go to the one shard that owns the ID. Email lookups and
+    uniqueness checks go through a global index from email to shard, so
+    they cost one shard call (or none) instead of one per shard; adding a
+    contact whose email another contact has raises ValueError, as no single
+    shard could detect it. Calls touching every shard (add_many, search,
+    find_by_id_prefix) are sent to all shards before waiting for any, so
+    ProcessShard children work on them in parallel.
+
+    Contacts are listed in the order they were added, as a merge of the
+    shards' own listings by a global sequence number. Contacts already in
+    the shards when the repository is created are listed first, shard by
+    shard. Shards must not be modified other than through this repository.
+    """
+
+    def __init__(self, shards: Sequence[AbstractContactRepository]) -> None:
+        if not shards:
+            raise ValueError("At least one shard is required.")
+        self._shards = list(shards)
+        self._emails: Dict[str, int] = {}  # email -> shard number
+        self._indexed_emails: Dict[uuid.UUID, str] = {}  # The reverse of _emails
+        self._sequence: Dict[uuid.UUID, int] = {}  # contact_id -> position in listing order
+        self._next_sequence = 0
+        for shard in self._shards:
+            for contact in shard.iter_contacts():
+                self._index(contact)
+
+    def close(self) -> None:
+        """Closes the shards that can be closed, e.g. ProcessShards."""
+        for shard in self._shards:
+            close = getattr(shard, "close", None)
+            if close is not None:
+                close()
+
+    def _shard_number(self, contact_id: uuid.UUID) -> int:
+        return contact_id.int % len(self._shards)
+
+    def _shard_for(self, contact_id: uuid.UUID) -> AbstractContactRepository:
+        return self._shards[self._shard_number(contact_id)]
+
+    def _index(self, contact: Contact) -> None:
+        """Records a stored contact in the email index and the listing order."""
+        if contact.contact_id not in self._sequence:
+            self._sequence[contact.contact_id] = self._next_sequence
+            self._next_sequence += 1
+        self._unindex_email(contact.contact_id)
+        if contact.email:
+            self._emails[contact.email] = self._shard_number(contact.contact_id)
+            self._indexed_emails[contact.contact_id] = contact.email
+
+    def _unindex_email(self, contact_id: uuid.UUID) -> None:
+        email = self._indexed_emails.pop(contact_id, None)
+        if email is not None:
+            del self._emails[email]
+
+    def _check_email(self, contact: Contact) -> None:
+        """Raises ValueError if another contact already has the contact's email."""
+        if contact.email and contact.email in self._emails:
+            if self._indexed_emails.get(contact.contact_id) != contact.email:
+                raise ValueError("Email already exists.")
+
+    def _fan_out(self, method: str, *args: Any) -> List[Any]:
+        """Calls a method on every shard, in parallel for process shards."""
+        return self._gather([(shard, method, args) for shard in self._shards])
+
+    @staticmethod
+    def _gather(calls: Sequence[Tuple[AbstractContactRepository, str, Tuple[Any, ...]]]) -> List[Any]:
+        """
+        Makes the calls, submitting every ProcessShard call before waiting on
+        any. Every result is collected even if one call fails, so that no
+        reply is left on a shard's pipe to be mistaken for the next one's;
+        the first failure is then raised.
+        """
+        pending: List[Callable[[], Any]] = []
+        for shard, method, args in calls:
+            if isinstance(shard, ProcessShard):
+                pending.append(shard.submit(method, *args))
+            else:
+                pending.append(functools.partial(getattr(shard, method), *args))
+        results = []
+        error: Optional[Exception] = None
+        for result in pending:
+            try:
+                results.append(result())
+            except Exception as e:
+                if error is None:
+                    error = e
+        if error is not None:
+            raise error
+        return results
+
+    def add(self, contact: Contact) -> None:
+        self._check_email(contact)
+        self._shard_for(contact.contact_id).add(contact)
+        self._index(contact)
+
+    def add_many(self, contacts: Iterable[Contact]) -> None:
+        """Validates the whole batch, then sends each shard its part in one call."""
+        batch = list(contacts)
+        seen = set()
+        for contact in batch:
+            self._check_email(contact)
+            if contact.email:
+                if contact.email in seen:
+                    raise ValueError("Email already exists.")
+                seen.add(contact.email)
+        parts: Dict[int, List[Contact]] = {}
+        for contact in batch:
+            parts.setdefault(self._shard_number(contact.contact_id), []).append(contact)
+        self._gather([(self._shards[number], "add_many", (part,)) for number, part in parts.items()])
+        for contact in batch:
+            self._index(contact)
+
+    def get(self, contact_id: uuid.UUID) -> Optional[Contact]:
+        return self._shard_for(contact_id).get(contact_id)
+
+    def find_by_email(self, email: str) -> Optional[Contact]:
+        """Asks only the shard the email index points to."""
+        number = self._emails.get(email)
+        return None if number is None else self._shards[number].find_by_email(email)
+
+    def email_exists(self, email: str) -> bool:
+        """Answers from the global email index without asking any shard."""
+        return email in self._emails
+
+    def find_by_id_prefix(self, prefix: str, limit: int) -> List[Contact]:
+        return [contact for part in self._fan_out("find_by_id_prefix", prefix, limit)
+                for contact in part][:limit]
+
+    def list(self) -> List[Contact]:
+        return list(self.iter_contacts())
+
+    def iter_contacts(self) -> Iterator[Contact]:
+        """Merges the shards' listings, each in its own insertion order, lazily."""
+        sequence = self._sequence
+        return heapq.merge(*(shard.iter_contacts() for shard in self._shards),
+                           key=lambda contact: sequence[contact.contact_id])
+
+    def search(self, query: str, limit: int) -> List[Contact]:
+        """Merges the best matches of every shard."""
+        parts = self._fan_out("search", query, limit)
+        return list(islice(heapq.merge(*parts, key=_search_key), limit))
+
+    def delete(self, contact_id: uuid.UUID) -> None:
+        self._shard_for(contact_id).delete(contact_id)
+        if self._sequence.pop(contact_id, None) is not None:
+            self._unindex_email(contact_id)
+
+    def update(self, contact: Contact) -> None:
+        if contact.contact_id not in self._sequence:
+            return
+        self._check_email(contact)
+        self._shard_for(contact.contact_id).update(contact)
+        self._index(contact)
+
+    def apply_changes(self, added: Sequence[Contact], updated: Sequence[Contact],
+                      deleted: Sequence[uuid.UUID]) -> None:
+        """
+        Validates the batch's emails against the index as it will be once the
+        deleted and updated contacts have given theirs up, then sends each
+        shard its part in one call. Each shard applies its part as its own
+        apply_changes() would, but the shards do not commit together.
+        """
+        updated = [contact for contact in updated if contact.contact_id in self._sequence]
+        released = {self._indexed_emails.get(contact_id)
+                    for contact_id in chain(deleted, (c.contact_id for c in updated))}
+        taken: Set[str] = set()
+        for contact in chain(updated, added):
+            if contact.email:
+                if contact.email in taken or (contact.email in self._emails
+                                              and contact.email not in released):
+                    raise ValueError("Email already exists.")
+                taken.add(contact.email)
+        parts: Dict[int, Tuple[List[Contact], List[Contact], List[uuid.UUID]]] = {}
+        for contact in added:
+            parts.setdefault(self._shard_number(contact.contact_id), ([], [], []))[0].append(contact)
+        for contact in updated:
+            parts.setdefault(self._shard_number(contact.contact_id), ([], [], []))[1].append(contact)
+        for contact_id in deleted:
+            parts.setdefault(self._shard_number(contact_id), ([], [], []))[2].append(contact_id)
+        self._gather([(self._shards[number], "apply_changes", part) for number, part in parts.items()])
+        for contact_id in deleted:
+            if self._sequence.pop(contact_id, None) is not None:
+                self._unindex_email(contact_id)
+        # Unindex every updated email before indexing any, as they may be swapped.
+        for contact in updated:
+            self._unindex_email(contact.contact_id)
+        for contact in chain(updated, added):
+            self._index(contact)
@@ -0,0 +1,327 @@
+# contact_book_app/src/infrastructure/shared_snapshot.py
+"""
+This module shares a contact book between processes as a memory-mapped
+snapshot file, which every reader maps instead of receiving a copy.
+
+The file has a fixed binary layout, all integers little-endian:
+
+    header        magic, generation, contact count, email count
+    records       one 32-byte record per contact, in listing order:
+                  ID (16 bytes), name offset and length, email offset and
+                  length (-1 for no email), both into the string heap
+    ID index      record numbers (u32) sorted by ID bytes
+    email index   record numbers (u32) of contacts with an email, sorted
+                  by their UTF-8 email bytes
+    string heap   the UTF-8 names and emails
+
+A reader finds a contact by binary search of an index and decodes only the
+record it lands on, so opening a snapshot costs the same for any size of
+book and pages cost what they contain. New generations are written to a
+temporary file and renamed over the snapshot, so a reader sees either the
+old file or the new one, never a mix; readers that mapped the old file
+keep it until they refresh. On Linux, keep the file under /dev/shm to hold
+it in shared memory rather than on disk.
+"""
+import mmap
+import os
+import struct
+import sys
+import threading
+import time
+import uuid
+from array import array
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Sequence
+
+from ..domain.handles import id_range
+from ..domain.observer import Observer
+from ..domain.repository import AbstractContactRepository, Contact
+
+_MAGIC = b"CBSNAP01"
+_HEADER = struct.Struct("<8sQQQ")  # magic, generation, count, email count
+_RECORD = struct.Struct("<16sIIIi")  # id, name offset, name length, email offset, email length
+_INDEX = struct.Struct("<I")
+_NO_EMAIL = -1
+_MAX_HEAP = 2 ** 32 - 1
+
+
+def _index_bytes(records: Iterable[int]) -> bytes:
+    """Packs record numbers as little-endian u32s."""
+    index = array("I", records)
+    if sys.byteorder == "big":
+        index.byteswap()
+    return index.tobytes()
+
+
+def export_snapshot(contacts: Iterable[Contact], path: str, generation: int) -> None:
+    """
+    Writes the contacts, in order, to a snapshot file at `path`, replacing
+    any previous one atomically.
+    """
+    book = list(contacts)
+    records = bytearray()
+    heap = bytearray()
+    emails: List[Optional[bytes]] = []
+    for contact in book:
+        name = contact.name.encode()
+        name_offset = len(heap)
+        heap += name
+        email = contact.email.encode() if contact.email is not None else None
+        email_offset, email_length = 0, _NO_EMAIL
+        if email is not None:
+            email_offset, email_length = len(heap), len(email)
+            heap += email
+        emails.append(email)
+        records += _RECORD.pack(contact.contact_id.bytes, name_offset, len(name),
+                                email_offset, email_length)
+    if len(heap) > _MAX_HEAP:
+        raise ValueError("Snapshot string heap exceeds 4 GiB.")
+    by_id = sorted(range(len(book)), key=lambda i: book[i].contact_id.bytes)
+    by_email = sorted((i for i, email in enumerate(emails) if email is not None),
+                      key=emails.__getitem__)
+    temporary = f"{path}.{os.getpid()}.tmp"
+    with open(temporary, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, generation, len(book), len(by_email)))
+        f.write(records)
+        f.write(_index_bytes(by_id))
+        f.write(_index_bytes(by_email))
+        f.write(heap)
+    os.replace(temporary, path)
+
+
+def snapshot_generation(path: str) -> int:
+    """Returns the generation of the snapshot at `path`, or 0 if there is none."""
+    try:
+        with open(path, "rb") as f:
+            magic, generation, _, _ = _HEADER.unpack(f.read(_HEADER.size))
+    except (OSError, struct.error):
+        return 0
+    return generation if magic == _MAGIC else 0
+
+
+class SnapshotExporter(Observer):
+    """
+    Keeps a snapshot file in step with a ContactService: writes one at once,
+    attaches itself to the service, and writes the next generation after
+    every notification.
+
+    Each export writes the whole book, so attach it through a
+    BackgroundObservable, which coalesces bursts of changes into a single
+    notification, rather than exporting once per write.
+    """
+
+    def __init__(self, service: Any, path: str) -> None:
+        self._service = service
+        self._path = path
+        self._lock = threading.Lock()
+        self._generation = snapshot_generation(path)
+        self.export()
+        service.attach(self)
+
+    @property
+    def generation(self) -> int:
+        """The generation of the last snapshot written."""
+        return self._generation
+
+    def export(self) -> int:
+        """Writes a new generation of the snapshot and returns its number."""
+        with self._lock:
+            self._generation += 1
+            export_snapshot(self._service.iter_contacts(), self._path, self._generation)
+            return self._generation
+
+    def close(self) -> None:
+        """Stops exporting changes."""
+        self._service.detach(self)
+
+    def update(self, subject: Any, events: Sequence[Any] = ()) -> None:
+        self.export()
+
+
+class _Snapshot:
+    """One mapped generation of a snapshot file and the offsets of its sections."""
+
+    def __init__(self, path: str) -> None:
+        with open(path, "rb") as f:
+            self.inode = os.fstat(f.fileno()).st_ino
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.generation, self.count, self.email_count = _HEADER.unpack_from(self.data, 0)
+        if magic != _MAGIC:
+            self.data.close()
+            raise ValueError("Not a contact snapshot.")
+        self.records = _HEADER.size
+        self.id_index = self.records + self.count * _RECORD.size
+        self.email_index = self.id_index + self.count * _INDEX.size
+        self.heap = self.email_index + self.email_count * _INDEX.size
+
+    def contact(self, record: int) -> Contact:
+        """Decodes one record."""
+        data, heap = self.data, self.heap
+        raw_id, name_offset, name_length, email_offset, email_length = \
+            _RECORD.unpack_from(data, self.records + record * _RECORD.size)
+        name = data[heap + name_offset:heap + name_offset + name_length].decode()
+        email = None
+        if email_length != _NO_EMAIL:
+            email = data[heap + email_offset:heap + email_offset + email_length].decode()
+        return Contact(contact_id=uuid.UUID(bytes=raw_id), name=name, email=email)
+
+    def id_at(self, record: int) -> bytes:
+        start = self.records + record * _RECORD.size
+        return self.data[start:start + 16]
+
+    def email_at(self, record: int) -> bytes:
+        _, _, _, offset, length = _RECORD.unpack_from(self.data, self.records + record * _RECORD.size)
+        return self.data[self.heap + offset:self.heap + offset + length]
+
+    def entry(self, index: int, position: int) -> int:
+        """Returns the record number at a position of an index."""
+        return _INDEX.unpack_from(self.data, index + position * _INDEX.size)[0]
+
+    def lower_bound(self, index: int, size: int, key: bytes,
+                    key_of: Callable[[int], bytes]) -> int:
+        """Returns the first position in an index whose record's key is >= key."""
+        low, high = 0, size
+        while low < high:
+            middle = (low + high) // 2
+            if key_of(self.entry(index, middle)) < key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def find(self, contact_id: uuid.UUID) -> Optional[int]:
+        """Returns the record number of a contact, or None."""
+        key = contact_id.bytes
+        position = self.lower_bound(self.id_index, self.count, key, self.id_at)
+        if position < self.count:
+            record = self.entry(self.id_index, position)
+            if self.id_at(record) == key:
+                return record
+        return None
+
+
+class SharedSnapshotRepository(AbstractContactRepository):
+    """
+    A read-only repository serving contacts straight from a memory-mapped
+    snapshot file written by export_snapshot().
+
+    get(), find_by_email() and find_by_id_prefix() binary-search the
+    indexes; list_page() and list_after() decode only the records they
+    return. Every read first checks, at most once per `refresh_interval`
+    seconds, whether a new generation was published and maps it if so;
+    call refresh() to check at once. A read in progress keeps the
+    generation it started with, and contacts are decoded copies, so both
+    stay valid across a refresh. Writes raise ValueError.
+    """
+
+    def __init__(self, path: str, refresh_interval: float = 1.0) -> None:
+        self._path = path
+        self._refresh_interval = refresh_interval
+        self._snapshot = _Snapshot(path)
+        self._checked = time.monotonic()
+
+    @property
+    def generation(self) -> int:
+        """The generation of the snapshot currently mapped."""
+        return self._snapshot.generation
+
+    def refresh(self) -> bool:
+        """Maps the latest published generation; returns True if it changed."""
+        self._checked = time.monotonic()
+        try:
+            if os.stat(self._path).st_ino == self._snapshot.inode:
+                return False
+        except FileNotFoundError:
+            return False  # Keep serving the last snapshot
+        # The old map is released once no read in progress still uses it.
+        self._snapshot = _Snapshot(self._path)
+        return True
+
+    def _current(self) -> _Snapshot:
+        """Returns the mapped snapshot, refreshing it first when due."""
+        if time.monotonic() - self._checked >= self._refresh_interval:
+            self.refresh()
+        return self._snapshot
+
+    def close(self) -> None:
+        """Unmaps the snapshot."""
+        self._snapshot.data.close()
+
+    def __len__(self) -> int:
+        return self._current().count
+
+    def get(self, contact_id: uuid.UUID) -> Optional[Contact]:
+        snapshot = self._current()
+        record = snapshot.find(contact_id)
+        return None if record is None else snapshot.contact(record)
+
+    def find_by_email(self, email: str) -> Optional[Contact]:
+        snapshot = self._current()
+        key = email.encode()
+        position = snapshot.lower_bound(snapshot.email_index, snapshot.email_count, key,
+                                        snapshot.email_at)
+        if position < snapshot.email_count:
+            record = snapshot.entry(snapshot.email_index, position)
+            if snapshot.email_at(record) == key:
+                return snapshot.contact(record)
+        return None
+
+    def find_by_id_prefix(self, prefix: str, limit: int) -> List[Contact]:
+        """Walks the ID index from the lowest ID with the prefix."""
+        snapshot = self._current()
+        low, high = (contact_id.bytes for contact_id in id_range(prefix))
+        position = snapshot.lower_bound(snapshot.id_index, snapshot.count, low, snapshot.id_at)
+        matches = []
+        while position < snapshot.count and len(matches) < limit:
+            record = snapshot.entry(snapshot.id_index, position)
+            if snapshot.id_at(record) > high:
+                break
+            matches.append(snapshot.contact(record))
+            position += 1
+        return matches
+
+    def list(self) -> List[Contact]:
+        return list(self.iter_contacts())
+
+    def iter_contacts(self) -> Iterator[Contact]:
+        """Decodes the contacts of the generation mapped when iteration starts."""
+        snapshot = self._current()
+        for record in range(snapshot.count):
+            yield snapshot.contact(record)
+
+    def list_page(self, offset: int, limit: int) -> List[Contact]:
+        """Decodes only the records on the page."""
+        if offset < 0 or limit < 0:
+            raise ValueError("Offset and limit must not be negative.")
+        snapshot = self._current()
+        return [snapshot.contact(record)
+                for record in range(offset, min(offset + limit, snapshot.count))]
+
+    def list_after(self, cursor: Optional[uuid.UUID], limit: int) -> List[Contact]:
+        if limit < 0:
+            raise ValueError("Limit must not be negative.")
+        snapshot = self._current()
+        start = 0
+        if cursor is not None:
+            record = snapshot.find(cursor)
+            if record is None:
+                raise ValueError("Contact not found.")
+            start = record + 1
+        return [snapshot.contact(record)
+                for record in range(start, min(start + limit, snapshot.count))]
+
+    def add(self, contact: Contact) -> None:
+        """Snapshots cannot be written; raises ValueError."""
+        raise ValueError("Snapshot is read-only.")
+
+    def add_many(self, contacts: Iterable[Contact]) -> None:
+        raise ValueError("Snapshot is read-only.")
+
+    def delete(self, contact_id: uuid.UUID) -> None:
+        raise ValueError("Snapshot is read-only.")
+
+    def update(self, contact: Contact) -> None:
+        raise ValueError("Snapshot is read-only.")
+
+    def apply_changes(self, added: Sequence[Contact], updated: Sequence[Contact],
+                      deleted: Sequence[uuid.UUID]) -> None:
+        raise ValueError("Snapshot is read-only.")
@@ -0,0 +1,207 @@
+# contact_book_app/src/infrastructure/sqlite_repository.py
+"""
+This module contains a concrete implementation of the Contact Repository
+backed by an SQLite database file, so contacts survive a restart and the
+book is not limited by available RAM.
+"""
+import sqlite3
+import uuid
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from ..domain.handles import id_range
+from ..domain.repository import AbstractContactRepository, Contact
+
+# The sqlite3 module keeps a per-connection cache of compiled statements keyed
+# by their SQL text, so keeping every query as a constant means each one is
+# prepared once and then reused for the lifetime of the connection.
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS contacts ("
+    " id BLOB PRIMARY KEY,"
+    " name TEXT NOT NULL,"
+    " email TEXT"
+    ")",
+    "CREATE UNIQUE INDEX IF NOT EXISTS contacts_email ON contacts (email)",
+)
+_INSERT = "INSERT INTO contacts (id, name, email) VALUES (?, ?, ?)"
+_SELECT_BY_ID = "SELECT id, name, email FROM contacts WHERE id = ?"
+_SELECT_BY_EMAIL = "SELECT id, name, email FROM contacts WHERE email = ?"
+_EMAIL_EXISTS = "SELECT 1 FROM contacts WHERE email = ?"
+_SELECT_ID_RANGE = "SELECT id, name, email FROM contacts WHERE id BETWEEN ? AND ? ORDER BY id LIMIT ?"
+_SELECT_ALL = "SELECT id, name, email FROM contacts ORDER BY rowid"
+_SELECT_PAGE = "SELECT id, name, email FROM contacts ORDER BY rowid LIMIT ? OFFSET ?"
+_SELECT_ROWID = "SELECT rowid FROM contacts WHERE id = ?"
+_SELECT_AFTER = "SELECT id, name, email FROM contacts WHERE rowid > ? ORDER BY rowid LIMIT ?"
+_DELETE = "DELETE FROM contacts WHERE id = ?"
+_UPDATE = "UPDATE contacts SET name = ?, email = ? WHERE id = ?"
+_CLEAR_EMAIL = "UPDATE contacts SET email = NULL WHERE id = ?"
+
+Row = Tuple[bytes, str, Optional[str]]
+
+
+def _to_row(contact: Contact) -> Row:
+    """Converts a Contact into the tuple stored in the contacts table."""
+    return (contact.contact_id.bytes, contact.name, contact.email)
+
+
+def _to_contact(row: Row) -> Contact:
+    """Converts a row of the contacts table back into a Contact."""
+    return Contact(contact_id=uuid.UUID(bytes=row[0]), name=row[1], email=row[2])
+
+
+def _constraint_error(error: sqlite3.IntegrityError) -> ValueError:
+    """Translates a constraint violation into the domain's ValueError."""
+    if "email" in str(error):
+        return ValueError("Email already exists.")
+    return ValueError("Contact already exists.")
+
+
+class SqliteContactRepository(AbstractContactRepository):
+    """
+    Concrete repository implementation that stores contacts in SQLite.
+
+    The database runs in WAL mode so readers are not blocked by a writer,
+    email uniqueness is enforced by a unique index, and bulk writes are
+    grouped into a single transaction. Contacts are listed in insertion order.
+    """
+
+    def __init__(self, path: str = ":memory:", batch_size: int = 1000,
+                 check_same_thread: bool = True) -> None:
+        # isolation_level=None puts the connection in autocommit mode; batched
+        # writes open their own explicit transaction. Pass
+        # check_same_thread=False to use the connection from other threads,
+        # e.g. behind a ThreadSafeContactRepository.
+        self._conn = sqlite3.connect(path, isolation_level=None,
+                                     check_same_thread=check_same_thread)
+        self._batch_size = batch_size
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        for statement in _SCHEMA:
+            self._conn.execute(statement)
+
+    def close(self) -> None:
+        """Closes the underlying database connection."""
+        self._conn.close()
+
+    def add(self, contact: Contact) -> None:
+        """Inserts a contact into the database."""
+        try:
+            self._conn.execute(_INSERT, _to_row(contact))
+        except sqlite3.IntegrityError as e:
+            raise _constraint_error(e) from e
+
+    def add_many(self, contacts: Iterable[Contact]) -> None:
+        """
+        Inserts a batch of contacts inside a single transaction.
+
+        If any row violates a constraint the whole batch is rolled back.
+        """
+        batch: List[Row] = []
+        self._conn.execute("BEGIN")
+        try:
+            for contact in contacts:
+                batch.append(_to_row(contact))
+                if len(batch) >= self._batch_size:
+                    self._conn.executemany(_INSERT, batch)
+                    batch.clear()
+            if batch:
+                self._conn.executemany(_INSERT, batch)
+        except sqlite3.IntegrityError as e:
+            self._conn.execute("ROLLBACK")
+            raise _constraint_error(e) from e
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+    def get(self, contact_id: uuid.UUID) -> Optional[Contact]:
+        """Retrieves a contact by its ID using the primary key."""
+        row = self._conn.execute(_SELECT_BY_ID, (contact_id.bytes,)).fetchone()
+        return _to_contact(row) if row else None
+
+    def find_by_email(self, email: str) -> Optional[Contact]:
+        """Retrieves a contact by email using the unique email index."""
+        row = self._conn.execute(_SELECT_BY_EMAIL, (email,)).fetchone()
+        return _to_contact(row) if row else None
+
+    def email_exists(self, email: str) -> bool:
+        """Checks the unique email index for the given email."""
+        return self._conn.execute(_EMAIL_EXISTS, (email,)).fetchone() is not None
+
+    def find_by_id_prefix(self, prefix: str, limit: int) -> List[Contact]:
+        """Finds contacts by ID prefix as a range scan of the primary key."""
+        low, high = id_range(prefix)
+        rows = self._conn.execute(_SELECT_ID_RANGE, (low.bytes, high.bytes, limit))
+        return [_to_contact(row) for row in rows]
+
+    def iter_contacts(self) -> Iterator[Contact]:
+        """
+        Yields every contact in insertion order.
+
+        Rows are pulled from the database cursor as they are consumed, so the
+        table is never materialized in memory as a whole.
+        """
+        for row in self._conn.execute(_SELECT_ALL):
+            yield _to_contact(row)
+
+    def list(self) -> List[Contact]:
+        """Returns a list of all contacts."""
+        return list(self.iter_contacts())
+
+    def list_page(self, offset: int, limit: int) -> List[Contact]:
+        """Returns a slice of the contacts using LIMIT/OFFSET."""
+        if offset < 0 or limit < 0:
+            raise ValueError("Offset and limit must not be negative.")
+        return [_to_contact(row) for row in self._conn.execute(_SELECT_PAGE, (limit, offset))]
+
+    def list_after(self, cursor: Optional[uuid.UUID], limit: int) -> List[Contact]:
+        """Returns the contacts that follow `cursor`, seeking on the rowid."""
+        if limit < 0:
+            raise ValueError("Limit must not be negative.")
+        rowid = 0
+        if cursor is not None:
+            row = self._conn.execute(_SELECT_ROWID, (cursor.bytes,)).fetchone()
+            if row is None:
+                raise ValueError("Contact not found.")
+            rowid = row[0]
+        return [_to_contact(row) for row in self._conn.execute(_SELECT_AFTER, (rowid, limit))]
+
+    def delete(self, contact_id: uuid.UUID) -> None:
+        """
+        Deletes a contact from the database.
+        Fails silently if the ID does not exist.
+        """
+        self._conn.execute(_DELETE, (contact_id.bytes,))
+
+    def update(self, contact: Contact) -> None:
+        """
+        Updates a contact's name and email.
+        Does nothing if the ID does not exist.
+        """
+        try:
+            self._conn.execute(_UPDATE, (contact.name, contact.email, contact.contact_id.bytes))
+        except sqlite3.IntegrityError as e:
+            raise _constraint_error(e) from e
+
+    def apply_changes(self, added: Sequence[Contact], updated: Sequence[Contact],
+                      deleted: Sequence[uuid.UUID]) -> None:
+        """
+        Applies a batch of changes inside a single transaction, rolled back
+        whole if any statement fails.
+
+        The unique email index is checked after every statement, so the
+        email of every updated contact is cleared before any is set; this
+        lets addresses move between contacts within the batch in any order.
+        """
+        self._conn.execute("BEGIN")
+        try:
+            self._conn.executemany(_DELETE, [(contact_id.bytes,) for contact_id in deleted])
+            self._conn.executemany(_CLEAR_EMAIL, [(c.contact_id.bytes,) for c in updated])
+            self._conn.executemany(_UPDATE, [(c.name, c.email, c.contact_id.bytes) for c in updated])
+            self._conn.executemany(_INSERT, [_to_row(contact) for contact in added])
+        except sqlite3.IntegrityError as e:
+            self._conn.execute("ROLLBACK")
+            raise _constraint_error(e) from e
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
@@ -0,0 +1,103 @@
+# contact_book_app/src/infrastructure/thread_safe_repository.py
+"""
+This module contains a decorator that makes any Contact Repository safe to
+share between threads.
+"""
+import uuid
+from dataclasses import replace
+from typing import Iterable, Iterator, List, Optional, Sequence
+
+from ..domain.concurrency import ReadWriteLock
+from ..domain.repository import AbstractContactRepository, Contact
+
+
+def _copy(contact: Optional[Contact]) -> Optional[Contact]:
+    return replace(contact) if contact is not None else None
+
+
+class ThreadSafeContactRepository(AbstractContactRepository):
+    """
+    Wraps a repository with a reader/writer lock: reads run concurrently,
+    writes run one at a time and never overlap a read.
+
+    Contacts are copied on the way in, and get() and find_by_email() hand
+    out copies, so a stored contact is never mutated in place and readers
+    never see a half-applied update. Listings are taken under a single read
+    lock and therefore reflect one consistent state of the book; they share
+    the stored objects, which callers must treat as read-only.
+    """
+
+    def __init__(self, inner: AbstractContactRepository) -> None:
+        self._inner = inner
+        self._lock = ReadWriteLock()
+
+    def add(self, contact: Contact) -> None:
+        """Adds a copy of the contact under the write lock."""
+        with self._lock.write():
+            self._inner.add(replace(contact))
+
+    def add_many(self, contacts: Iterable[Contact]) -> None:
+        """Adds copies of a batch of contacts under one write lock."""
+        batch = [replace(contact) for contact in contacts]
+        with self._lock.write():
+            self._inner.add_many(batch)
+
+    def get(self, contact_id: uuid.UUID) -> Optional[Contact]:
+        """Returns a copy of the contact with the given ID."""
+        with self._lock.read():
+            return _copy(self._inner.get(contact_id))
+
+    def find_by_email(self, email: str) -> Optional[Contact]:
+        """Returns a copy of the contact owning the given email."""
+        with self._lock.read():
+            return _copy(self._inner.find_by_email(email))
+
+    def email_exists(self, email: str) -> bool:
+        with self._lock.read():
+            return self._inner.email_exists(email)
+
+    def find_by_id_prefix(self, prefix: str, limit: int) -> List[Contact]:
+        """Returns copies of the matching contacts."""
+        with self._lock.read():
+            return [replace(c) for c in self._inner.find_by_id_prefix(prefix, limit)]
+
+    def list(self) -> List[Contact]:
+        """Returns a snapshot of all contacts."""
+        with self._lock.read():
+            return self._inner.list()
+
+    def iter_contacts(self) -> Iterator[Contact]:
+        """
+        Yields the contacts of a snapshot taken when iteration starts, so no
+        lock is held while the caller consumes them.
+        """
+        yield from self.list()
+
+    def list_page(self, offset: int, limit: int) -> List[Contact]:
+        with self._lock.read():
+            return self._inner.list_page(offset, limit)
+
+    def list_after(self, cursor: Optional[uuid.UUID], limit: int) -> List[Contact]:
+        with self._lock.read():
+            return self._inner.list_after(cursor, limit)
+
+    def search(self, query: str, limit: int) -> List[Contact]:
+        with self._lock.read():
+            return self._inner.search(query, limit)
+
+    def delete(self, contact_id: uuid.UUID) -> None:
+        with self._lock.write():
+            self._inner.delete(contact_id)
+
+    def update(self, contact: Contact) -> None:
+        """Replaces the stored contact with a copy under the write lock."""
+        with self._lock.write():
+            self._inner.update(replace(contact))
+
+    def apply_changes(self, added: Sequence[Contact], updated: Sequence[Contact],
+                      deleted: Sequence[uuid.UUID]) -> None:
+        """Applies copies of a batch of changes under one write lock."""
+        added = [replace(contact) for contact in added]
+        updated = [replace(contact) for contact in updated]
+        with self._lock.write():
+            self._inner.apply_changes(added, updated, deleted)
@@ -1,33 +1,133 @@
 # src/contact_book_app/main.py
 """
 The main entry point for the Contact Book CLI application.
+
+Run without a command to start the interactive menu, or with a command
+(e.g. `contact-book --db book.db add "Jane Doe" --email jane@example.com`)
+or `--commands-file` to run non-interactively.
 """
+import argparse
+import sys
+from contextlib import nullcontext
+from typing import List, Optional
+
+from .domain.metrics import MetricsRegistry, profiled
 from .domain.model import ContactService
-from .infrastructure.in_memory_repository import InMemoryContactRepository
-from .presentation.cli_view import CLIView
-from .presentation.cli_controller import CLIController
+from .domain.repository import AbstractContactRepository
+from .infrastructure.lazy_repository import LazyContactRepository
+from .presentation.batch_cli import BatchRunner, UsageError, build_parser
+
+# Backends and the interactive view are imported where they are first
+# needed, so that only the mode in use pays for importing them.
 
 
-def main():
+def open_repository(db: Optional[str],
+                    registry: Optional[MetricsRegistry] = None) -> AbstractContactRepository:
     """
-    Initializes the application components and starts the controller.
+    Opens the SQLite database at `db` behind a cache, or a searchable
+    in-memory book, timing its calls into `registry` if given.
     """
-    # 1. Initialize Components
-    repo = InMemoryContactRepository()
-    service = ContactService(repo)
+    repo: AbstractContactRepository
+    if db is None:
+        from .infrastructure.in_memory_repository import InMemoryContactRepository
+        repo = InMemoryContactRepository(searchable=True)
+    else:
+        from .infrastructure.caching_repository import CachingContactRepository
+        from .infrastructure.sqlite_repository import SqliteContactRepository
+        # Opened on the loader thread, then used and closed on the main one.
+        repo = CachingContactRepository(SqliteContactRepository(db, check_same_thread=False))
+    if registry is not None:
+        from .infrastructure.instrumented_repository import InstrumentedContactRepository
+        repo = InstrumentedContactRepository(repo, registry)
+    return repo
+
+
+def run_interactive(service: ContactService, loading: bool = False) -> None:
+    """
+    Wires the view and controller to the service and runs the menu loop.
+    While the repository is `loading`, the menu is shown straight away
+    under a placeholder; the first command waits for the load to finish.
+    """
+    from .presentation.cli_controller import CLIController
+    from .presentation.cli_view import CLIView
+
     view = CLIView(service)
     # Pass both the service and the view to the controller
     controller = CLIController(service=service, view=view)
 
-    # 2. Wire them together: The View observes the Service
+    # The View observes the Service
     service.attach(view)
 
-    # 3. Display the initial empty view
-    view.display_contacts()
+    # Display the initial view
+    if loading:
+        view.display_loading()
+    else:
+        view.display_contacts()
 
-    # 4. Hand control to the controller's main loop
+    # Hand control to the controller's main loop
     controller.run()
 
 
+def run_batch(service: ContactService, args: argparse.Namespace,
+              argv: Optional[List[str]]) -> int:
+    """Runs the command or commands file given on the command line."""
+    runner = BatchRunner(service, output_format=args.format)
+    if args.command is not None:
+        return 0 if runner.run_line(argv if argv is not None else sys.argv[1:]) else 1
+    if args.commands_file == "-":
+        succeeded = runner.run_script(sys.stdin, args.stop_on_error)
+    else:
+        with open(args.commands_file, encoding="utf-8") as script:
+            succeeded = runner.run_script(script, args.stop_on_error)
+    return 0 if succeeded else 1
+
+
+def write_metrics(registry: MetricsRegistry, path: str) -> None:
+    """Writes the Prometheus text dump of the registry to a file or stderr."""
+    if path == "-":
+        sys.stderr.write(registry.to_prometheus())
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(registry.to_prometheus())
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Initializes the application components and runs either the interactive
+    controller or the requested batch commands. Returns the exit status.
+    """
+    parser = build_parser()
+    try:
+        args = parser.parse_args(argv)
+    except UsageError as e:
+        parser.print_usage(sys.stderr)
+        print(f"{parser.prog}: error: {e}", file=sys.stderr)
+        return 2
+
+    # 1. Initialize Components. A database is opened on first use, or in
+    # the background while the interactive menu is already up; the
+    # in-memory book is cheap enough to create on first use either way.
+    # Metrics are labelled with the class of the loaded backend, so the
+    # instrumentation goes inside the lazy wrapper.
+    interactive = args.command is None and args.commands_file is None
+    background = interactive and bool(args.db)
+    registry = MetricsRegistry() if args.metrics else None
+    lazy = LazyContactRepository(lambda: open_repository(args.db or None, registry),
+                                 background=background)
+    service = ContactService(lazy, metrics=registry)
+
+    # 2. Run the requested mode
+    try:
+        with profiled(args.profile) if args.profile else nullcontext():
+            if interactive:
+                run_interactive(service, loading=background and not lazy.loaded)
+                return 0
+            return run_batch(service, args, argv)
+    finally:
+        lazy.close()
+        if registry is not None:
+            write_metrics(registry, args.metrics)
+
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
@@ -0,0 +1,181 @@
+# src/contact_book_app/presentation/batch_cli.py
+"""
+This module contains the non-interactive command-line interface, for driving
+the contact book from scripts and pipelines.
+
+Each command prints machine-readable results (JSON Lines or TSV) to stdout
+and errors to stderr, without drawing the interactive view. A script of
+commands, one per line, can be run from a file or stdin in a single process.
+"""
+import argparse
+import json
+import shlex
+import sys
+from typing import IO, List, Optional, TYPE_CHECKING
+
+from ..domain.repository import Contact
+from ..infrastructure.contact_io import TransferReport, export_contacts, import_contacts
+
+if TYPE_CHECKING:
+    from ..domain.model import ContactService
+
+COMMANDS = ("add", "list", "update", "delete", "import", "export")
+
+
+class UsageError(ValueError):
+    """Raised instead of exiting when a command line cannot be parsed."""
+
+
+class _Parser(argparse.ArgumentParser):
+    def error(self, message: str) -> None:
+        raise UsageError(message)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Builds the parser for the global options and the commands."""
+    parser = _Parser(prog="contact-book", description="Manage a contact book.")
+    parser.add_argument("--db", help="SQLite database file holding the contacts")
+    parser.add_argument("--format", choices=("json", "tsv"), default="json",
+                        help="output format (default: json)")
+    parser.add_argument("--commands-file", metavar="PATH",
+                        help="run one command per line from PATH ('-' for stdin)")
+    parser.add_argument("--stop-on-error", action="store_true",
+                        help="stop a commands file at the first failing command")
+    parser.add_argument("--metrics", metavar="PATH",
+                        help="on exit, write timings and counters to PATH ('-' for stderr) "
+                             "in the Prometheus text format")
+    parser.add_argument("--profile", metavar="PATH",
+                        help="run under cProfile and save the statistics to PATH")
+    commands = parser.add_subparsers(dest="command", parser_class=_Parser)
+
+    add = commands.add_parser("add", help="add a contact")
+    add.add_argument("name")
+    add.add_argument("--email")
+
+    listing = commands.add_parser("list", help="list or search contacts")
+    listing.add_argument("--offset", type=int, default=0)
+    listing.add_argument("--limit", type=int)
+    listing.add_argument("--search", metavar="QUERY")
+
+    update = commands.add_parser("update", help="update a contact")
+    update.add_argument("contact", help="contact handle, ID or email")
+    update.add_argument("--name")
+    update.add_argument("--email", help="new email ('' to remove it)")
+
+    delete = commands.add_parser("delete", help="delete a contact")
+    delete.add_argument("contact", help="contact handle, ID or email")
+
+    importing = commands.add_parser("import", help="import a CSV, vCard or JSON Lines file")
+    importing.add_argument("path")
+    importing.add_argument("--batch-size", type=int, default=10_000)
+
+    exporting = commands.add_parser("export", help="export to a CSV, vCard or JSON Lines file")
+    exporting.add_argument("path")
+    return parser
+
+
+class BatchRunner:
+    """Executes parsed commands against a service and prints their results."""
+
+    def __init__(self, service: 'ContactService', output_format: str = "json",
+                 stdout: Optional[IO[str]] = None, stderr: Optional[IO[str]] = None):
+        self.service = service
+        self.output_format = output_format
+        self.stdout = stdout or sys.stdout
+        self.stderr = stderr or sys.stderr
+        self._parser = build_parser()
+
+    def _emit(self, record: dict) -> None:
+        if self.output_format == "json":
+            self.stdout.write(json.dumps(record, ensure_ascii=False) + "\n")
+        else:
+            values = ("" if value is None else str(value) for value in record.values())
+            self.stdout.write("\t".join(v.replace("\t", " ").replace("\n", " ") for v in values) + "\n")
+
+    def _emit_contact(self, contact: Contact) -> None:
+        self._emit({"id": str(contact.contact_id), "name": contact.name, "email": contact.email})
+
+    def _emit_report(self, report: TransferReport) -> None:
+        self._emit({"rows": report.rows, "added": report.added, "rejected": len(report.errors),
+                    "seconds": round(report.seconds, 3),
+                    "rows_per_second": round(report.rows_per_second)})
+        for error in report.errors:
+            self._emit({"row": error.row, "error": error.message})
+
+    def _error(self, message: str) -> None:
+        if self.output_format == "json":
+            self.stderr.write(json.dumps({"error": message}) + "\n")
+        else:
+            self.stderr.write(f"error\t{message}\n")
+
+    def _resolve(self, reference: str) -> Contact:
+        """Finds a contact by its handle (or full ID) or by email."""
+        if "@" not in reference:
+            return self.service.find_by_handle(reference)
+        contact = self.service.find_by_email(reference)
+        if contact is None:
+            raise ValueError(f"Contact not found: {reference}")
+        return contact
+
+    def execute(self, args: argparse.Namespace) -> None:
+        """Runs one parsed command; raises ValueError or OSError on failure."""
+        if args.command == "add":
+            self._emit_contact(self.service.add_contact(args.name, args.email or None))
+        elif args.command == "list":
+            if args.search is not None:
+                contacts = self.service.search(args.search, args.limit or 10)
+            elif args.limit is None and not args.offset:
+                contacts = self.service.iter_contacts()
+            else:
+                limit = args.limit if args.limit is not None else sys.maxsize
+                contacts = self.service.list_page(args.offset, limit)
+            for contact in contacts:
+                self._emit_contact(contact)
+        elif args.command == "update":
+            contact = self._resolve(args.contact)
+            name = args.name if args.name is not None else contact.name
+            email = contact.email if args.email is None else (args.email or None)
+            self._emit_contact(self.service.update_contact(contact.contact_id, name, email))
+        elif args.command == "delete":
+            contact = self._resolve(args.contact)
+            self.service.delete_contact(contact.contact_id)
+            self._emit_contact(contact)
+        elif args.command == "import":
+            self._emit_report(import_contacts(self.service, args.path, batch_size=args.batch_size))
+        elif args.command == "export":
+            self._emit_report(export_contacts(self.service, args.path))
+
+    def run_line(self, argv: List[str]) -> bool:
+        """Parses and runs one command; returns False if it failed."""
+        try:
+            args = self._parser.parse_args(argv)
+            if args.command is None:
+                raise UsageError(f"expected one of: {', '.join(COMMANDS)}")
+            self.execute(args)
+        except (OSError, ValueError) as e:
+            self._error(str(e))
+            return False
+        return True
+
+    def run_script(self, lines: IO[str], stop_on_error: bool = False) -> bool:
+        """
+        Runs one command per line, skipping blank lines and # comments.
+        A line that cannot be split into words (e.g. an unclosed quote)
+        fails like a command would. Returns False if any command failed.
+        """
+        succeeded = True
+        for number, line in enumerate(lines, start=1):
+            try:
+                argv = shlex.split(line, comments=True)
+            except ValueError as e:
+                self._error(f"line {number}: {e}")
+                ok = False
+            else:
+                if not argv:
+                    continue
+                ok = self.run_line(argv)
+            if not ok:
+                succeeded = False
+                if stop_on_error:
+                    break
+        return succeeded
@@ -4,10 +4,35 @@ This module contains the Controller component for the CLI application.
 """
 from typing import TYPE_CHECKING
 
+from ..infrastructure.contact_io import export_contacts, import_contacts
+
 if TYPE_CHECKING:
     from ..domain.model import ContactService
     from .cli_view import CLIView
 
+# The command menu, printed below the view's table before every command.
+MENU = (
+    "",
+    "--- Commands ---",
+    "add    - Add a new contact",
+    "list   - Refresh the contact list view",
+    "next   - Show the next page of contacts",
+    "prev   - Show the previous page of contacts",
+    "sort   - Sort the list by name, email or domain",
+    "filter - Only list contacts with an email in one domain",
+    "search - Find contacts by name or email",
+    "import - Import contacts from a CSV, vCard or JSON Lines file",
+    "export - Export contacts to a CSV, vCard or JSON Lines file",
+    "update - Update a contact (by ID)",
+    "delete - Delete a contact (by ID)",
+    "exit   - Exit the application",
+    "----------------",
+)
+# Lines written below the table by a command that ends in a redraw: the
+# menu, up to four prompts (update asks three after the command) and the
+# line the cursor is left on.
+LINES_BELOW_TABLE = len(MENU) + 5
+
 
 class CLIController:
     """
@@ -18,16 +43,49 @@ class CLIController:
     def __init__(self, service: 'ContactService', view: 'CLIView'):
         self.service = service
         self.view = view
+        view.lines_below = LINES_BELOW_TABLE
+
+    def _error(self, message: object) -> None:
+        """
+        Prints an error below the table. No redraw follows to make room
+        for it, so the screen may scroll and is repainted in full next time.
+        """
+        print(f"Error: {message}")
+        self.view.invalidate()
 
     def _display_menu(self):
         """Prints the command menu."""
-        print("\n--- Commands ---")
-        print("add    - Add a new contact")
-        print("list   - Refresh the contact list view")
-        print("update - Update a contact (by ID)")
-        print("delete - Delete a contact (by ID)")
-        print("exit   - Exit the application")
-        print("----------------")
+        for line in MENU:
+            print(line)
+
+    @staticmethod
+    def _report_progress(rows: int) -> None:
+        """Prints a running count of processed rows on a single line."""
+        print(f"\r{rows} rows processed...", end="", flush=True)
+
+    def _import(self, path: str) -> None:
+        """Imports a contact file, redrawing the view once at the end."""
+        # Detach the view so that it does not redraw after every batch.
+        self.service.detach(self.view)
+        try:
+            report = import_contacts(self.service, path, progress=self._report_progress)
+        finally:
+            self.service.attach(self.view)
+        self.view.display_contacts()
+        print(f"Imported {report.added} of {report.rows} rows "
+              f"in {report.seconds:.2f}s ({report.rows_per_second:,.0f} rows/s).")
+        for error in report.errors[:10]:
+            print(f"Row {error.row}: {error.message}")
+        if len(report.errors) > 10:
+            print(f"... and {len(report.errors) - 10} more rejected rows.")
+        self.view.invalidate()
+
+    def _export(self, path: str) -> None:
+        """Exports every contact to a file."""
+        report = export_contacts(self.service, path, progress=self._report_progress)
+        print(f"\nExported {report.rows} contacts "
+              f"in {report.seconds:.2f}s ({report.rows_per_second:,.0f} rows/s).")
+        self.view.invalidate()
 
     def run(self):
         """Starts the main application loop."""
@@ -47,45 +105,74 @@ class CLIController:
                 try:
                     self.service.add_contact(name=name, email=email)
                 except ValueError as e:
-                    print(f"Error: {e}")
+                    self._error(e)
 
             elif command == "update":
                 try:
-                    list_id = int(input("Enter contact ID to update: ").strip())
-                    contacts = self.service.get_all_contacts()
-                    if 1 <= list_id <= len(contacts):
-                        contact_to_update = contacts[list_id - 1]
-
-                        new_name = input(f"Enter new name for {contact_to_update.name}: ").strip()
-                        new_email = input(f"Enter new email for {contact_to_update.name} (optional): ").strip()
-                        if not new_email:
-                            new_email = None
-
-                        self.service.update_contact(
-                            contact_id=contact_to_update.contact_id,
-                            name=new_name,
-                            email=new_email
-                        )
-                    else:
-                        print("Error: Invalid ID.")
+                    contact_to_update = self.service.find_by_handle(
+                        input("Enter contact ID to update: "))
+
+                    new_name = input(f"Enter new name for {contact_to_update.name}: ").strip()
+                    new_email = input(f"Enter new email for {contact_to_update.name} (optional): ").strip()
+                    if not new_email:
+                        new_email = None
+
+                    self.service.update_contact(
+                        contact_id=contact_to_update.contact_id,
+                        name=new_name,
+                        email=new_email
+                    )
                 except ValueError as e:
-                    print(f"Error: Invalid input. Please enter a number. Details: {e}")
+                    self._error(e)
 
             elif command == "delete":
                 try:
-                    list_id = int(input("Enter contact ID to delete: ").strip())
-                    contacts = self.service.get_all_contacts()
-                    if 1 <= list_id <= len(contacts):
-                        contact_to_delete = contacts[list_id - 1]
-                        self.service.delete_contact(contact_id=contact_to_delete.contact_id)
-                    else:
-                        print("Error: Invalid ID.")
-                except ValueError:
-                    print("Error: Invalid input. Please enter a number.")
+                    contact_to_delete = self.service.find_by_handle(
+                        input("Enter contact ID to delete: "))
+                    self.service.delete_contact(contact_id=contact_to_delete.contact_id)
+                except ValueError as e:
+                    self._error(e)
 
             elif command == "list":
                 # Explicitly tell the view to redraw itself.
                 self.view.display_contacts()
 
+            elif command == "sort":
+                order = input("Sort by (name, email, domain; empty for insertion order): ").strip().lower()
+                try:
+                    self.view.sort_by(order or None)
+                except ValueError as e:
+                    self._error(e)
+                else:
+                    self.view.display_contacts()
+
+            elif command == "filter":
+                domain = input("Enter email domain (empty to show all): ").strip()
+                self.view.filter_by_domain(domain or None)
+                self.view.display_contacts()
+
+            elif command == "search":
+                query = input("Enter search text: ").strip()
+                self.view.display_search_results(query, self.service.search(query))
+
+            elif command in ("import", "export"):
+                path = input("Enter file path: ").strip()
+                try:
+                    if command == "import":
+                        self._import(path)
+                    else:
+                        self._export(path)
+                except (OSError, ValueError) as e:
+                    self._error(e)
+
+            elif command == "next":
+                self.view.next_page()
+                self.view.display_contacts()
+
+            elif command == "prev":
+                self.view.previous_page()
+                self.view.display_contacts()
+
             else:
-                print("Unknown command.")
\ No newline at end of file
+                print("Unknown command.")
+                self.view.invalidate()
@@ -2,53 +2,190 @@
 """
 This module contains the View component for the CLI application.
 """
-import os
-import time  # Import the time module
-from typing import TYPE_CHECKING
+import shutil
+from typing import TYPE_CHECKING, List, Optional, Sequence
+from ..domain.events import ChangeEvent, ContactAdded, ContactUpdated
+from ..domain.handles import HANDLE_LENGTH, handle_of
 from ..domain.observer import Observer
+from ..domain.sorted_views import SORT_ORDERS, normalize_domain
+from .terminal import Screen
 
 # Use a forward reference for the ContactService type hint
 if TYPE_CHECKING:
     from ..domain.model import ContactService
+    from ..domain.repository import Contact
+
+# Lines of the table other than its rows: the title, the sort line, the
+# column header and rule, the "Showing" line and the closing rule.
+_TABLE_CHROME_LINES = 6
+_MIN_PAGE_SIZE = 5
 
 
 class CLIView(Observer):
     """
     The command-line view, responsible for displaying contacts.
     It observes the ContactService for changes and refreshes automatically.
+
+    The visible page is cached, so change events that only touch it (or
+    add a contact after it) are applied to the cache without asking the
+    service for contacts again. New contacts are assumed to be listed last.
+
+    Frames are drawn through a Screen, which rewrites only the lines that
+    changed. Unless a page size is given, pages are sized to fit the
+    terminal height, re-measured on every fetch, less `lines_below`: the
+    lines its controller writes under the table between two frames. When
+    the terminal is too short for both, every frame is drawn in full, as
+    the screen will have scrolled.
+
+    Contacts are listed in insertion order unless a sort order or a domain
+    filter is set, in which case pages come from the service's sorted
+    views and any change refetches the page, as rows may move.
     """
 
-    def __init__(self, service: 'ContactService'):
+    def __init__(self, service: 'ContactService', page_size: Optional[int] = None,
+                 screen: Optional[Screen] = None):
         self.service = service
+        self.lines_below = 0
+        self._fit_to_terminal = page_size is None
+        self.page_size = page_size or self._terminal_page_size()
+        self.screen = screen or Screen()
+        self.offset = 0  # Position of the first contact on the visible page
+        self._rows: Optional[List['Contact']] = None  # Cached visible page
+        self._has_more = False
+        self.order: Optional[str] = None  # One of SORT_ORDERS; None for insertion order
+        self.domain: Optional[str] = None  # Only list contacts with an email in this domain
+
+    def _terminal_page_size(self) -> int:
+        """Returns how many rows fit on the terminal besides the chrome and the lines below."""
+        free = shutil.get_terminal_size().lines - _TABLE_CHROME_LINES - self.lines_below
+        return max(_MIN_PAGE_SIZE, free)
+
+    def invalidate(self) -> None:
+        """
+        Makes the next redraw repaint the whole screen. Call it after
+        printing enough below the table to scroll the screen.
+        """
+        self.screen.invalidate()
+
+    def sort_by(self, order: Optional[str]) -> None:
+        """Lists contacts in the given order (None for insertion order), from the top."""
+        if order is not None and order not in SORT_ORDERS:
+            raise ValueError("Unknown sort order.")
+        self.order = order
+        self.offset = 0
+
+    def filter_by_domain(self, domain: Optional[str]) -> None:
+        """Lists only contacts with an email in the domain (None for all), from the top."""
+        self.domain = normalize_domain(domain) if domain else None
+        self.offset = 0
+
+    def _fetch(self, offset: int, limit: int) -> List['Contact']:
+        """Reads a page in the current order, from the sorted views if one is set."""
+        if self.order is None and self.domain is None:
+            return self.service.list_page(offset, limit)
+        return self.service.list_sorted(self.order or "name", offset, limit, self.domain)
+
+    def next_page(self) -> None:
+        """Moves the visible window forward by one page."""
+        self.offset += self.page_size
+
+    def previous_page(self) -> None:
+        """Moves the visible window back by one page."""
+        self.offset = max(0, self.offset - self.page_size)
 
     def display_contacts(self) -> None:
         """
-        Fetches contacts from the service and prints them in a formatted table.
+        Fetches the visible page of contacts from the service and prints it
+        in a formatted table. Each row is labelled with the contact's handle.
         """
-        contacts = self.service.get_all_contacts()
+        if self._fit_to_terminal:
+            self.page_size = self._terminal_page_size()
+        # Fetch one extra row to learn whether a further page exists.
+        contacts = self._fetch(self.offset, self.page_size + 1)
+        if not contacts and self.offset > 0:
+            # The book shrank below the visible page; fall back to the last one.
+            self.offset = max(0, self.offset - self.page_size)
+            contacts = self._fetch(self.offset, self.page_size + 1)
+        self._has_more = len(contacts) > self.page_size
+        self._rows = contacts[:self.page_size]
+        self._render()
 
-        # Clear the console screen
-        os.system('cls' if os.name == 'nt' else 'clear')
+    def display_loading(self) -> None:
+        """
+        Draws a placeholder frame while the contacts are still loading,
+        without asking the service for them.
+        """
+        self.screen.draw(["===== Contact Book =====", "Loading contacts...", "=" * 24])
 
-        print("===== Contact Book =====")
+    def _render(self) -> None:
+        """Draws the cached page as a formatted table."""
+        contacts = self._rows or []
+        lines = ["===== Contact Book ====="]
+        if self.order is not None or self.domain is not None:
+            lines.append(f"Sorted by {self.order or 'name'}"
+                         + (f", @{self.domain} only" if self.domain else ""))
         if not contacts:
-            print("No contacts found.")
+            lines.append("No contacts found.")
         else:
-            # Simple table formatting
-            # Header
-            print(f"{'ID':<5} | {'Name':<20} | {'Email':<30}")
-            print("-" * 60)
-            # Rows
-            for i, contact in enumerate(contacts, 1):
+            lines.append(f"{'ID':<{HANDLE_LENGTH}} | {'Name':<20} | {'Email':<30}")
+            lines.append("-" * (HANDLE_LENGTH + 55))
+            for contact in contacts:
                 email_str = contact.email if contact.email is not None else "N/A"
-                print(f"{i:<5} | {contact.name:<20} | {email_str:<30}")
+                lines.append(f"{handle_of(contact.contact_id)} | {contact.name:<20} | {email_str:<30}")
+            if self._has_more or self.offset:
+                last = self.offset + len(contacts)
+                lines.append(f"Showing {self.offset + 1}-{last}{' (more)' if self._has_more else ''}")
+        lines.append("=" * 24)
+        if len(lines) + self.lines_below > shutil.get_terminal_size().lines:
+            self.screen.invalidate()
+        self.screen.draw(lines)
 
-        print("=" * 24)
+    def _apply(self, event: ChangeEvent) -> bool:
+        """
+        Patches the cached page with one change event.
+        Returns False if the page has to be fetched again instead.
+        """
+        if self.order is not None or self.domain is not None:
+            return False  # The change may move rows into, out of or within the page
+        rows = self._rows
+        contact_id = event.contact.contact_id
+        if isinstance(event, ContactUpdated):
+            for i, row in enumerate(rows):
+                if row.contact_id == contact_id:
+                    rows[i] = event.contact
+            return True
+        if isinstance(event, ContactAdded):
+            if self._has_more:
+                return True  # Lands on a later page
+            if len(rows) < self.page_size and (rows or not self.offset):
+                rows.append(event.contact)
+            else:
+                self._has_more = True
+            return True
+        # A deletion shifts every later row; without knowing where the
+        # contact was listed, the page has to be fetched again.
+        return False
 
-    def update(self, subject: 'ContactService') -> None:
+    def display_search_results(self, query: str, contacts: List['Contact']) -> None:
+        """Prints the contacts found by a search below the current screen."""
+        print(f"\n===== Search: {query} =====")
+        if not contacts:
+            print("No matching contacts.")
+        else:
+            print(f"{'Name':<20} | {'Email':<30}")
+            print("-" * 53)
+            for contact in contacts:
+                email_str = contact.email if contact.email is not None else "N/A"
+                print(f"{contact.name:<20} | {email_str:<30}")
+        # The results may have scrolled the table off its place on screen.
+        self.invalidate()
+
+    def update(self, subject: 'ContactService', events: Sequence[ChangeEvent] = ()) -> None:
         """
-        Receives notification from the service and redraws the contact list.
+        Receives notification from the service and redraws the contact list,
+        patching the cached page when the events allow it.
         """
-        print("\nChange detected, refreshing view...")
-        time.sleep(0.75)  # Add a small pause to make the refresh noticeable
-        self.display_contacts()
\ No newline at end of file
+        if self._rows is not None and events and all(self._apply(e) for e in events):
+            self._render()
+        else:
+            self.display_contacts()
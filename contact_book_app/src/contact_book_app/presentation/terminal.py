@@ -0,0 +1,59 @@
+# src/contact_book_app/presentation/terminal.py
+"""
+This module contains a minimal full-screen renderer for ANSI terminals.
+
+A frame is a list of text lines drawn from the top-left corner of the
+screen. The renderer remembers the last frame it drew and, for the next
+one, moves the cursor to and rewrites only the lines that differ, so a
+refresh costs a single write proportional to what changed.
+"""
+import shutil
+import sys
+from typing import IO, List, Optional, Sequence
+
+CSI = "\x1b["
+HOME = CSI + "H"
+CLEAR_SCREEN = CSI + "2J"
+CLEAR_LINE = CSI + "K"  # From the cursor to the end of the line
+CLEAR_BELOW = CSI + "J"  # From the cursor to the end of the screen
+
+
+def move_to(row: int) -> str:
+    """Returns the sequence moving the cursor to the start of a 1-based row."""
+    return f"{CSI}{row};1H"
+
+
+class Screen:
+    """
+    Draws frames to a terminal, rewriting only the lines that changed.
+
+    The first frame, and the first after invalidate(), clears the screen.
+    Lines are cut to the terminal width so that none wraps onto the next
+    row. After each frame the cursor is left below it with the rest of the
+    screen cleared, ready for the menu and prompts printed by the caller.
+    Anything else written over the frame area (or enough output to scroll
+    it) must be followed by invalidate().
+    """
+
+    def __init__(self, stream: Optional[IO[str]] = None):
+        self._stream = stream  # None means whatever sys.stdout is at draw time
+        self._lines: Optional[List[str]] = None
+
+    def invalidate(self) -> None:
+        """Makes the next frame redraw the whole screen."""
+        self._lines = None
+
+    def draw(self, lines: Sequence[str]) -> None:
+        """Draws a frame with a single write to the stream."""
+        width = shutil.get_terminal_size().columns
+        lines = [line[:width] for line in lines]
+        previous = self._lines
+        parts = [HOME + CLEAR_SCREEN] if previous is None else []
+        for row, line in enumerate(lines):
+            if previous is None or row >= len(previous) or previous[row] != line:
+                parts.append(move_to(row + 1) + line + CLEAR_LINE)
+        parts.append(move_to(len(lines) + 1) + CLEAR_BELOW)
+        stream = self._stream or sys.stdout
+        stream.write("".join(parts))
+        stream.flush()
+        self._lines = lines
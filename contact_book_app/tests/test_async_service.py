@@ -0,0 +1,116 @@
+# contact_book_app/tests/test_async_service.py
+"""Tests for the asyncio service and the thread pool repository adapter."""
+import asyncio
+import uuid
+from unittest.mock import MagicMock
+import pytest
+from contact_book_app.domain.async_model import AsyncContactService
+from contact_book_app.domain.events import ContactAdded, ContactDeleted, ContactUpdated
+from contact_book_app.domain.observer import AsyncObserver
+from contact_book_app.infrastructure.async_adapter import ThreadPoolContactRepository
+from contact_book_app.infrastructure.in_memory_repository import InMemoryContactRepository
+from contact_book_app.infrastructure.sqlite_repository import SqliteContactRepository
+
+
+class RecordingObserver(AsyncObserver):
+    """An async observer that records every notification it receives."""
+
+    def __init__(self):
+        self.received = []
+
+    async def update(self, subject, events=()):
+        self.received.extend(events)
+
+
+@pytest.fixture
+def repo() -> ThreadPoolContactRepository:
+    """Provides an in-memory repository behind the thread pool adapter."""
+    adapter = ThreadPoolContactRepository(InMemoryContactRepository())
+    yield adapter
+    adapter.close()
+
+
+def test_async_service_adds_updates_and_deletes(repo: ThreadPoolContactRepository):
+    """
+    Tests the asynchronous service end to end, including the events sent to
+    async observers.
+    """
+    async def scenario():
+        service = AsyncContactService(repo)
+        observer = RecordingObserver()
+        service.attach(observer)
+
+        contact = await service.add_contact("Jane Doe", "jane@example.com")
+        with pytest.raises(ValueError, match="Email already exists."):
+            await service.add_contact("Impostor", "jane@example.com")
+        updated = await service.update_contact(contact.contact_id, "Jane Smith", "jane@example.com")
+        assert [c.name for c in await service.get_all_contacts()] == ["Jane Smith"]
+        assert [c async for c in service.iter_contacts()] == [updated]
+        await service.delete_contact(contact.contact_id)
+        await service.delete_contact(uuid.uuid4())
+        return contact, updated, observer.received
+
+    # ACT
+    contact, updated, received = asyncio.run(scenario())
+
+    # ASSERT
+    assert [type(event) for event in received] == [ContactAdded, ContactUpdated, ContactDeleted]
+    assert received[1].previous.name == "Jane Doe"
+    assert received[2].contact == updated
+
+
+def test_async_service_claims_each_email_once_under_concurrency(repo: ThreadPoolContactRepository):
+    """
+    Tests that many concurrent requests for the same emails succeed exactly
+    once per email.
+    """
+    async def scenario():
+        service = AsyncContactService(repo)
+        attempts = [service.add_contact(f"Person {i}", f"user{i % 10}@example.com") for i in range(100)]
+        results = await asyncio.gather(*attempts, return_exceptions=True)
+        return results, await service.get_all_contacts()
+
+    # ACT
+    results, contacts = asyncio.run(scenario())
+
+    # ASSERT
+    assert sum(not isinstance(result, Exception) for result in results) == 10
+    assert sorted(contact.email for contact in contacts) == sorted(f"user{i}@example.com" for i in range(10))
+
+
+def test_async_observable_isolates_failing_observers(repo: ThreadPoolContactRepository):
+    """Tests that an observer that raises does not stop the others."""
+    async def scenario():
+        service = AsyncContactService(repo)
+        failing = MagicMock(spec=AsyncObserver)
+        failing.update.side_effect = RuntimeError("boom")
+        healthy = RecordingObserver()
+        service.attach(failing)
+        service.attach(healthy)
+        await service.add_contact("Jane Doe")
+        return healthy.received
+
+    # ACT & ASSERT
+    assert len(asyncio.run(scenario())) == 1
+
+
+def test_thread_pool_adapter_runs_sqlite_off_the_event_loop(tmp_path):
+    """Tests the adapter over a file-backed SQLite repository with paging."""
+    # ARRANGE
+    sqlite_repo = SqliteContactRepository(str(tmp_path / "contacts.db"), check_same_thread=False)
+    adapter = ThreadPoolContactRepository(sqlite_repo)
+
+    async def scenario():
+        service = AsyncContactService(adapter)
+        for i in range(5):
+            await service.add_contact(f"Person {i}", f"p{i}@example.com")
+        return await service.list_page(1, 2), [c async for c in adapter.iter_contacts(page_size=2)]
+
+    # ACT
+    page, streamed = asyncio.run(scenario())
+    adapter.close()
+    sqlite_repo.close()
+
+    # ASSERT
+    assert [c.name for c in page] == ["Person 1", "Person 2"]
+    assert [c.name for c in streamed] == [f"Person {i}" for i in range(5)]
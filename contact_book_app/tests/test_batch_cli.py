@@ -0,0 +1,166 @@
+# contact_book_app/tests/test_batch_cli.py
+"""Tests for the non-interactive batch command-line interface."""
+import io
+import json
+import pytest
+from contact_book_app.domain.model import ContactService
+from contact_book_app.infrastructure.in_memory_repository import InMemoryContactRepository
+from contact_book_app.main import main
+from contact_book_app.presentation.batch_cli import BatchRunner
+
+
+@pytest.fixture
+def runner() -> BatchRunner:
+    """Provides a JSON batch runner over an empty in-memory book with captured output."""
+    return BatchRunner(ContactService(InMemoryContactRepository()),
+                       stdout=io.StringIO(), stderr=io.StringIO())
+
+
+def _records(stream: io.StringIO):
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+def test_script_adds_updates_and_deletes_by_email(runner: BatchRunner):
+    """
+    Tests that a script runs each command in order, referring to contacts
+    by email, and prints one JSON record per affected contact.
+    """
+    # ARRANGE
+    script = io.StringIO(
+        "# seed the book\n"
+        "add 'Jane Doe' --email jane@example.com\n"
+        "add 'John Roe'\n"
+        "\n"
+        "update jane@example.com --name 'Jane Smith'\n"
+        "delete jane@example.com\n"
+        "list\n")
+
+    # ACT
+    succeeded = runner.run_script(script)
+
+    # ASSERT
+    assert succeeded is True
+    records = _records(runner.stdout)
+    assert [(r["name"], r["email"]) for r in records] == [
+        ("Jane Doe", "jane@example.com"), ("John Roe", None),
+        ("Jane Smith", "jane@example.com"), ("Jane Smith", "jane@example.com"),
+        ("John Roe", None)]
+    assert runner.stderr.getvalue() == ""
+
+
+def test_script_reports_errors_and_continues_unless_told_to_stop(runner: BatchRunner):
+    """
+    Tests that failing commands are reported on stderr without stopping the
+    script, and that stop_on_error ends the script at the first failure.
+    """
+    # ARRANGE
+    lines = ["add A --email a@example.com", "add B --email a@example.com",
+             "frobnicate", "add C"]
+
+    # ACT
+    succeeded = runner.run_script(io.StringIO("\n".join(lines)))
+    stopped = BatchRunner(runner.service, stdout=io.StringIO(), stderr=io.StringIO())
+    stopped.run_script(io.StringIO("\n".join(lines)), stop_on_error=True)
+
+    # ASSERT
+    assert succeeded is False
+    assert [r["name"] for r in _records(runner.stdout)] == ["A", "C"]
+    assert [r["error"] for r in _records(runner.stderr)][0] == "Email already exists."
+    assert len(_records(runner.stderr)) == 2
+    assert len(_records(stopped.stderr)) == 1
+
+
+def test_script_reports_a_malformed_line_like_a_failed_command(runner: BatchRunner):
+    """
+    Tests that a line with an unclosed quote is reported with its line
+    number and, like any failed command, only ends the script if told to.
+    """
+    # ARRANGE
+    lines = ["add A", 'add "Jane', "add B"]
+
+    # ACT
+    succeeded = runner.run_script(io.StringIO("\n".join(lines)))
+    stopped = BatchRunner(ContactService(InMemoryContactRepository()),
+                          stdout=io.StringIO(), stderr=io.StringIO())
+    stopped.run_script(io.StringIO("\n".join(lines)), stop_on_error=True)
+
+    # ASSERT
+    assert succeeded is False
+    assert [r["name"] for r in _records(runner.stdout)] == ["A", "B"]
+    assert _records(runner.stderr) == [{"error": "line 2: No closing quotation"}]
+    assert [r["name"] for r in _records(stopped.stdout)] == ["A"]
+
+
+def test_list_supports_paging_search_and_tsv(runner: BatchRunner):
+    """Tests list --offset/--limit and --search, with TSV output."""
+    # ARRANGE
+    for name in ["Ann", "Bob", "Cat"]:
+        runner.run_line(["add", name, "--email", f"{name.lower()}@example.com"])
+    runner.output_format = "tsv"
+    runner.stdout = io.StringIO()
+
+    # ACT
+    runner.run_line(["list", "--offset", "1", "--limit", "1"])
+    runner.run_line(["list", "--search", "cat"])
+
+    # ASSERT
+    rows = [line.split("\t") for line in runner.stdout.getvalue().splitlines()]
+    assert [row[1:] for row in rows] == [["Bob", "bob@example.com"], ["Cat", "cat@example.com"]]
+
+
+def test_main_persists_commands_to_sqlite_database(tmp_path, capsys):
+    """Tests that separate main() invocations share a --db file and set the exit status."""
+    # ARRANGE
+    db = str(tmp_path / "book.db")
+
+    # ACT
+    added = main(["--db", db, "add", "Jane Doe", "--email", "jane@example.com"])
+    duplicate = main(["--db", db, "add", "Jane Again", "--email", "jane@example.com"])
+    listed = main(["--db", db, "--format", "tsv", "list"])
+    usage = main(["--db", db, "add"])
+
+    # ASSERT
+    out, err = capsys.readouterr()
+    assert (added, duplicate, listed, usage) == (0, 1, 0, 2)
+    assert out.splitlines()[-1].split("\t")[1:] == ["Jane Doe", "jane@example.com"]
+    assert "Email already exists." in err
+
+
+def test_update_and_delete_accept_short_handles(runner: BatchRunner):
+    """Tests that contacts can be addressed by the leading digits of their ID."""
+    # ARRANGE
+    runner.run_line(["add", "Jane Doe"])
+    handle = _records(runner.stdout)[0]["id"][:8]
+
+    # ACT
+    renamed = runner.run_line(["update", handle, "--name", "Jane Smith"])
+    deleted = runner.run_line(["delete", handle])
+    missing = runner.run_line(["delete", handle])
+
+    # ASSERT
+    assert (renamed, deleted, missing) == (True, True, False)
+    assert [r["name"] for r in _records(runner.stdout)] == ["Jane Doe", "Jane Smith", "Jane Smith"]
+    assert _records(runner.stderr) == [{"error": "Contact not found."}]
+
+
+def test_main_writes_metrics_dump(tmp_path, capsys):
+    """Tests that --metrics writes the Prometheus dump after the commands ran."""
+    # ARRANGE
+    metrics = tmp_path / "metrics.prom"
+
+    # ACT
+    status = main(["--metrics", str(metrics), "add", "Jane Doe"])
+    db_metrics = tmp_path / "db_metrics.prom"
+    with_db = main(["--metrics", str(db_metrics), "--db", str(tmp_path / "book.db"),
+                    "add", "Jane Doe"])
+
+    # ASSERT
+    dump = metrics.read_text()
+    assert status == with_db == 0
+    assert "contacts_added_total 1" in dump
+    assert 'contact_service_seconds_count{operation="add_contact"} 1' in dump
+    assert 'backend="InMemoryContactRepository"' in dump
+    # Labelled with the loaded backend, not the wrapper deferring its creation
+    db_dump = db_metrics.read_text()
+    assert 'backend="CachingContactRepository"' in db_dump
+    assert "LazyContactRepository" not in dump + db_dump
@@ -0,0 +1,119 @@
+# contact_book_app/tests/test_caching_repository.py
+"""Tests for the read-through caching repository decorator."""
+import uuid
+import pytest
+from unittest.mock import MagicMock
+from contact_book_app.domain.model import ContactService
+from contact_book_app.domain.repository import Contact
+from contact_book_app.infrastructure.caching_repository import CachingContactRepository
+from contact_book_app.infrastructure.in_memory_repository import InMemoryContactRepository
+
+
+class FakeClock:
+    """A clock that only moves when told to."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def inner() -> MagicMock:
+    """Provides an in-memory repository whose calls can be counted."""
+    return MagicMock(wraps=InMemoryContactRepository())
+
+
+def test_get_is_served_from_the_cache_until_the_contact_is_written(inner: MagicMock):
+    """
+    Tests that repeated gets hit the wrapped repository once, and that an
+    update or delete drops exactly the contact written.
+    """
+    # ARRANGE
+    cache = CachingContactRepository(inner)
+    jane = Contact(contact_id=uuid.uuid4(), name="Jane")
+    john = Contact(contact_id=uuid.uuid4(), name="John")
+    cache.add_many([jane, john])
+
+    # ACT
+    for _ in range(3):
+        cache.get(jane.contact_id)
+        cache.get(john.contact_id)
+    cache.update(Contact(contact_id=jane.contact_id, name="Jane Smith"))
+    renamed = cache.get(jane.contact_id)
+    cache.get(john.contact_id)
+    cache.delete(john.contact_id)
+
+    # ASSERT
+    assert renamed.name == "Jane Smith"
+    assert cache.get(john.contact_id) is None
+    assert inner.get.call_count == 4
+    stats = cache.stats
+    assert (stats.hits, stats.misses, stats.invalidations, stats.size) == (5, 4, 2, 1)
+
+
+def test_cached_contacts_are_protected_from_callers(inner: MagicMock):
+    """
+    Tests that a failed update through the service leaves the cached
+    contact unchanged, even though the service mutates what get() returned.
+    """
+    # ARRANGE
+    cache = CachingContactRepository(inner)
+    service = ContactService(cache)
+    jane = service.add_contact("Jane", "jane@example.com")
+    service.add_contact("John", "john@example.com")
+    inner.update.side_effect = ValueError("Email already exists.")
+
+    # ACT
+    cache.get(jane.contact_id)
+    with pytest.raises(ValueError):
+        service.update_contact(jane.contact_id, "Changed", "jane2@example.com")
+
+    # ASSERT
+    assert cache.get(jane.contact_id).name == "Jane"
+
+
+def test_cache_evicts_least_recently_used_and_expired_entries(inner: MagicMock):
+    """Tests the size bound and the TTL."""
+    # ARRANGE
+    clock = FakeClock()
+    cache = CachingContactRepository(inner, max_size=2, ttl=10, clock=clock)
+    a, b, c = (Contact(contact_id=uuid.uuid4(), name=name) for name in "abc")
+    cache.add_many([a, b, c])
+
+    # ACT
+    cache.get(a.contact_id)
+    cache.get(b.contact_id)
+    cache.get(a.contact_id)  # b is now the least recently used
+    cache.get(c.contact_id)  # evicts b
+    clock.now = 11
+    cache.get(a.contact_id)  # expired
+
+    # ASSERT
+    stats = cache.stats
+    assert (stats.hits, stats.misses, stats.evictions, stats.expirations) == (1, 4, 1, 1)
+    assert [call.args[0] for call in inner.get.call_args_list] == [
+        a.contact_id, b.contact_id, c.contact_id, a.contact_id]
+
+
+def test_list_is_cached_until_any_write(inner: MagicMock):
+    """Tests that list() and iteration reuse the cached list until a write."""
+    # ARRANGE
+    cache = CachingContactRepository(inner)
+    jane = Contact(contact_id=uuid.uuid4(), name="Jane")
+    cache.add(jane)
+
+    # ACT
+    first = cache.list()
+    first.clear()  # Callers get their own list
+    second = cache.list()
+    iterated = list(cache.iter_contacts())
+    john = Contact(contact_id=uuid.uuid4(), name="John")
+    cache.add(john)
+    third = cache.list()
+
+    # ASSERT
+    assert second == iterated == [jane]
+    assert third == [jane, john]
+    assert inner.list.call_count == 2
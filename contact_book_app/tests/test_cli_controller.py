@@ -1,94 +1,182 @@
-# src/contact_book_app/src/contact_book_app/presentation/cli_controller.py
-"""
-This module contains the Controller component for the CLI application.
-"""
-import time  # Import the time module
-from typing import TYPE_CHECKING
+# contact_book_app/tests/test_cli_controller.py
+"""Tests for the CLI Controller component, driven through its input loop."""
+import io
+from typing import List
 
-if TYPE_CHECKING:
-    from ..domain.model import ContactService
-    from .cli_view import CLIView
+import pytest
+from contact_book_app.domain.handles import handle_of
+from contact_book_app.domain.model import ContactService
+from contact_book_app.infrastructure.in_memory_repository import InMemoryContactRepository
+from contact_book_app.presentation.cli_controller import CLIController
+from contact_book_app.presentation.cli_view import CLIView
+from contact_book_app.presentation.terminal import Screen
 
 
-class CLIController:
+@pytest.fixture
+def service() -> ContactService:
+    return ContactService(InMemoryContactRepository())
+
+
+@pytest.fixture
+def controller(service: ContactService) -> CLIController:
+    """Provides a controller wired to a real view that draws to a discarded screen."""
+    view = CLIView(service, page_size=2, screen=Screen(io.StringIO()))
+    service.attach(view)
+    return CLIController(service=service, view=view)
+
+
+def _run(controller: CLIController, monkeypatch, *answers: str) -> str:
     """
-    The command-line controller, responsible for handling user input
-    and orchestrating the application flow.
+    Runs the controller loop, answering its prompts in order and then with
+    "exit", and returns everything it printed.
     """
+    replies = iter(answers + ("exit",))
+    printed: List[str] = []
+    monkeypatch.setattr("builtins.input", lambda prompt="": next(replies))
+    monkeypatch.setattr("builtins.print",
+                        lambda *args, **kwargs: printed.append(" ".join(map(str, args))))
+    controller.run()
+    return "\n".join(printed)
+
+
+def _names(service: ContactService):
+    return [c.name for c in service.get_all_contacts()]
+
+
+def test_add_creates_contacts_and_reports_errors(controller: CLIController,
+                                                 service: ContactService, monkeypatch):
+    """Tests that add prompts for a name and optional email, and reports a duplicate."""
+    # ACT
+    output = _run(controller, monkeypatch,
+                  "add", "Alice", "alice@example.com",
+                  "ADD", "Bob", "",
+                  "add", "Clash", "alice@example.com")
+
+    # ASSERT
+    assert [(c.name, c.email) for c in service.get_all_contacts()] == [
+        ("Alice", "alice@example.com"), ("Bob", None)]
+    assert "Error: Email already exists." in output
+    assert output.endswith("Exiting...")
+
+
+def test_update_and_delete_find_contacts_by_handle(controller: CLIController,
+                                                   service: ContactService, monkeypatch):
+    """Tests that update and delete accept a contact's short handle and report unknown ones."""
+    # ARRANGE
+    alice = service.add_contact("Alice", "alice@example.com")
+    bob = service.add_contact("Bob", None)
+
+    # ACT
+    output = _run(controller, monkeypatch,
+                  "update", handle_of(alice.contact_id), "Alicia", "",
+                  "delete", handle_of(bob.contact_id),
+                  "update", "ffffffffffff", "delete", "ffffffffffff")
+
+    # ASSERT
+    assert [(c.name, c.email) for c in service.get_all_contacts()] == [("Alicia", None)]
+    assert output.count("Error: Contact not found.") == 2
+
+
+def test_update_reports_an_email_taken_by_another_contact(controller: CLIController,
+                                                         service: ContactService, monkeypatch):
+    """Tests that an update failing validation is reported and changes nothing."""
+    # ARRANGE
+    service.add_contact("Alice", "alice@example.com")
+    bob = service.add_contact("Bob", "bob@example.com")
+
+    # ACT
+    output = _run(controller, monkeypatch,
+                  "update", handle_of(bob.contact_id), "Bob", "alice@example.com")
+
+    # ASSERT
+    assert "Error: Email already exists." in output
+    assert service.find_by_email("bob@example.com").name == "Bob"
+
+
+def test_list_and_paging_move_the_visible_page(controller: CLIController,
+                                               service: ContactService, monkeypatch):
+    """Tests that next and prev move the view by a page, without going before the start."""
+    # ARRANGE
+    for name in "ABCDE":
+        service.add_contact(name, None)
+
+    # ACT
+    _run(controller, monkeypatch, "list", "next", "next")
+    after_next = controller.view.offset
+    _run(controller, monkeypatch, "prev", "prev", "prev")
+
+    # ASSERT
+    assert after_next == 4
+    assert controller.view.offset == 0
+
+
+def test_sort_and_filter_change_the_view_and_reject_unknown_orders(
+        controller: CLIController, service: ContactService, monkeypatch):
+    """Tests the sort and filter commands, including an unknown order and clearing both."""
+    # ARRANGE
+    service.add_contact("Bob", "bob@work.example")
+    service.add_contact("Alice", "alice@home.example")
+
+    # ACT
+    output = _run(controller, monkeypatch, "sort", "email", "filter", "@Work.Example",
+                  "sort", "age")
+    sorted_state = (controller.view.order, controller.view.domain)
+    _run(controller, monkeypatch, "sort", "", "filter", "")
+
+    # ASSERT
+    assert sorted_state == ("email", "work.example")
+    assert "Error: Unknown sort order." in output
+    assert (controller.view.order, controller.view.domain) == (None, None)
+
+
+def test_search_prints_matches_or_says_there_are_none(controller: CLIController,
+                                                      service: ContactService, monkeypatch):
+    """Tests that search lists the matching contacts below the table."""
+    # ARRANGE
+    service.add_contact("Alice Smith", "alice@example.com")
+    service.add_contact("Bob Jones", None)
+
+    # ACT
+    output = _run(controller, monkeypatch, "search", "smith", "search", "nobody")
+
+    # ASSERT
+    assert "===== Search: smith =====" in output
+    assert "Alice Smith" in output and "Bob Jones" not in output
+    assert "No matching contacts." in output
+
+
+def test_export_and_import_round_trip_and_report_bad_paths(controller: CLIController,
+                                                           service: ContactService,
+                                                           monkeypatch, tmp_path):
+    """
+    Tests that export writes every contact to a file that import reads back,
+    and that unreadable or unwritable paths are reported as errors.
+    """
+    # ARRANGE
+    service.add_contact("Alice", "alice@example.com")
+    service.add_contact("Bob", None)
+    path = str(tmp_path / "book.csv")
+    other = ContactService(InMemoryContactRepository())
+    importer = CLIController(other, CLIView(other, page_size=2, screen=Screen(io.StringIO())))
+
+    # ACT
+    exported = _run(controller, monkeypatch,
+                    "export", path, "export", str(tmp_path / "missing" / "book.csv"))
+    imported = _run(importer, monkeypatch,
+                    "import", path, "import", str(tmp_path / "missing.csv"))
+
+    # ASSERT
+    assert "Exported 2 contacts" in exported
+    assert "Imported 2 of 2 rows" in imported
+    assert _names(other) == ["Alice", "Bob"]
+    assert "Error:" in exported and "Error:" in imported
+
+
+def test_unknown_commands_are_reported(controller: CLIController, monkeypatch):
+    """Tests that an unknown command is reported and the loop keeps going until exit."""
+    # ACT
+    output = _run(controller, monkeypatch, "frobnicate", "")
 
-    def __init__(self, service: 'ContactService', view: 'CLIView'):
-        self.service = service
-        self.view = view
-
-    def _display_menu(self):
-        """Prints the command menu."""
-        print("\n--- Commands ---")
-        print("add    - Add a new contact")
-        print("list   - Refresh the contact list view")
-        print("update - Update a contact (by ID)")
-        print("delete - Delete a contact (by ID)")
-        print("exit   - Exit the application")
-        print("----------------")
-
-    def run(self):
-        """Starts the main application loop."""
-        while True:
-            self._display_menu()
-            command = input("Enter command: ").strip().lower()
-
-            if command == "exit":
-                print("Exiting...")
-                break
-
-            elif command == "add":
-                name = input("Enter name: ").strip()
-                email = input("Enter email (optional): ").strip()
-                if not email:
-                    email = None
-                try:
-                    self.service.add_contact(name=name, email=email)
-                except ValueError as e:
-                    print(f"Error: {e}")
-
-            elif command == "update":
-                try:
-                    list_id = int(input("Enter contact ID to update: ").strip())
-                    contacts = self.service.get_all_contacts()
-                    if 1 <= list_id <= len(contacts):
-                        contact_to_update = contacts[list_id - 1]
-
-                        new_name = input(f"Enter new name for {contact_to_update.name}: ").strip()
-                        new_email = input(f"Enter new email for {contact_to_update.name} (optional): ").strip()
-                        if not new_email:
-                            new_email = None
-
-                        self.service.update_contact(
-                            contact_id=contact_to_update.contact_id,
-                            name=new_name,
-                            email=new_email
-                        )
-                    else:
-                        print("Error: Invalid ID.")
-                except ValueError as e:
-                    print(f"Error: Invalid input. Please enter a number. Details: {e}")
-
-            elif command == "delete":
-                try:
-                    list_id = int(input("Enter contact ID to delete: ").strip())
-                    contacts = self.service.get_all_contacts()
-                    if 1 <= list_id <= len(contacts):
-                        contact_to_delete = contacts[list_id - 1]
-                        self.service.delete_contact(contact_id=contact_to_delete.contact_id)
-                    else:
-                        print("Error: Invalid ID.")
-                except ValueError:
-                    print("Error: Invalid input. Please enter a number.")
-
-            elif command == "list":
-                # Add feedback and a pause for a better user experience.
-                print("Refreshing contact list...")
-                time.sleep(0.75)
-                self.view.display_contacts()
-
-            else:
-                print("Unknown command.")
\ No newline at end of file
+    # ASSERT
+    assert output.count("Unknown command.") == 2
+    assert output.count("--- Commands ---") == 3
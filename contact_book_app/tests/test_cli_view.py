@@ -1,11 +1,17 @@
 # contact_book_app/tests/test_cli_view.py
 """Tests for the CLI View component."""
+import io
 import uuid
 import pytest
 from unittest.mock import MagicMock
+from contact_book_app.domain.handles import handle_of
+from contact_book_app.domain.events import ContactAdded, ContactDeleted, ContactUpdated
 from contact_book_app.domain.model import ContactService
 from contact_book_app.domain.repository import Contact
+from contact_book_app.infrastructure.in_memory_repository import InMemoryContactRepository
+from contact_book_app.presentation.cli_controller import CLIController
 from contact_book_app.presentation.cli_view import CLIView
+from contact_book_app.presentation.terminal import Screen
 
 
 @pytest.fixture
@@ -25,7 +31,7 @@ def test_display_contacts_shows_correct_output(mock_service: MagicMock, capsys):
         Contact(contact_id=uuid.uuid4(), name="Bob", email="bob@example.com")
     ]
     # Configure the mock service to return our sample contacts
-    mock_service.get_all_contacts.return_value = contacts
+    mock_service.list_page.return_value = contacts
 
     view = CLIView(service=mock_service)
 
@@ -49,7 +55,7 @@ def test_view_updates_on_notification(mock_service: MagicMock, capsys):
     """
     # ARRANGE
     contacts = [Contact(contact_id=uuid.uuid4(), name="Charlie", email=None)]
-    mock_service.get_all_contacts.return_value = contacts
+    mock_service.list_page.return_value = contacts
     view = CLIView(service=mock_service)
 
     # ACT
@@ -58,9 +64,210 @@ def test_view_updates_on_notification(mock_service: MagicMock, capsys):
 
     # ASSERT
     # Verify that the view fetched the latest data to display it
-    mock_service.get_all_contacts.assert_called_once()
+    mock_service.list_page.assert_called_once_with(0, view.page_size + 1)
 
     # Verify that the output was rendered
     captured = capsys.readouterr()
     output = captured.out
-    assert "Charlie" in output
\ No newline at end of file
+    assert "Charlie" in output
+
+def test_display_contacts_renders_only_the_visible_page(mock_service: MagicMock, capsys):
+    """
+    Tests that the view asks for a single page and labels rows with the
+    contacts' handles.
+    """
+    # ARRANGE
+    contacts = [Contact(contact_id=uuid.uuid4(), name=f"Person {i}") for i in range(3)]
+    mock_service.list_page.return_value = contacts
+    view = CLIView(service=mock_service, page_size=2)
+    view.next_page()
+
+    # ACT
+    view.display_contacts()
+
+    # ASSERT
+    mock_service.list_page.assert_called_once_with(2, 3)
+    mock_service.get_all_contacts.assert_not_called()
+    output = capsys.readouterr().out
+    assert f"{handle_of(contacts[0].contact_id)} | Person 0" in output
+    assert "Person 2" not in output
+    assert "Showing 3-4 (more)" in output
+
+
+def test_display_search_results_lists_matches(mock_service: MagicMock, capsys):
+    """
+    Tests that search results are printed, or a notice when nothing matched.
+    """
+    # ARRANGE
+    view = CLIView(service=mock_service)
+    match = Contact(contact_id=uuid.uuid4(), name="Alice", email="alice@example.com")
+
+    # ACT
+    view.display_search_results("ali", [match])
+    view.display_search_results("zzz", [])
+
+    # ASSERT
+    output = capsys.readouterr().out
+    assert "Search: ali" in output
+    assert "alice@example.com" in output
+    assert "No matching contacts." in output
+
+
+def test_view_patches_updated_and_added_rows_without_refetching(mock_service: MagicMock, capsys):
+    """
+    Tests that update and add events are applied to the cached page instead
+    of fetching the contacts again.
+    """
+    # ARRANGE
+    alice = Contact(contact_id=uuid.uuid4(), name="Alice", email="alice@example.com")
+    mock_service.list_page.return_value = [alice]
+    view = CLIView(service=mock_service)
+    view.display_contacts()
+    renamed = Contact(contact_id=alice.contact_id, name="Alicia", email="alice@example.com")
+    bob = Contact(contact_id=uuid.uuid4(), name="Bob")
+
+    # ACT
+    view.update(mock_service, [ContactUpdated(renamed, alice), ContactAdded(bob)])
+
+    # ASSERT
+    mock_service.list_page.assert_called_once()
+    output = capsys.readouterr().out.split("\x1b[2J")[-1]
+    assert f"{handle_of(alice.contact_id)} | Alicia" in output
+    assert f"{handle_of(bob.contact_id)} | Bob" in output
+
+
+def test_view_refetches_the_page_after_a_delete(mock_service: MagicMock, capsys):
+    """
+    Tests that a deletion makes the view fetch the visible page again.
+    """
+    # ARRANGE
+    alice = Contact(contact_id=uuid.uuid4(), name="Alice")
+    mock_service.list_page.return_value = [alice]
+    view = CLIView(service=mock_service)
+    view.display_contacts()
+    mock_service.list_page.return_value = []
+
+    # ACT
+    view.update(mock_service, [ContactDeleted(alice)])
+
+    # ASSERT
+    assert mock_service.list_page.call_count == 2
+    assert "No contacts found." in capsys.readouterr().out
+
+
+def test_redraw_rewrites_only_the_changed_rows(mock_service: MagicMock):
+    """
+    Tests that after the first frame a change redraws only the rows that
+    differ, without clearing the screen.
+    """
+    # ARRANGE
+    people = [Contact(contact_id=uuid.uuid4(), name=f"Person {i}") for i in range(5)]
+    mock_service.list_page.return_value = people
+    out = io.StringIO()
+    view = CLIView(service=mock_service, page_size=10, screen=Screen(out))
+    view.display_contacts()
+    first_frame = out.getvalue()
+    out.truncate(0)
+    out.seek(0)
+    renamed = Contact(contact_id=people[2].contact_id, name="Renamed")
+
+    # ACT
+    view.update(mock_service, [ContactUpdated(renamed, people[2])])
+
+    # ASSERT
+    frame = out.getvalue()
+    assert first_frame.startswith("\x1b[H\x1b[2J")
+    assert "\x1b[2J" not in frame
+    assert f"{handle_of(renamed.contact_id)} | Renamed" in frame
+    assert "Person" not in frame
+    assert frame.count("\x1b[K") == 1
+
+
+def test_page_size_fits_the_terminal_height(mock_service: MagicMock, monkeypatch):
+    """Tests that without an explicit page size the view fills the terminal."""
+    # ARRANGE
+    monkeypatch.setenv("LINES", "60")
+    monkeypatch.setenv("COLUMNS", "100")
+    mock_service.list_page.return_value = []
+
+    # ACT
+    view = CLIView(service=mock_service, screen=Screen(io.StringIO()))
+    monkeypatch.setenv("LINES", "40")
+    view.display_contacts()
+
+    # ASSERT
+    mock_service.list_page.assert_called_once_with(0, 40 - 6 + 1)
+
+
+def test_prompts_under_a_full_page_stay_on_screen(monkeypatch):
+    """
+    Tests that a full page leaves room for the menu and every prompt of an
+    update, so the screen does not scroll before the next redraw, and that
+    an error printed without a redraw makes the next frame a full repaint.
+    """
+    # ARRANGE
+    monkeypatch.setenv("LINES", "40")
+    monkeypatch.setenv("COLUMNS", "100")
+    service = ContactService(InMemoryContactRepository())
+    contacts = [service.add_contact(f"Person {i}", None) for i in range(100)]
+    out = io.StringIO()
+    view = CLIView(service, screen=Screen(out))
+    controller = CLIController(service, view)
+    service.attach(view)
+    view.display_contacts()
+    frame_height = len(view.screen._lines)
+    out.truncate(0)
+    out.seek(0)
+    below = [0]  # Lines written under the table since the last frame
+    frames = []
+
+    def draw(lines, draw=view.screen.draw):
+        below.append(0)
+        draw(lines)
+        frames.append(out.getvalue())
+        out.truncate(0)
+        out.seek(0)
+
+    def written(text):
+        below[-1] += text.count("\n") + 1
+
+    replies = iter(["update", handle_of(contacts[0].contact_id), "Renamed", "",
+                    "update", "ffffffffffff", "list", "exit"])
+    monkeypatch.setattr(view.screen, "draw", draw)
+    monkeypatch.setattr("builtins.input", lambda prompt="": written(prompt) or next(replies))
+    monkeypatch.setattr("builtins.print", lambda *args, **kwargs: written(" ".join(map(str, args))))
+
+    # ACT
+    controller.run()
+
+    # ASSERT
+    assert len(view._rows) == view.page_size == 40 - 6 - 20
+    assert frame_height + below[0] + 1 <= 40  # Plus the line the cursor is left on
+    assert "\x1b[2J" not in frames[0]
+    assert frames[1].startswith("\x1b[H\x1b[2J")
+
+
+def test_sorted_view_reads_pages_from_the_sorted_views(mock_service: MagicMock, capsys):
+    """
+    Tests that with a sort order and a domain filter the view pages through
+    list_sorted() and refetches the page on every change.
+    """
+    # ARRANGE
+    alice = Contact(contact_id=uuid.uuid4(), name="Alice", email="alice@example.com")
+    mock_service.list_sorted.return_value = [alice]
+    view = CLIView(service=mock_service, page_size=10)
+    view.next_page()
+
+    # ACT
+    view.sort_by("email")
+    view.filter_by_domain(" @Example.COM")
+    view.display_contacts()
+    view.update(mock_service, [ContactAdded(alice)])
+
+    # ASSERT
+    mock_service.list_sorted.assert_called_with("email", 0, 11, "example.com")
+    assert mock_service.list_sorted.call_count == 2
+    mock_service.list_page.assert_not_called()
+    assert "Sorted by email, @example.com only" in capsys.readouterr().out
+    with pytest.raises(ValueError, match="Unknown sort order."):
+        view.sort_by("age")
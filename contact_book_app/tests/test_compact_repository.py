@@ -0,0 +1,153 @@
+"""Tests for the columnar, memory-compact repository implementation."""
+import uuid
+import pytest
+from contact_book_app.domain.repository import Contact
+from contact_book_app.infrastructure.compact_repository import ColumnarContactRepository, SlottedContact
+
+
+def test_columnar_repository_can_add_get_and_list():
+    """
+    Tests that contacts round-trip through the columns in insertion order.
+    """
+    # ARRANGE
+    repo = ColumnarContactRepository()
+    first = Contact(contact_id=uuid.uuid4(), name="John Doe", email="john@example.com")
+    second = Contact(contact_id=uuid.uuid4(), name="John Doe")
+
+    # ACT
+    repo.add_many([first, second])
+
+    # ASSERT
+    assert repo.get(first.contact_id) == first
+    assert repo.get(uuid.uuid4()) is None
+    assert repo.list() == [first, second]
+    assert repo.find_by_email("john@example.com") == first
+    assert not repo.email_exists("nobody@example.com")
+
+
+def test_columnar_repository_returns_copies():
+    """
+    Tests that mutating a returned contact does not change the stored one
+    until it is passed to update().
+    """
+    # ARRANGE
+    repo = ColumnarContactRepository()
+    contact_id = uuid.uuid4()
+    repo.add(Contact(contact_id=contact_id, name="John Doe", email="old@example.com"))
+
+    # ACT
+    stored = repo.get(contact_id)
+    stored.email = "new@example.com"
+
+    # ASSERT
+    assert repo.get(contact_id).email == "old@example.com"
+
+    # ACT
+    repo.update(stored)
+
+    # ASSERT
+    assert repo.get(contact_id) == stored
+    assert not repo.email_exists("old@example.com")
+    assert repo.find_by_email("new@example.com") == stored
+
+
+def test_columnar_repository_rejects_duplicate_emails():
+    """
+    Tests that an email owned by one contact cannot be given to another.
+    """
+    # ARRANGE
+    repo = ColumnarContactRepository()
+    owner = Contact(contact_id=uuid.uuid4(), name="John Doe", email="john@example.com")
+    other = Contact(contact_id=uuid.uuid4(), name="Jane Doe")
+    repo.add_many([owner, other])
+
+    # ACT & ASSERT
+    with pytest.raises(ValueError, match="Email already exists."):
+        repo.add(Contact(contact_id=uuid.uuid4(), name="Impostor", email="john@example.com"))
+    with pytest.raises(ValueError, match="Email already exists."):
+        repo.update(Contact(contact_id=other.contact_id, name="Jane Doe", email="john@example.com"))
+    assert repo.list() == [owner, other]
+
+
+def test_columnar_repository_deletes_and_compacts():
+    """
+    Tests that deleting most contacts keeps lookups, indexes and paging correct
+    across compaction of the columns.
+    """
+    # ARRANGE
+    repo = ColumnarContactRepository()
+    contacts = [Contact(contact_id=uuid.uuid4(), name=f"Person {i}", email=f"p{i}@example.com")
+                for i in range(6)]
+    repo.add_many(contacts)
+
+    # ACT
+    for contact in contacts[:4]:
+        repo.delete(contact.contact_id)
+    repo.delete(uuid.uuid4())
+
+    # ASSERT
+    assert repo.list() == contacts[4:]
+    assert repo.get(contacts[0].contact_id) is None
+    assert not repo.email_exists("p0@example.com")
+    assert repo.find_by_email("p5@example.com") == contacts[5]
+    assert repo.list_page(1, 5) == contacts[5:]
+    assert repo.list_after(contacts[4].contact_id, 5) == contacts[5:]
+    with pytest.raises(ValueError, match="Contact not found."):
+        repo.list_after(contacts[0].contact_id, 5)
+
+
+def test_columnar_repository_gives_an_email_to_a_contact_without_one():
+    """
+    Tests that setting the email of a contact that has none stores it, even
+    when it matches the start of the email heap.
+    """
+    # ARRANGE
+    repo = ColumnarContactRepository()
+    alice = Contact(contact_id=uuid.uuid4(), name="Alice", email="a@x.co")
+    bob = Contact(contact_id=uuid.uuid4(), name="Bob", email=None)
+    repo.add_many([alice, bob])
+
+    # ACT
+    repo.update(Contact(contact_id=bob.contact_id, name="Bob", email="a@x.c"))
+
+    # ASSERT
+    assert repo.get(bob.contact_id).email == "a@x.c"
+    assert repo.find_by_email("a@x.c").contact_id == bob.contact_id
+    assert repo.find_by_email("a@x.co") == alice
+
+
+def test_columnar_repository_compaction_keeps_only_live_emails():
+    """Tests that compaction copies no bytes into the heap for contacts without an email."""
+    # ARRANGE
+    repo = ColumnarContactRepository()
+    contacts = [Contact(contact_id=uuid.uuid4(), name=f"Person {i}",
+                        email=f"p{i}@example.com" if i % 2 else None)
+                for i in range(10)]
+    repo.add_many(contacts)
+
+    # ACT
+    for contact in contacts[:6]:
+        repo.delete(contact.contact_id)
+
+    # ASSERT
+    live_emails = [c.email for c in contacts[6:] if c.email]
+    assert repo._holes == 0  # Compacted
+    assert len(repo._email_heap) == sum(len(e) for e in live_emails)
+    assert repo.list() == contacts[6:]
+    assert all(repo.find_by_email(email).email == email for email in live_emails)
+
+
+def test_slotted_contact_round_trips_a_contact():
+    """
+    Tests that the slotted record converts to and from a Contact.
+    """
+    # ARRANGE
+    contact = Contact(contact_id=uuid.uuid4(), name="John Doe", email="john@example.com")
+
+    # ACT
+    record = SlottedContact.from_contact(contact)
+
+    # ASSERT
+    assert not hasattr(record, "__dict__")
+    assert record.to_contact() == contact
+    assert record == SlottedContact(contact.contact_id.int, "John Doe", "john@example.com")
@@ -0,0 +1,143 @@
+# contact_book_app/tests/test_concurrency.py
+"""Stress tests for sharing the service and repository between threads."""
+import random
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+import pytest
+from contact_book_app.domain.concurrency import ReadWriteLock
+from contact_book_app.domain.model import ContactService
+from contact_book_app.infrastructure.in_memory_repository import InMemoryContactRepository
+from contact_book_app.infrastructure.thread_safe_repository import ThreadSafeContactRepository
+
+THREADS = 16
+OPERATIONS = 300
+EMAILS = [f"user{i}@example.com" for i in range(200)]
+
+
+class YieldingRepository(InMemoryContactRepository):
+    """An in-memory repository that gives up the CPU after every email lookup,
+    widening the window between a uniqueness check and the following write."""
+
+    def email_exists(self, email: str) -> bool:
+        exists = super().email_exists(email)
+        time.sleep(0)
+        return exists
+
+    def find_by_email(self, email: str):
+        contact = super().find_by_email(email)
+        time.sleep(0)
+        return contact
+
+
+@pytest.fixture(autouse=True)
+def frequent_thread_switches():
+    """Makes the interpreter switch threads often to provoke races."""
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def test_concurrent_writers_never_duplicate_an_email():
+    """
+    Tests that threads racing to add, update and delete contacts with a
+    shared pool of emails keep every email unique, and that every listing
+    they take is a consistent snapshot.
+    """
+    # ARRANGE
+    repo = ThreadSafeContactRepository(YieldingRepository())
+    service = ContactService(repo=repo, thread_safe=True)
+    failures = []
+
+    def worker(seed: int) -> None:
+        rng = random.Random(seed)
+        try:
+            for _ in range(OPERATIONS):
+                action = rng.random()
+                try:
+                    if action < 0.5:
+                        service.add_contact(name=f"Worker {seed}", email=rng.choice(EMAILS))
+                    elif action < 0.7:
+                        page = service.list_page(rng.randrange(50), 5)
+                        if page:
+                            contact = rng.choice(page)
+                            service.update_contact(contact.contact_id, contact.name, rng.choice(EMAILS))
+                    elif action < 0.8:
+                        page = service.list_page(rng.randrange(50), 1)
+                        if page:
+                            service.delete_contact(page[0].contact_id)
+                    else:
+                        emails = Counter(c.email for c in service.get_all_contacts())
+                        if emails and emails.most_common(1)[0][1] > 1:
+                            failures.append(emails.most_common(1)[0])
+                except ValueError:
+                    pass  # Email taken or contact deleted by another thread
+        except Exception as e:  # pragma: no cover - reported below
+            failures.append(e)
+
+    threads = [threading.Thread(target=worker, args=(seed,)) for seed in range(THREADS)]
+
+    # ACT
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # ASSERT
+    assert failures == []
+    contacts = service.get_all_contacts()
+    emails = [contact.email for contact in contacts]
+    assert len(emails) == len(set(emails))
+    for contact in contacts:
+        assert repo.find_by_email(contact.email) == contact
+    assert all(repo.email_exists(email) == (email in emails) for email in EMAILS)
+
+
+def test_read_write_lock_excludes_readers_while_writing():
+    """Tests that no reader ever observes a write in progress."""
+    # ARRANGE
+    lock = ReadWriteLock()
+    state = {"a": 0, "b": 0}
+    torn = []
+
+    def writer() -> None:
+        for i in range(2000):
+            with lock.write():
+                state["a"] = i
+                state["b"] = i
+
+    def reader() -> None:
+        for _ in range(2000):
+            with lock.read():
+                if state["a"] != state["b"]:
+                    torn.append(dict(state))
+
+    threads = [threading.Thread(target=writer)] + [threading.Thread(target=reader) for _ in range(4)]
+
+    # ACT
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # ASSERT
+    assert torn == []
+
+
+def test_thread_safe_repository_hands_out_copies():
+    """Tests that mutating a fetched contact does not touch the stored one."""
+    # ARRANGE
+    repo = ThreadSafeContactRepository(InMemoryContactRepository())
+    service = ContactService(repo=repo, thread_safe=True)
+    contact = service.add_contact(name="Jane Doe", email="jane@example.com")
+
+    # ACT
+    fetched = repo.get(contact.contact_id)
+    fetched.name = "Changed"
+
+    # ASSERT
+    assert repo.get(contact.contact_id).name == "Jane Doe"
+    assert repo.get(uuid.uuid4()) is None
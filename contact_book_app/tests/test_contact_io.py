@@ -0,0 +1,108 @@
+# contact_book_app/tests/test_contact_io.py
+"""Tests for the streaming contact importers and exporters."""
+import gzip
+import io
+import pytest
+from contact_book_app.domain.model import ContactService
+from contact_book_app.infrastructure.contact_io import (
+    detect_format, export_contacts, import_contacts, read_vcard, write_vcard)
+from contact_book_app.infrastructure.in_memory_repository import InMemoryContactRepository
+
+
+@pytest.fixture
+def service() -> ContactService:
+    """Provides a service over an empty in-memory repository."""
+    return ContactService(InMemoryContactRepository())
+
+
+@pytest.mark.parametrize("filename", ["book.csv", "book.jsonl", "book.vcf", "book.csv.gz", "book.vcf.gz"])
+def test_export_then_import_round_trips_contacts(service: ContactService, tmp_path, filename: str):
+    """
+    Tests that every format, with and without gzip, carries names (including
+    characters that need escaping) and emails through an export and import.
+    """
+    # ARRANGE
+    service.add_contact("Doe, Jane; \"JD\"", "jane@example.com")
+    service.add_contact("Zoë Ünicode")
+    path = str(tmp_path / filename)
+    target = ContactService(InMemoryContactRepository())
+
+    # ACT
+    exported = export_contacts(service, path)
+    imported = import_contacts(target, path, batch_size=1)
+
+    # ASSERT
+    assert (exported.rows, imported.rows, imported.added) == (2, 2, 2)
+    assert [(c.name, c.email) for c in target.get_all_contacts()] == [
+        ("Doe, Jane; \"JD\"", "jane@example.com"), ("Zoë Ünicode", None)]
+    if filename.endswith(".gz"):
+        with open(path, "rb") as f:
+            assert f.read(2) == b"\x1f\x8b"
+
+
+def test_import_reports_rejected_rows_with_file_positions(service: ContactService, tmp_path):
+    """
+    Tests that rejected rows are reported with their position in the whole
+    file across batches, and progress is reported after each batch.
+    """
+    # ARRANGE
+    path = tmp_path / "book.csv"
+    path.write_text("Email,Name\na@example.com,Alice\nb@example.com,\na@example.com,Again\n,Carol\n")
+    progress = []
+
+    # ACT
+    report = import_contacts(service, str(path), batch_size=2, progress=progress.append)
+
+    # ASSERT
+    assert report.added == 2
+    assert [(error.row, error.message) for error in report.errors] == [
+        (2, "Name cannot be empty."), (3, "Email already exists.")]
+    assert progress == [2, 4]
+
+
+def test_import_reports_unparsable_json_lines_as_rows(service: ContactService, tmp_path):
+    """
+    Tests that malformed JSON and JSON values other than objects are
+    reported per row, and the rows around them are still imported.
+    """
+    # ARRANGE
+    path = tmp_path / "book.jsonl"
+    path.write_text('{"name": "Alice"}\n{"name": "Bob", \n\n["Carol"]\n'
+                    '{"name": ""}\n{"name": "Dave", "email": "d@example.com"}\n')
+
+    # ACT
+    report = import_contacts(service, str(path), batch_size=3)
+
+    # ASSERT
+    assert (report.rows, report.added) == (5, 2)
+    assert [(error.row, error.message) for error in report.errors] == [
+        (2, "Invalid JSON: Expecting property name enclosed in double quotes."),
+        (3, "Expected a JSON object."), (4, "Name cannot be empty.")]
+    assert [c.name for c in service.get_all_contacts()] == ["Alice", "Dave"]
+
+
+def test_read_vcard_handles_folding_parameters_and_versions():
+    """Tests parsing of folded lines, typed emails and cards without FN."""
+    # ARRANGE
+    text = ("BEGIN:VCARD\r\nVERSION:3.0\r\nFN:Jane\r\n  Doe\r\n"
+            "item1.EMAIL;TYPE=INTERNET,pref:jane@example.com\r\nEND:VCARD\r\n"
+            "BEGIN:VCARD\r\nVERSION:4.0\r\nN:Smith;John;;;\r\nEND:VCARD\r\n")
+
+    # ACT
+    rows = list(read_vcard(io.StringIO(text)))
+
+    # ASSERT
+    assert rows == [("Jane Doe", "jane@example.com"), ("John Smith", None)]
+
+
+def test_write_vcard_rejects_unknown_versions():
+    """Tests that only vCard 3.0 and 4.0 can be written."""
+    with pytest.raises(ValueError, match="3.0 or 4.0"):
+        list(write_vcard(io.StringIO(), [], version="2.1"))
+
+
+def test_detect_format_uses_the_extension():
+    """Tests format detection, looking through a .gz suffix."""
+    assert detect_format("x.NDJSON.gz") == "jsonl"
+    with pytest.raises(ValueError, match="Unknown contact file format"):
+        detect_format("x.txt")
@@ -3,10 +3,11 @@
 
 import uuid
 import pytest
-from unittest.mock import MagicMock, ANY
+from unittest.mock import MagicMock
 from contact_book_app.domain.repository import AbstractContactRepository, Contact
+from contact_book_app.domain.events import ContactAdded, ContactDeleted, ContactUpdated
 from contact_book_app.domain.model import ContactService
-from contact_book_app.domain.observer import Observer
+from contact_book_app.domain.observer import BackgroundObservable, Observer
 
 
 @pytest.fixture
@@ -16,7 +17,11 @@ def mock_repo() -> MagicMock:
     # This ensures that calling an unimplemented method on the mock will fail the test
     methods = [func for func in dir(AbstractContactRepository) if
                callable(getattr(AbstractContactRepository, func)) and not func.startswith("__")]
-    return MagicMock(spec=AbstractContactRepository, **{method: MagicMock() for method in methods})
+    repo = MagicMock(spec=AbstractContactRepository, **{method: MagicMock() for method in methods})
+    # By default the email index reports that no email is taken
+    repo.email_exists.return_value = False
+    repo.find_by_email.return_value = None
+    return repo
 
 
 @pytest.fixture
@@ -60,15 +65,16 @@ def test_add_contact_with_duplicate_email_raises_error(mock_repo: MagicMock):
     Tests that adding a contact with a pre-existing email raises a ValueError.
     """
     # ARRANGE
-    existing_contact = Contact(contact_id=ANY, name="John Doe", email="john.doe@example.com")
-    mock_repo.list.return_value = [existing_contact]
+    mock_repo.email_exists.return_value = True
     service = ContactService(repo=mock_repo)
 
     # ACT & ASSERT
     with pytest.raises(ValueError, match="Email already exists."):
         service.add_contact(name="Jane Doe", email="john.doe@example.com")
 
+    mock_repo.email_exists.assert_called_once_with("john.doe@example.com")
     mock_repo.add.assert_not_called()
+    mock_repo.list.assert_not_called()
 
 
 def test_delete_contact_successfully(mock_repo: MagicMock):
@@ -97,8 +103,8 @@ def test_update_contact_successfully(mock_repo: MagicMock):
 
     # Configure mock repo to return the original contact when 'get' is called
     mock_repo.get.return_value = original_contact
-    # Configure list to return an empty list for the duplicate email check
-    mock_repo.list.return_value = []
+    # Configure the email index to report that the new email is free
+    mock_repo.find_by_email.return_value = None
 
     # ACT
     updated_contact = service.update_contact(
@@ -147,7 +153,7 @@ def test_update_contact_to_duplicate_email_raises_error(mock_repo: MagicMock):
 
     # Configure mock repo
     mock_repo.get.return_value = contact_to_update
-    mock_repo.list.return_value = [contact_to_update, existing_contact]
+    mock_repo.find_by_email.return_value = existing_contact
 
     # ACT & ASSERT
     with pytest.raises(ValueError, match="Email already exists."):
@@ -164,10 +170,10 @@ def test_service_notifies_observers_on_add(mock_repo: MagicMock, mock_observer:
     mock_repo.list.return_value = []
 
     # ACT
-    service.add_contact(name="Test", email="test@example.com")
+    contact = service.add_contact(name="Test", email="test@example.com")
 
     # ASSERT
-    mock_observer.update.assert_called_once_with(service)
+    mock_observer.update.assert_called_once_with(service, [ContactAdded(contact)])
 
 
 def test_service_notifies_observers_on_update(mock_repo: MagicMock, mock_observer: MagicMock):
@@ -180,10 +186,11 @@ def test_service_notifies_observers_on_update(mock_repo: MagicMock, mock_observe
     mock_repo.get.return_value = original_contact
 
     # ACT
-    service.update_contact(contact_id=contact_id, name="New", email="new@example.com")
+    updated = service.update_contact(contact_id=contact_id, name="New", email="new@example.com")
 
     # ASSERT
-    mock_observer.update.assert_called_once_with(service)
+    previous = Contact(contact_id=contact_id, name="Old", email="old@example.com")
+    mock_observer.update.assert_called_once_with(service, [ContactUpdated(updated, previous)])
 
 
 def test_service_notifies_observers_on_delete(mock_repo: MagicMock, mock_observer: MagicMock):
@@ -191,12 +198,29 @@ def test_service_notifies_observers_on_delete(mock_repo: MagicMock, mock_observe
     # ARRANGE
     service = ContactService(repo=mock_repo)
     service.attach(mock_observer)
+    contact = Contact(contact_id=uuid.uuid4(), name="Test")
+    mock_repo.get.return_value = contact
+
+    # ACT
+    service.delete_contact(contact_id=contact.contact_id)
+
+    # ASSERT
+    mock_observer.update.assert_called_once_with(service, [ContactDeleted(contact)])
+
+
+def test_service_does_not_notify_when_deleting_a_missing_contact(mock_repo: MagicMock, mock_observer: MagicMock):
+    """Tests that deleting an unknown ID changes nothing and notifies nobody."""
+    # ARRANGE
+    service = ContactService(repo=mock_repo)
+    service.attach(mock_observer)
+    mock_repo.get.return_value = None
 
     # ACT
     service.delete_contact(contact_id=uuid.uuid4())
 
     # ASSERT
-    mock_observer.update.assert_called_once_with(service)
+    mock_repo.delete.assert_not_called()
+    mock_observer.update.assert_not_called()
 
 
 def test_service_does_not_notify_on_error(mock_repo: MagicMock, mock_observer: MagicMock):
@@ -209,4 +233,138 @@ def test_service_does_not_notify_on_error(mock_repo: MagicMock, mock_observer: M
     with pytest.raises(ValueError):
         service.add_contact(name="")
 
-    mock_observer.update.assert_not_called()
\ No newline at end of file
+    mock_observer.update.assert_not_called()
+
+def test_add_contacts_bulk_inserts_valid_rows_and_reports_errors(mock_repo: MagicMock, mock_observer: MagicMock):
+    """
+    Tests that a bulk add writes all valid rows in one batch, reports invalid
+    rows (including duplicates within the batch) and notifies only once.
+    """
+    # ARRANGE
+    service = ContactService(repo=mock_repo)
+    service.attach(mock_observer)
+    mock_repo.email_exists.side_effect = lambda email: email == "taken@example.com"
+    rows = [
+        ("Alice", "alice@example.com"),
+        ("", "nameless@example.com"),
+        ("Bob", "taken@example.com"),
+        ("Alice Again", "alice@example.com"),
+        ("Carol", ""),
+    ]
+
+    # ACT
+    result = service.add_contacts_bulk(rows)
+
+    # ASSERT
+    assert [contact.name for contact in result.added] == ["Alice", "Carol"]
+    assert result.added[1].email is None
+    assert [(error.row, error.message) for error in result.errors] == [
+        (2, "Name cannot be empty."),
+        (3, "Email already exists."),
+        (4, "Email already exists."),
+    ]
+    mock_repo.add_many.assert_called_once_with(result.added)
+    mock_repo.add.assert_not_called()
+    mock_observer.update.assert_called_once_with(
+        service, [ContactAdded(contact) for contact in result.added])
+
+
+def test_add_contacts_bulk_with_no_valid_rows_does_not_notify(mock_repo: MagicMock, mock_observer: MagicMock):
+    """Tests that a bulk add with nothing to insert neither writes nor notifies."""
+    # ARRANGE
+    service = ContactService(repo=mock_repo)
+    service.attach(mock_observer)
+
+    # ACT
+    result = service.add_contacts_bulk([("", None)])
+
+    # ASSERT
+    assert result.added == []
+    assert len(result.errors) == 1
+    mock_repo.add_many.assert_not_called()
+    mock_observer.update.assert_not_called()
+
+
+def test_service_delegates_paging_to_the_repository(mock_repo: MagicMock):
+    """Tests that paged and streamed listings come straight from the repository."""
+    # ARRANGE
+    service = ContactService(repo=mock_repo)
+    cursor = uuid.uuid4()
+
+    # ACT
+    service.list_page(10, 5)
+    service.list_after(cursor, 5)
+    service.iter_contacts()
+
+    # ASSERT
+    mock_repo.list_page.assert_called_once_with(10, 5)
+    mock_repo.list_after.assert_called_once_with(cursor, 5)
+    mock_repo.iter_contacts.assert_called_once_with()
+    mock_repo.list.assert_not_called()
+
+
+def test_service_search_delegates_to_the_repository(mock_repo: MagicMock):
+    """Tests that searches are answered by the repository."""
+    # ARRANGE
+    service = ContactService(repo=mock_repo)
+
+    # ACT
+    service.search("smith", limit=5)
+
+    # ASSERT
+    mock_repo.search.assert_called_once_with("smith", 5)
+
+
+def test_service_find_duplicates_reads_the_whole_book(mock_repo: MagicMock):
+    """Tests that duplicate detection streams contacts from the repository."""
+    # ARRANGE
+    first = Contact(contact_id=uuid.uuid4(), name="John Smith")
+    second = Contact(contact_id=uuid.uuid4(), name="Jon Smith")
+    mock_repo.iter_contacts.return_value = iter([first, second])
+    service = ContactService(repo=mock_repo)
+
+    # ACT
+    suggestions = service.find_duplicates(threshold=0.8, workers=1)
+
+    # ASSERT
+    assert [(s.first, s.second) for s in suggestions] == [(first, second)]
+    mock_repo.list.assert_not_called()
+
+
+def test_service_can_notify_in_the_background(mock_repo: MagicMock, mock_observer: MagicMock):
+    """Tests that a service built with a BackgroundObservable notifies through it."""
+    # ARRANGE
+    observable = BackgroundObservable(debounce=0)
+    service = ContactService(repo=mock_repo, observable=observable)
+    service.attach(mock_observer)
+
+    # ACT
+    contact = service.add_contact(name="Jane Doe")
+    observable.close()
+
+    # ASSERT
+    mock_observer.update.assert_called_once_with(service, [ContactAdded(contact)])
+
+
+def test_find_by_handle_resolves_unique_prefixes_only(mock_repo: MagicMock):
+    """
+    Tests that a handle is normalized before the prefix lookup, and that
+    malformed, unknown and ambiguous handles are rejected.
+    """
+    # ARRANGE
+    service = ContactService(repo=mock_repo)
+    contact = Contact(contact_id=uuid.uuid4(), name="Jane Doe")
+    mock_repo.find_by_id_prefix.side_effect = [[contact], [], [contact, contact]]
+
+    # ACT
+    found = service.find_by_handle(" ABCD-12 ")
+
+    # ASSERT
+    assert found is contact
+    mock_repo.find_by_id_prefix.assert_called_once_with("abcd12", 2)
+    with pytest.raises(ValueError, match="not found"):
+        service.find_by_handle("abcd")
+    with pytest.raises(ValueError, match="Ambiguous"):
+        service.find_by_handle("abcd")
+    with pytest.raises(ValueError, match="Invalid contact handle."):
+        service.find_by_handle("xyz!")
@@ -0,0 +1,68 @@
+# contact_book_app/tests/test_duplicates.py
+"""Tests for the duplicate contact detection pipeline."""
+import uuid
+import pytest
+from contact_book_app.domain.duplicates import find_duplicates, jaro_winkler, normalize_email, soundex
+from contact_book_app.domain.repository import Contact
+
+
+def _contact(name: str, email: str = None) -> Contact:
+    return Contact(contact_id=uuid.uuid4(), name=name, email=email)
+
+
+@pytest.mark.parametrize("word, code", [
+    ("Robert", "R163"), ("Rupert", "R163"), ("Tymczak", "T522"),
+    ("Ashcraft", "A261"), ("Jon", "J500"), ("John", "J500"), ("", ""),
+])
+def test_soundex_codes(word: str, code: str):
+    """Tests Soundex against the reference examples."""
+    assert soundex(word) == code
+
+
+def test_normalize_email_folds_provider_variants():
+    """Tests that dot and plus-tag variants reduce to the same mailbox."""
+    assert normalize_email("John.Smith+news@GoogleMail.com") == "johnsmith@gmail.com"
+    assert normalize_email("john.smith+news@example.com") == "john.smith@example.com"
+    assert normalize_email(None) == ""
+
+
+def test_jaro_winkler_similarity():
+    """Tests the similarity measure on known values."""
+    assert jaro_winkler("martha", "marhta") == pytest.approx(0.961, abs=1e-3)
+    assert jaro_winkler("same", "same") == 1.0
+    assert jaro_winkler("abc", "") == 0.0
+
+
+def test_find_duplicates_ranks_likely_pairs():
+    """
+    Tests that name variants and email variants are suggested, best first,
+    and unrelated contacts are not.
+    """
+    # ARRANGE
+    john = _contact("John Smith", "john.smith@gmail.com")
+    jon = _contact("Jon Smith")
+    johnny = _contact("J. Smith", "johnsmith+work@gmail.com")
+    other = _contact("Alice Jones", "alice@example.com")
+
+    # ACT
+    suggestions = find_duplicates([john, jon, johnny, other])
+
+    # ASSERT
+    pairs = [({s.first.name, s.second.name}, s.score) for s in suggestions]
+    assert pairs[0] == ({"John Smith", "J. Smith"}, 1.0)
+    assert pairs[1][0] == {"John Smith", "Jon Smith"}
+    assert all("Alice Jones" not in names for names, _ in pairs)
+
+
+def test_find_duplicates_in_parallel_matches_serial():
+    """Tests that scoring across worker processes gives the same result."""
+    # ARRANGE
+    contacts = [_contact(f"{first} Smith") for first in ["Jon", "John", "Joan", "Jonah", "Jan"]]
+
+    # ACT
+    serial = find_duplicates(contacts, threshold=0.8, workers=1)
+    parallel = find_duplicates(contacts, threshold=0.8, workers=2, parallel_threshold=1)
+
+    # ASSERT
+    assert serial
+    assert [(s.first, s.second, s.score) for s in parallel] == [(s.first, s.second, s.score) for s in serial]
@@ -0,0 +1,158 @@
+# contact_book_app/tests/test_durable_repository.py
+"""Tests for the durable, log-backed in-memory repository."""
+import os
+import subprocess
+import sys
+import time
+import uuid
+import contact_book_app
+from contact_book_app.domain.repository import Contact
+from contact_book_app.infrastructure.durable_repository import DurableContactRepository
+
+
+def _contacts(count: int):
+    return [Contact(contact_id=uuid.uuid4(), name=f"Person {i}", email=f"p{i}@example.com")
+            for i in range(count)]
+
+
+def test_durable_repository_replays_the_log_after_restart(tmp_path):
+    """
+    Tests that adds, updates and deletes survive reopening the directory,
+    including when the stored contact was mutated in place before update().
+    """
+    # ARRANGE
+    contacts = _contacts(3)
+    repo = DurableContactRepository(str(tmp_path))
+    repo.add(contacts[0])
+    repo.add_many(contacts[1:])
+    stored = repo.get(contacts[0].contact_id)
+    stored.name = "Renamed"
+    repo.update(stored)
+    repo.delete(contacts[1].contact_id)
+    repo.close()
+
+    # ACT
+    reopened = DurableContactRepository(str(tmp_path))
+
+    # ASSERT
+    assert [c.name for c in reopened.list()] == ["Renamed", "Person 2"]
+    assert reopened.find_by_email("p2@example.com") == contacts[2]
+    assert not reopened.email_exists("p1@example.com")
+    reopened.close()
+
+
+def test_durable_repository_snapshots_and_compacts_the_log(tmp_path):
+    """
+    Tests that a snapshot truncates the log and that changes made after it
+    are replayed on top of the snapshot.
+    """
+    # ARRANGE
+    contacts = _contacts(5)
+    repo = DurableContactRepository(str(tmp_path), snapshot_every=4)
+    repo.add_many(contacts[:4])  # Reaches snapshot_every
+    log_size_after_snapshot = os.path.getsize(tmp_path / "contacts.log")
+    repo.add(contacts[4])
+    repo.delete(contacts[0].contact_id)
+    repo.close()
+
+    # ACT
+    reopened = DurableContactRepository(str(tmp_path))
+
+    # ASSERT
+    assert log_size_after_snapshot == 0
+    assert (tmp_path / "contacts.snapshot").exists()
+    assert reopened.list() == contacts[1:]
+    reopened.close()
+
+
+def test_durable_repository_ignores_a_torn_final_record(tmp_path):
+    """
+    Tests that a record cut short by a crash is discarded and later changes
+    are logged after the last complete record.
+    """
+    # ARRANGE
+    contacts = _contacts(2)
+    repo = DurableContactRepository(str(tmp_path))
+    repo.add(contacts[0])
+    repo.close()
+    with open(tmp_path / "contacts.log", "ab") as log:
+        log.write(b'[2,"add","abc')
+
+    # ACT
+    recovered = DurableContactRepository(str(tmp_path))
+    recovered.add(contacts[1])
+    recovered.close()
+    reopened = DurableContactRepository(str(tmp_path))
+
+    # ASSERT
+    assert reopened.list() == contacts
+    reopened.close()
+
+
+def test_durable_repository_skips_records_covered_by_the_snapshot(tmp_path):
+    """
+    Tests recovery from a crash between writing a snapshot and truncating
+    the log: the stale log records must not be applied twice.
+    """
+    # ARRANGE
+    contacts = _contacts(2)
+    repo = DurableContactRepository(str(tmp_path))
+    repo.add_many(contacts)
+    repo.delete(contacts[0].contact_id)
+    repo.sync()
+    stale_log = (tmp_path / "contacts.log").read_bytes()
+    repo.snapshot()
+    repo.close()
+    (tmp_path / "contacts.log").write_bytes(stale_log)
+
+    # ACT
+    reopened = DurableContactRepository(str(tmp_path))
+
+    # ASSERT
+    assert reopened.list() == contacts[1:]
+    reopened.close()
+
+
+def test_durable_repository_survives_a_crash_after_idle_writes(tmp_path):
+    """
+    Tests that quick writes followed by idle time survive the process dying
+    without close(), and that they are fsynced in the background meanwhile.
+    """
+    # ARRANGE
+    code = f"""
+import os, time, uuid
+from contact_book_app.domain.repository import Contact
+from contact_book_app.infrastructure.durable_repository import DurableContactRepository
+repo = DurableContactRepository({str(tmp_path)!r}, sync_interval=0.05)
+for name in ("First", "Second"):
+    repo.add(Contact(contact_id=uuid.uuid4(), name=name, email=None))
+time.sleep(0.3)
+print(repo._unsynced, flush=True)
+os._exit(0)
+"""
+    src = os.path.dirname(os.path.dirname(contact_book_app.__file__))
+
+    # ACT
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                            check=True, env=dict(os.environ, PYTHONPATH=src))
+    reopened = DurableContactRepository(str(tmp_path))
+
+    # ASSERT
+    assert result.stdout.strip() == "0"  # Synced by the background thread
+    assert [c.name for c in reopened.list()] == ["First", "Second"]
+    reopened.close()
+
+
+def test_durable_repository_flushes_every_append(tmp_path):
+    """Tests that a record reaches the log file before any sync is due."""
+    # ARRANGE
+    repo = DurableContactRepository(str(tmp_path), sync_every=1000, sync_interval=3600)
+
+    # ACT
+    repo.add(_contacts(1)[0])
+    time.sleep(0.01)
+
+    # ASSERT
+    assert os.path.getsize(tmp_path / "contacts.log") > 0
+    assert repo._unsynced == 1
+    repo.close()
@@ -0,0 +1,139 @@
+# contact_book_app/tests/test_lazy_repository.py
+"""Tests for deferring repository creation, and the startup path built on it."""
+import os
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from unittest.mock import MagicMock
+
+import contact_book_app
+import pytest
+from contact_book_app.domain.repository import Contact
+from contact_book_app.infrastructure.in_memory_repository import InMemoryContactRepository
+from contact_book_app.infrastructure.lazy_repository import LazyContactRepository
+from contact_book_app.infrastructure.sqlite_repository import SqliteContactRepository
+
+# Seconds the interactive app may take to reach its first prompt. Far above
+# what it needs (well under a second), so only a real regression fails.
+STARTUP_BUDGET = 10.0
+
+
+def test_repository_is_created_on_first_use():
+    """Tests that the factory runs once, on the first call, and close() closes the result."""
+    # ARRANGE
+    inner = InMemoryContactRepository()
+    inner.close = MagicMock()
+    factory = MagicMock(return_value=inner)
+    repo = LazyContactRepository(factory)
+
+    # ACT
+    assert not repo.loaded
+    factory.assert_not_called()
+    contact = Contact(contact_id=uuid.uuid4(), name="Alice", email="alice@example.com")
+    repo.add(contact)
+    found = repo.find_by_email("alice@example.com")
+    repo.close()
+
+    # ASSERT
+    assert repo.loaded
+    assert found == contact
+    factory.assert_called_once_with()
+    inner.close.assert_called_once_with()
+
+
+def test_background_load_lets_callers_wait_and_reports_failures():
+    """
+    Tests that a call made during a background load waits for it, and that
+    a failed load is raised to every caller.
+    """
+    # ARRANGE
+    release = threading.Event()
+
+    def slow_factory():
+        release.wait(5)
+        return InMemoryContactRepository()
+
+    repo = LazyContactRepository(slow_factory, background=True)
+    failed = LazyContactRepository(MagicMock(side_effect=OSError("disk on fire")),
+                                   background=True)
+
+    # ACT
+    assert not repo.loaded
+    release.set()
+    contacts = repo.list()
+
+    # ASSERT
+    assert contacts == [] and repo.loaded
+    for _ in range(2):
+        with pytest.raises(OSError, match="disk on fire"):
+            failed.list()
+    failed.close()
+
+
+def test_main_does_not_import_unused_backends_or_heavy_modules():
+    """Tests that importing the entry point leaves out what only some modes need."""
+    # ARRANGE
+    deferred = ["asyncio", "concurrent.futures.process", "cProfile", "pstats", "sqlite3",
+                "contact_book_app.presentation.cli_view"]
+    code = ("import sys, contact_book_app.main; "
+            f"print([m for m in {deferred!r} if m in sys.modules])")
+    src = os.path.dirname(os.path.dirname(contact_book_app.__file__))
+
+    # ACT
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                            check=True, env=dict(os.environ, PYTHONPATH=src))
+
+    # ASSERT
+    assert result.stdout.strip() == "[]"
+
+
+def test_only_a_database_is_loaded_behind_a_placeholder():
+    """Tests that the in-memory book is listed straight away, without the loading frame."""
+    # ARRANGE
+    src = os.path.dirname(os.path.dirname(contact_book_app.__file__))
+
+    # ACT
+    result = subprocess.run([sys.executable, "-m", "contact_book_app.main"], input="exit\n",
+                            capture_output=True, text=True, timeout=60,
+                            env=dict(os.environ, PYTHONPATH=src))
+
+    # ASSERT
+    assert "No contacts found." in result.stdout
+    assert "Loading contacts..." not in result.stdout
+
+
+def test_interactive_app_prompts_within_the_startup_budget(tmp_path):
+    """
+    Tests that launching the interactive app on a database reaches the
+    first "Enter command:" prompt within a generous time budget.
+    """
+    # ARRANGE
+    db = str(tmp_path / "book.db")
+    database = SqliteContactRepository(db)
+    database.add_many(Contact(contact_id=uuid.uuid4(), name=f"Person {i}", email=f"p{i}@example.com")
+                      for i in range(10_000))
+    database.close()
+    src = os.path.dirname(os.path.dirname(contact_book_app.__file__))
+
+    # ACT
+    start = time.perf_counter()
+    process = subprocess.Popen([sys.executable, "-m", "contact_book_app.main", "--db", db],
+                               stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                               env=dict(os.environ, PYTHONPATH=src))
+    try:
+        output = b""
+        while b"Enter command:" not in output:
+            chunk = os.read(process.stdout.fileno(), 65536)
+            if not chunk:
+                break  # The app exited before prompting
+            output += chunk
+        elapsed = time.perf_counter() - start
+        process.communicate(b"exit\n", timeout=STARTUP_BUDGET)
+    finally:
+        process.kill()
+
+    # ASSERT
+    assert b"Enter command:" in output
+    assert elapsed < STARTUP_BUDGET
@@ -0,0 +1,127 @@
+# contact_book_app/tests/test_metrics.py
+"""Tests for the metrics registry and the instrumented components."""
+import io
+import pstats
+import uuid
+import pytest
+from unittest.mock import MagicMock
+from contact_book_app.domain.metrics import Histogram, MetricsRegistry, profiled
+from contact_book_app.domain.model import ContactService
+from contact_book_app.domain.observer import BackgroundObservable, Observer
+from contact_book_app.infrastructure.in_memory_repository import InMemoryContactRepository
+from contact_book_app.infrastructure.instrumented_repository import InstrumentedContactRepository
+
+
+class RecordingObserver(Observer):
+    """An observer that only remembers how often it was notified."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def update(self, subject, events=()) -> None:
+        self.calls += 1
+
+
+def test_registry_renders_counters_and_histograms_for_prometheus():
+    """Tests the cumulative buckets, sums and label formatting of the dump."""
+    # ARRANGE
+    registry = MetricsRegistry(buckets=(0.001, 0.01))
+
+    # ACT
+    registry.count("requests_total", operation="add")
+    registry.count("requests_total", 2, operation="add")
+    for seconds in (0.0005, 0.005, 0.5):
+        registry.observe("latency_seconds", seconds, operation='say "hi"')
+
+    # ASSERT
+    assert registry.counter("requests_total", operation="add") == 3
+    assert registry.counter("requests_total", operation="delete") == 0
+    assert registry.histogram("latency_seconds", operation='say "hi"').quantile(0.5) == 0.01
+    assert registry.to_prometheus().splitlines() == [
+        "# TYPE requests_total counter",
+        'requests_total{operation="add"} 3',
+        "# TYPE latency_seconds histogram",
+        'latency_seconds_bucket{operation="say \\"hi\\"",le="0.001"} 1',
+        'latency_seconds_bucket{operation="say \\"hi\\"",le="0.01"} 2',
+        'latency_seconds_bucket{operation="say \\"hi\\"",le="+Inf"} 3',
+        'latency_seconds_sum{operation="say \\"hi\\""} 0.5055',
+        'latency_seconds_count{operation="say \\"hi\\""} 3',
+    ]
+
+
+def test_service_reports_operations_failures_and_observer_dispatch():
+    """
+    Tests that an instrumented service times its operations, counts the
+    contacts written and the rejected calls, and times each observer.
+    """
+    # ARRANGE
+    registry = MetricsRegistry()
+    repo = InstrumentedContactRepository(InMemoryContactRepository(), registry)
+    service = ContactService(repo, metrics=registry)
+    service.attach(RecordingObserver())
+
+    # ACT
+    jane = service.add_contact("Jane", "jane@example.com")
+    with pytest.raises(ValueError):
+        service.add_contact("Jane Again", "jane@example.com")
+    service.add_contacts_bulk([("A", None), ("", None), ("B", "jane@example.com")])
+    service.update_contact(jane.contact_id, "Jane Smith", None)
+    service.delete_contact(jane.contact_id)
+
+    # ASSERT
+    assert registry.counter("contacts_added_total") == 2
+    assert registry.counter("contacts_updated_total") == 1
+    assert registry.counter("contacts_deleted_total") == 1
+    assert registry.counter("contact_validation_failures_total", operation="add_contact") == 1
+    assert registry.counter("contact_validation_failures_total", operation="add_contacts_bulk") == 2
+    assert registry.histogram("contact_service_seconds", operation="add_contact").count == 2
+    assert registry.histogram("observer_dispatch_seconds", observer="RecordingObserver").count == 4
+    assert registry.histogram("contact_repository_seconds", method="email_exists",
+                              backend="InMemoryContactRepository").count == 3
+
+
+def test_service_without_metrics_is_not_wrapped():
+    """Tests that disabled instrumentation leaves the methods untouched."""
+    # ARRANGE & ACT
+    service = ContactService(InMemoryContactRepository())
+
+    # ASSERT
+    assert "add_contact" not in vars(service)
+    assert service.add_contact.__func__ is ContactService.add_contact
+
+
+def test_background_observable_times_deliveries():
+    """Tests that observers called from the background thread are timed."""
+    # ARRANGE
+    registry = MetricsRegistry()
+    observable = BackgroundObservable(debounce=0, metrics=registry)
+    observable.attach(RecordingObserver())
+
+    # ACT
+    observable.notify(MagicMock())
+    observable.close()
+
+    # ASSERT
+    assert registry.histogram("observer_dispatch_seconds", observer="RecordingObserver").count == 1
+
+
+def test_profiled_saves_or_prints_statistics(tmp_path):
+    """Tests the cProfile hook in both output modes."""
+    # ARRANGE
+    path = str(tmp_path / "run.prof")
+    stream = io.StringIO()
+
+    # ACT
+    with profiled(path):
+        uuid.uuid4()
+    with profiled(stream=stream, limit=5):
+        uuid.uuid4()
+
+    # ASSERT
+    assert pstats.Stats(path).total_calls > 0
+    assert "cumulative" in stream.getvalue()
+
+
+def test_histogram_quantile_of_empty_histogram_is_zero():
+    """Tests the quantile estimate before anything was observed."""
+    assert Histogram().quantile(0.99) == 0.0
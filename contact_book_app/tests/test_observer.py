@@ -0,0 +1,122 @@
+# contact_book_app/tests/test_observer.py
+"""Tests for the Observable implementations."""
+import threading
+import time
+import uuid
+from unittest.mock import MagicMock
+import pytest
+from contact_book_app.domain.events import ContactAdded
+from contact_book_app.domain.observer import BackgroundObservable, Observer
+from contact_book_app.domain.repository import Contact
+
+
+@pytest.fixture
+def observable() -> BackgroundObservable:
+    """Provides a background observable that is closed after the test."""
+    subject = BackgroundObservable(debounce=0.01)
+    yield subject
+    subject.close()
+
+
+def test_background_observable_coalesces_bursts(observable: BackgroundObservable):
+    """
+    Tests that a burst of notifications reaches each observer once, with the
+    latest subject and every event of the burst.
+    """
+    # ARRANGE
+    observer = MagicMock(spec=Observer)
+    observable.attach(observer)
+    events = [ContactAdded(Contact(contact_id=uuid.uuid4(), name=name)) for name in "ABC"]
+
+    # ACT
+    for subject, event in zip(["first", "second", "third"], events):
+        observable.notify(subject, [event])
+    assert observable.flush(timeout=5)
+
+    # ASSERT
+    observer.update.assert_called_once_with("third", events)
+    stats = observable.stats
+    assert (stats.notified, stats.coalesced, stats.delivered, stats.pending) == (3, 2, 1, 0)
+
+
+def test_background_observable_restarts_the_debounce_window_on_each_notify():
+    """
+    Tests that notifications closer together than the debounce window are
+    delivered once, even when the burst lasts longer than one window, and
+    that max_wait still delivers a burst that never pauses.
+    """
+    # ARRANGE
+    debounced = BackgroundObservable(debounce=0.2)
+    capped = BackgroundObservable(debounce=0.2, max_wait=0.1)
+    observer, capped_observer = MagicMock(spec=Observer), MagicMock(spec=Observer)
+    debounced.attach(observer)
+    capped.attach(capped_observer)
+
+    # ACT
+    for i in range(6):  # 0.25 s in all, longer than one window
+        debounced.notify(f"subject {i}", [])
+        capped.notify(f"subject {i}", [])
+        time.sleep(0.05)
+    burst_delivered = observer.update.called
+    assert debounced.flush(timeout=5) and capped.flush(timeout=5)
+    debounced.close()
+    capped.close()
+
+    # ASSERT
+    assert not burst_delivered
+    observer.update.assert_called_once_with("subject 5", [])
+    assert capped_observer.update.call_count >= 2
+
+
+def test_background_observable_does_not_block_on_slow_observers(observable: BackgroundObservable):
+    """Tests that notify() returns while an observer is still busy."""
+    # ARRANGE
+    release = threading.Event()
+    slow = MagicMock(spec=Observer)
+    slow.update.side_effect = lambda subject, events: release.wait(5)
+    observable.attach(slow)
+
+    # ACT
+    observable.notify("subject")
+
+    # ASSERT
+    assert not observable.flush(timeout=0.1)
+    release.set()
+    assert observable.flush(timeout=5)
+    slow.update.assert_called_once_with("subject", [])
+
+
+def test_background_observable_isolates_failing_observers(observable: BackgroundObservable):
+    """Tests that an observer that raises does not stop the others."""
+    # ARRANGE
+    failing = MagicMock(spec=Observer)
+    failing.update.side_effect = RuntimeError("boom")
+    healthy = MagicMock(spec=Observer)
+    observable.attach(failing)
+    observable.attach(healthy)
+
+    # ACT
+    observable.notify("subject")
+    assert observable.flush(timeout=5)
+
+    # ASSERT
+    healthy.update.assert_called_once_with("subject", [])
+    assert observable.stats.failed == 1
+    assert observable.stats.delivered == 1
+
+
+def test_background_observable_rejects_notifications_after_close():
+    """Tests that close() delivers what is queued and then refuses new work."""
+    # ARRANGE
+    observable = BackgroundObservable(debounce=0.01)
+    observer = MagicMock(spec=Observer)
+    observable.attach(observer)
+    observable.notify("subject")
+
+    # ACT
+    observable.close()
+
+    # ASSERT
+    observer.update.assert_called_once_with("subject", [])
+    with pytest.raises(RuntimeError, match="closed"):
+        observable.notify("subject")
@@ -0,0 +1,103 @@
+# contact_book_app/tests/test_replication.py
+"""Tests for replicating a book to read-only replicas."""
+import pytest
+from contact_book_app.domain.model import ContactService
+from contact_book_app.infrastructure.in_memory_repository import InMemoryContactRepository
+from contact_book_app.infrastructure.replication import (ReplicaContactRepository,
+                                                         ReplicationPublisher)
+from contact_book_app.infrastructure.thread_safe_repository import ThreadSafeContactRepository
+
+
+@pytest.fixture
+def service() -> ContactService:
+    return ContactService(ThreadSafeContactRepository(InMemoryContactRepository()))
+
+
+@pytest.fixture
+def publisher(service: ContactService):
+    publisher = ReplicationPublisher(service, snapshot_chunk=2)
+    yield publisher
+    publisher.close()
+
+
+def _emails(repo):
+    return {c.name: c.email for c in repo.list()}
+
+
+def test_replica_loads_a_snapshot_then_follows_changes(service: ContactService,
+                                                      publisher: ReplicationPublisher):
+    """
+    Tests that a replica starts from a snapshot of the book, in several
+    parts, and then applies each later change, refusing writes of its own.
+    """
+    # ARRANGE
+    alice = service.add_contact("Alice", "alice@example.com")
+    bob = service.add_contact("Bob", "bob@example.com")
+    service.add_contact("Carol", None)
+
+    # ACT
+    replica = ReplicaContactRepository(publisher.address)
+    try:
+        service.update_contact(alice.contact_id, "Alicia", "alicia@example.com")
+        service.delete_contact(bob.contact_id)
+        with service.transaction():
+            service.add_contact("Dave", "alice@example.com")
+            service.add_contact("Erin", None)
+        assert replica.wait_for(publisher.sequence, timeout=5)
+
+        # ASSERT
+        assert replica.sequence == publisher.sequence == 6
+        assert _emails(replica) == _emails(service.repo)
+        assert replica.find_by_email("alice@example.com").name == "Dave"
+        assert ContactService(replica).search("ali") == service.search("ali")
+        with pytest.raises(ValueError, match="Replica is read-only."):
+            ContactService(replica).add_contact("Frank")
+    finally:
+        replica.close()
+
+
+def test_replica_catches_up_from_the_backlog_after_a_disconnect(service: ContactService,
+                                                               publisher: ReplicationPublisher):
+    """
+    Tests that a replica that lost its connection reconnects and is sent
+    only the changes it missed, keeping its copy instead of a new snapshot.
+    """
+    # ARRANGE
+    service.add_contact("Alice", "alice@example.com")
+    replica = ReplicaContactRepository(publisher.address, retry=0.01)
+    try:
+        copy = replica._inner
+        publisher._subscribers[0].close()  # Cut the connection from the publisher's end
+
+        # ACT
+        service.add_contact("Bob", "bob@example.com")
+        service.add_contact("Carol", "carol@example.com")
+
+        # ASSERT
+        assert replica.wait_for(publisher.sequence, timeout=5)
+        assert _emails(replica) == _emails(service.repo)
+        assert replica._inner is copy
+    finally:
+        replica.close()
+
+
+def test_replica_reloads_a_snapshot_after_an_unknown_change(service: ContactService,
+                                                           publisher: ReplicationPublisher):
+    """Tests that a notification without events makes replicas start over."""
+    # ARRANGE
+    replica = ReplicaContactRepository(publisher.address, retry=0.01)
+    try:
+        service.add_contact("Alice", "alice@example.com")
+        assert replica.wait_for(publisher.sequence, timeout=5)
+        # A write the service does not report
+        service.repo.delete(service.find_by_email("alice@example.com").contact_id)
+
+        # ACT
+        publisher.update(service, [])
+        service.add_contact("Bob", "bob@example.com")
+
+        # ASSERT
+        assert replica.wait_for(publisher.sequence, timeout=5)
+        assert _emails(replica) == {"Bob": "bob@example.com"}
+    finally:
+        replica.close()
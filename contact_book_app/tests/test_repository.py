@@ -2,7 +2,7 @@
 """Tests for the repository implementations."""
 import uuid
 import pytest
-from contact_book_app.domain.repository import Contact
+from contact_book_app.domain.repository import AbstractContactRepository, Contact
 from contact_book_app.infrastructure.in_memory_repository import InMemoryContactRepository
 
 
@@ -62,4 +62,177 @@ def test_repository_can_update_a_contact():
     # ASSERT
     assert retrieved_contact == updated_contact
     assert retrieved_contact.name == "Johnathan Doe"
-    assert retrieved_contact.email == "jd@example.com"
\ No newline at end of file
+    assert retrieved_contact.email == "jd@example.com"
+
+def test_repository_finds_contact_by_email():
+    """
+    Tests that the email index resolves an email to its contact.
+    """
+    # ARRANGE
+    repo = InMemoryContactRepository()
+    contact = Contact(contact_id=uuid.uuid4(), name="John Doe", email="john@example.com")
+    repo.add(contact)
+
+    # ACT & ASSERT
+    assert repo.find_by_email("john@example.com") == contact
+    assert repo.email_exists("john@example.com")
+    assert repo.find_by_email("nobody@example.com") is None
+    assert not repo.email_exists("nobody@example.com")
+
+
+def test_repository_email_index_follows_updates_and_deletes():
+    """
+    Tests that the email index stays consistent when a contact changes email,
+    including when the stored object was mutated in place before update().
+    """
+    # ARRANGE
+    repo = InMemoryContactRepository()
+    contact_id = uuid.uuid4()
+    contact = Contact(contact_id=contact_id, name="John Doe", email="old@example.com")
+    repo.add(contact)
+
+    # ACT
+    stored = repo.get(contact_id)
+    stored.email = "new@example.com"
+    repo.update(stored)
+
+    # ASSERT
+    assert not repo.email_exists("old@example.com")
+    assert repo.find_by_email("new@example.com") == stored
+
+    # ACT
+    repo.delete(contact_id)
+
+    # ASSERT
+    assert not repo.email_exists("new@example.com")
+
+
+def test_repository_can_add_many_contacts():
+    """
+    Tests that a batch of contacts is stored and indexed by email.
+    """
+    # ARRANGE
+    repo = InMemoryContactRepository()
+    contacts = [
+        Contact(contact_id=uuid.uuid4(), name="John Doe", email="john@example.com"),
+        Contact(contact_id=uuid.uuid4(), name="Jane Doe"),
+    ]
+
+    # ACT
+    repo.add_many(contacts)
+
+    # ASSERT
+    assert repo.list() == contacts
+    assert repo.find_by_email("john@example.com") == contacts[0]
+
+
+def test_repository_pages_in_insertion_order():
+    """
+    Tests offset paging and keyset paging, including resuming after deletes
+    that leave holes in the insertion order.
+    """
+    # ARRANGE
+    repo = InMemoryContactRepository()
+    contacts = [Contact(contact_id=uuid.uuid4(), name=f"Person {i}") for i in range(6)]
+    repo.add_many(contacts)
+
+    # ACT
+    repo.delete(contacts[1].contact_id)
+    repo.delete(contacts[2].contact_id)
+
+    # ASSERT
+    assert list(repo.iter_contacts()) == [contacts[0]] + contacts[3:]
+    assert repo.list_page(1, 2) == contacts[3:5]
+    assert repo.list_after(None, 2) == [contacts[0], contacts[3]]
+    assert repo.list_after(contacts[0].contact_id, 2) == contacts[3:5]
+    assert repo.list_after(contacts[5].contact_id, 2) == []
+    with pytest.raises(ValueError, match="Contact not found."):
+        repo.list_after(contacts[1].contact_id, 2)
+
+
+def test_repository_search_follows_changes():
+    """
+    Tests that the search index matches names and emails case-insensitively
+    and is kept up to date on update and delete.
+    """
+    # ARRANGE
+    repo = InMemoryContactRepository(searchable=True)
+    john = Contact(contact_id=uuid.uuid4(), name="John Smith", email="jsmith@example.com")
+    jane = Contact(contact_id=uuid.uuid4(), name="Jane Doe", email="jane@corp.test")
+    repo.add_many([john, jane])
+
+    # ACT & ASSERT
+    assert repo.search("SMITH", 10) == [john]
+    assert repo.search("ex", 10) == [john]
+    assert repo.search("mit", 10) == [john]
+    assert repo.search("j", 10) == [jane, john]
+    assert repo.search("j", 1) == [jane]
+    assert repo.search("oh", 10) == []  # Short queries only match word starts
+    assert repo.search("   ", 10) == []
+
+    # ACT
+    stored = repo.get(john.contact_id)
+    stored.name = "Johnny Walker"
+    stored.email = None
+    repo.update(stored)
+    repo.delete(jane.contact_id)
+
+    # ASSERT
+    assert repo.search("smith", 10) == []
+    assert repo.search("walk", 10) == [stored]
+    assert repo.search("jane", 10) == []
+
+
+def test_repository_search_index_agrees_with_scan():
+    """
+    Tests that the indexed search returns the same results as the default
+    scan over every contact.
+    """
+    # ARRANGE
+    repo = InMemoryContactRepository(searchable=True)
+    names = ["Anna Berg", "Bernd Anders", "Carla Nordberg", "Dan Berger", "Ana Lee"]
+    repo.add_many(Contact(contact_id=uuid.uuid4(), name=name, email=f"{name.split()[0].lower()}@berg.test")
+                  for name in names)
+
+    # ACT & ASSERT
+    for query in ["berg", "an", "a", "ERG", "lee", "berg.t", "zzz"]:
+        assert repo.search(query, 3) == AbstractContactRepository.search(repo, query, 3)
+
+
+def test_repository_searches_by_scanning_unless_searchable():
+    """Tests that the search index is opt-in and that search works without it."""
+    # ARRANGE
+    repo = InMemoryContactRepository()
+    john = Contact(contact_id=uuid.uuid4(), name="John Smith", email="jsmith@example.com")
+    repo.add(john)
+
+    # ACT
+    found = repo.search("smith", 10)
+
+    # ASSERT
+    assert repo._search_index is None
+    assert found == [john]
+
+
+def test_repository_finds_contacts_by_id_prefix():
+    """
+    Tests that the prefix index finds contacts sharing leading ID digits,
+    agrees with the default scan and forgets deleted contacts.
+    """
+    # ARRANGE
+    repo = InMemoryContactRepository()
+    first = Contact(contact_id=uuid.UUID("abcd1234-0000-4000-8000-000000000001"), name="First")
+    second = Contact(contact_id=uuid.UUID("abcd5678-0000-4000-8000-000000000002"), name="Second")
+    other = Contact(contact_id=uuid.UUID("12340000-0000-4000-8000-000000000003"), name="Other")
+    repo.add_many([first, second, other])
+
+    # ACT
+    shared = repo.find_by_id_prefix("abcd", 10)
+    repo.delete(second.contact_id)
+
+    # ASSERT
+    assert shared == [first, second]
+    assert repo.find_by_id_prefix("abcd5", 10) == []
+    assert repo.find_by_id_prefix("abcd1", 10) == [first]
+    for prefix in ["1234", "abc", first.contact_id.hex, "ffff"]:
+        assert repo.find_by_id_prefix(prefix, 2) == AbstractContactRepository.find_by_id_prefix(repo, prefix, 2)
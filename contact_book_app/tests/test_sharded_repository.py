@@ -0,0 +1,132 @@
+# contact_book_app/tests/test_sharded_repository.py
+"""Tests for the sharded repository and its process shards."""
+import uuid
+import pytest
+from contact_book_app.domain.model import ContactService
+from contact_book_app.domain.repository import Contact
+from contact_book_app.infrastructure.in_memory_repository import InMemoryContactRepository
+from contact_book_app.infrastructure.sharded_repository import ProcessShard, ShardedContactRepository
+from contact_book_app.infrastructure.sqlite_repository import SqliteContactRepository
+
+
+def _contacts(count: int):
+    return [Contact(contact_id=uuid.uuid4(), name=f"Person {i}", email=f"p{i}@example.com")
+            for i in range(count)]
+
+
+def test_contacts_are_spread_over_shards_and_listed_in_insertion_order():
+    """
+    Tests that every shard receives part of the book, and that the merged
+    listing, paging and point lookups behave like a single repository.
+    """
+    # ARRANGE
+    shards = [InMemoryContactRepository() for _ in range(4)]
+    repo = ShardedContactRepository(shards)
+    contacts = _contacts(40)
+
+    # ACT
+    repo.add_many(contacts[:20])
+    for contact in contacts[20:]:
+        repo.add(contact)
+
+    # ASSERT
+    assert all(shard.list() for shard in shards)
+    assert sum(len(shard.list()) for shard in shards) == 40
+    assert repo.list() == contacts
+    assert repo.list_page(10, 5) == contacts[10:15]
+    assert repo.get(contacts[7].contact_id) == contacts[7]
+    assert repo.find_by_email("p33@example.com") == contacts[33]
+    assert repo.search("person 1", 3) == [contacts[1], contacts[10], contacts[11]]
+
+
+def test_email_index_is_global_and_follows_changes():
+    """
+    Tests that email uniqueness holds across shards, and that updates and
+    deletes move the email index along.
+    """
+    # ARRANGE
+    repo = ShardedContactRepository([InMemoryContactRepository() for _ in range(3)])
+    service = ContactService(repo)
+    jane = service.add_contact("Jane", "jane@example.com")
+
+    # ACT
+    with pytest.raises(ValueError, match="Email already exists."):
+        repo.add(Contact(contact_id=uuid.uuid4(), name="Other", email="jane@example.com"))
+    with pytest.raises(ValueError, match="Email already exists."):
+        repo.add_many([Contact(uuid.uuid4(), "A", "a@example.com"),
+                       Contact(uuid.uuid4(), "B", "a@example.com")])
+    service.update_contact(jane.contact_id, "Jane", "jane.doe@example.com")
+
+    # ASSERT
+    assert not repo.email_exists("jane@example.com")
+    assert not repo.email_exists("a@example.com")
+    assert repo.find_by_email("jane.doe@example.com").contact_id == jane.contact_id
+    service.delete_contact(jane.contact_id)
+    assert not repo.email_exists("jane.doe@example.com")
+    assert repo.list() == []
+
+
+def test_existing_shard_contents_are_indexed_on_start():
+    """Tests that a repository over populated shards knows their emails."""
+    # ARRANGE
+    shard = InMemoryContactRepository()
+    existing = Contact(contact_id=uuid.uuid4(), name="Existing", email="old@example.com")
+    shard.add(existing)
+
+    # ACT
+    repo = ShardedContactRepository([shard])
+
+    # ASSERT
+    assert repo.email_exists("old@example.com")
+    assert repo.list() == [existing]
+
+
+def test_process_shards_serve_the_book_from_child_processes():
+    """Tests the same operations with every shard in its own process."""
+    # ARRANGE
+    repo = ShardedContactRepository([ProcessShard(InMemoryContactRepository, page_size=3)
+                                     for _ in range(2)])
+    contacts = _contacts(10)
+
+    try:
+        # ACT
+        repo.add_many(contacts)
+        repo.update(Contact(contact_id=contacts[0].contact_id, name="Renamed", email=None))
+        repo.delete(contacts[1].contact_id)
+
+        # ASSERT
+        listed = repo.list()
+        assert [c.contact_id for c in listed] == [c.contact_id for c in contacts if c is not contacts[1]]
+        assert listed[0].name == "Renamed"
+        assert repo.find_by_id_prefix(contacts[5].contact_id.hex[:8], 2) == [contacts[5]]
+        assert repo.search("person 9", 5) == [contacts[9]]
+        with pytest.raises(ValueError, match="Offset and limit"):
+            repo._shards[0].list_page(-1, 1)
+    finally:
+        repo.close()
+
+
+def test_a_failing_shard_call_does_not_leave_stale_replies_on_the_others():
+    """
+    Tests that when one process shard fails its part of a batch, the replies
+    of the other shards are still read, so later calls get their own replies.
+    """
+    # ARRANGE
+    repo = ShardedContactRepository([ProcessShard(SqliteContactRepository) for _ in range(2)])
+    contacts = _contacts(20)
+    first = [c for c in contacts if repo._shard_number(c.contact_id) == 0]
+    second = [c for c in contacts if repo._shard_number(c.contact_id) == 1]
+    try:
+        repo._shards[0].add(first[0])  # Behind the sharded repository's back
+        duplicate = Contact(contact_id=first[0].contact_id, name="Duplicate", email=None)
+
+        # ACT
+        with pytest.raises(ValueError, match="Contact already exists."):
+            repo.add_many([duplicate, second[0]])
+
+        # ASSERT
+        assert repo._shards[1].get(second[0].contact_id) == second[0]
+        assert repo._shards[1].get(second[1].contact_id) is None
+        assert repo._shards[0].get(first[0].contact_id) == first[0]
+    finally:
+        repo.close()
@@ -0,0 +1,85 @@
+# contact_book_app/tests/test_shared_snapshot.py
+"""Tests for sharing a book as a memory-mapped snapshot file."""
+import uuid
+
+import pytest
+from contact_book_app.domain.model import ContactService
+from contact_book_app.domain.repository import Contact
+from contact_book_app.infrastructure.in_memory_repository import InMemoryContactRepository
+from contact_book_app.infrastructure.shared_snapshot import (SharedSnapshotRepository,
+                                                             SnapshotExporter, export_snapshot,
+                                                             snapshot_generation)
+
+
+@pytest.fixture
+def contacts():
+    return [Contact(contact_id=uuid.uuid4(), name=name, email=email)
+            for name, email in [("Zoë", "zoe@example.com"), ("Bob", None),
+                                ("Alice", "alice@example.com"), ("Carol", "carol@example.com")]]
+
+
+def test_snapshot_serves_lookups_and_pages_from_the_file(tmp_path, contacts):
+    """
+    Tests that a snapshot repository finds contacts by ID, email and ID
+    prefix, and pages through them in the exported order.
+    """
+    # ARRANGE
+    path = str(tmp_path / "book.snap")
+    export_snapshot(contacts, path, generation=7)
+
+    # ACT
+    repo = SharedSnapshotRepository(path)
+
+    # ASSERT
+    try:
+        assert repo.generation == snapshot_generation(path) == 7
+        assert len(repo) == 4
+        assert repo.list() == contacts
+        for contact in contacts:
+            assert repo.get(contact.contact_id) == contact
+            assert repo.find_by_id_prefix(str(contact.contact_id)[:8], 5) == [contact]
+        assert repo.get(uuid.uuid4()) is None
+        assert repo.find_by_email("alice@example.com") == contacts[2]
+        assert repo.find_by_email("zoe@example.com") == contacts[0]
+        assert repo.find_by_email("dave@example.com") is None
+        assert repo.list_page(1, 2) == contacts[1:3]
+        assert repo.list_page(3, 10) == contacts[3:]
+        assert repo.list_after(contacts[1].contact_id, 10) == contacts[2:]
+        with pytest.raises(ValueError, match="Contact not found."):
+            repo.list_after(uuid.uuid4(), 10)
+        with pytest.raises(ValueError, match="Snapshot is read-only."):
+            ContactService(repo).add_contact("Dave")
+    finally:
+        repo.close()
+
+
+def test_exporter_publishes_a_new_generation_on_change(tmp_path):
+    """
+    Tests that an exporter writes a new generation after each change, which
+    a reader maps on refresh while contacts it already read stay valid.
+    """
+    # ARRANGE
+    path = str(tmp_path / "book.snap")
+    service = ContactService(InMemoryContactRepository())
+    alice = service.add_contact("Alice", "alice@example.com")
+    exporter = SnapshotExporter(service, path)
+    repo = SharedSnapshotRepository(path, refresh_interval=3600)
+    try:
+        before = repo.get(alice.contact_id)
+
+        # ACT
+        service.update_contact(alice.contact_id, "Alicia", "alicia@example.com")
+        bob = service.add_contact("Bob", "bob@example.com")
+
+        # ASSERT
+        assert exporter.generation == 3
+        assert repo.get(bob.contact_id) is None  # Still the old generation
+        assert repo.refresh()
+        assert not repo.refresh()
+        assert repo.generation == 3
+        assert repo.find_by_email("alicia@example.com").name == "Alicia"
+        assert repo.get(bob.contact_id).name == "Bob"
+        assert before.name == "Alice"
+    finally:
+        exporter.close()
+        repo.close()
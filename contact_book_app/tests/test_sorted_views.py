@@ -0,0 +1,90 @@
+# contact_book_app/tests/test_sorted_views.py
+"""Tests for the incrementally maintained sorted views."""
+
+import random
+import pytest
+from contact_book_app.domain.model import ContactService
+from contact_book_app.domain.sorted_views import SortedList, SortedViews
+from contact_book_app.infrastructure.in_memory_repository import InMemoryContactRepository
+
+
+def _names(contacts):
+    return [c.name for c in contacts]
+
+
+def test_sorted_list_matches_a_sorted_python_list():
+    """
+    Tests that random adds and removes, splitting and emptying blocks, keep
+    the values in order and that slices read across block boundaries.
+    """
+    # ARRANGE
+    rng = random.Random(7)
+    ordered = SortedList(rng.sample(range(1000), 50), load=4)
+    expected = sorted(ordered)
+
+    # ACT
+    for _ in range(2000):
+        if expected and rng.random() < 0.45:
+            value = rng.choice(expected)
+            ordered.remove(value)
+            expected.remove(value)
+        else:
+            value = rng.randrange(1000)
+            ordered.add(value)
+            expected.append(value)
+            expected.sort()
+
+    # ASSERT
+    assert list(ordered) == expected
+    assert len(ordered) == len(expected)
+    assert ordered.slice(5, 23) == expected[5:23]
+    assert ordered.slice(len(expected) - 3, len(expected) + 10) == expected[-3:]
+    with pytest.raises(ValueError):
+        ordered.remove(1000)
+
+
+def test_sorted_views_order_and_filter_contacts():
+    """Tests each sort order and the domain filter, contacts without email last."""
+    # ARRANGE
+    service = ContactService(InMemoryContactRepository())
+    service.add_contact("carol", "carol@b.org")
+    service.add_contact("Alice", "zed@A.com")
+    service.add_contact("Bob", "bob@b.org")
+    service.add_contact("Dave", None)
+
+    # ACT
+    views = SortedViews(service.iter_contacts())
+
+    # ASSERT
+    assert _names(views.page("name", 0, 10)) == ["Alice", "Bob", "carol", "Dave"]
+    assert _names(views.page("email", 0, 10)) == ["Bob", "carol", "Alice", "Dave"]
+    assert _names(views.page("domain", 0, 10)) == ["Alice", "Bob", "carol", "Dave"]
+    assert _names(views.page("name", 1, 2)) == ["Bob", "carol"]
+    assert _names(views.page("name", 0, 10, domain="@B.org")) == ["Bob", "carol"]
+    assert views.page("name", 0, 10, domain="nowhere.net") == []
+    with pytest.raises(ValueError, match="Unknown sort order."):
+        views.page("age", 0, 10)
+
+
+def test_service_keeps_sorted_views_up_to_date():
+    """
+    Tests that changes made after the views are built, including renames
+    done in place and moves between domains, are reflected in later pages.
+    """
+    # ARRANGE
+    service = ContactService(InMemoryContactRepository())
+    bob = service.add_contact("Bob", "bob@a.com")
+    carol = service.add_contact("Carol", "carol@a.com")
+    assert _names(service.list_sorted("name", 0, 10)) == ["Bob", "Carol"]
+
+    # ACT
+    service.add_contact("Alice", "alice@b.com")
+    service.update_contact(bob.contact_id, "Zoe", "zoe@b.com")
+    service.delete_contact(carol.contact_id)
+    with service.transaction():
+        service.add_contact("Yves", "yves@a.com")
+
+    # ASSERT
+    assert _names(service.list_sorted("name", 0, 10)) == ["Alice", "Yves", "Zoe"]
+    assert _names(service.list_sorted("name", 0, 10, domain="b.com")) == ["Alice", "Zoe"]
+    assert _names(service.list_sorted("name", 0, 10, domain="a.com")) == ["Yves"]
@@ -0,0 +1,155 @@
+"""Tests for the SQLite repository implementation."""
+import uuid
+import pytest
+from contact_book_app.domain.repository import Contact
+from contact_book_app.infrastructure.sqlite_repository import SqliteContactRepository
+
+
+@pytest.fixture
+def repo() -> SqliteContactRepository:
+    """Provides an in-memory SQLite repository."""
+    repository = SqliteContactRepository()
+    yield repository
+    repository.close()
+
+
+def test_sqlite_repository_can_add_get_and_list(repo: SqliteContactRepository):
+    """
+    Tests that contacts round-trip through the database in insertion order.
+    """
+    # ARRANGE
+    first = Contact(contact_id=uuid.uuid4(), name="John Doe", email="john@example.com")
+    second = Contact(contact_id=uuid.uuid4(), name="Jane Doe")
+
+    # ACT
+    repo.add(first)
+    repo.add(second)
+
+    # ASSERT
+    assert repo.get(first.contact_id) == first
+    assert repo.get(uuid.uuid4()) is None
+    assert repo.list() == [first, second]
+    assert list(repo.iter_contacts()) == [first, second]
+
+
+def test_sqlite_repository_email_lookup_and_uniqueness(repo: SqliteContactRepository):
+    """
+    Tests the email index lookups and that the unique index rejects duplicates.
+    """
+    # ARRANGE
+    contact = Contact(contact_id=uuid.uuid4(), name="John Doe", email="john@example.com")
+    repo.add(contact)
+
+    # ACT & ASSERT
+    assert repo.find_by_email("john@example.com") == contact
+    assert repo.email_exists("john@example.com")
+    assert not repo.email_exists("nobody@example.com")
+    with pytest.raises(ValueError, match="Email already exists."):
+        repo.add(Contact(contact_id=uuid.uuid4(), name="Impostor", email="john@example.com"))
+
+
+def test_sqlite_repository_can_update_and_delete(repo: SqliteContactRepository):
+    """
+    Tests that updates are persisted and deletes remove the row.
+    """
+    # ARRANGE
+    contact_id = uuid.uuid4()
+    repo.add(Contact(contact_id=contact_id, name="John Doe"))
+
+    # ACT
+    repo.update(Contact(contact_id=contact_id, name="Johnathan Doe", email="jd@example.com"))
+
+    # ASSERT
+    assert repo.get(contact_id) == Contact(contact_id=contact_id, name="Johnathan Doe", email="jd@example.com")
+
+    # ACT
+    repo.delete(contact_id)
+
+    # ASSERT
+    assert repo.get(contact_id) is None
+    assert repo.list() == []
+
+
+def test_sqlite_repository_add_many_is_atomic(repo: SqliteContactRepository):
+    """
+    Tests that a bulk insert containing a duplicate email is rolled back entirely.
+    """
+    # ARRANGE
+    contacts = [
+        Contact(contact_id=uuid.uuid4(), name="A", email="a@example.com"),
+        Contact(contact_id=uuid.uuid4(), name="B", email="a@example.com"),
+    ]
+
+    # ACT & ASSERT
+    with pytest.raises(ValueError, match="Email already exists."):
+        repo.add_many(contacts)
+    assert repo.list() == []
+
+    repo.add_many(contacts[:1])
+    assert repo.list() == contacts[:1]
+
+
+def test_sqlite_repository_persists_across_connections(tmp_path):
+    """
+    Tests that contacts written to a database file survive reopening it.
+    """
+    # ARRANGE
+    path = str(tmp_path / "contacts.db")
+    contact = Contact(contact_id=uuid.uuid4(), name="John Doe", email="john@example.com")
+    first_repo = SqliteContactRepository(path)
+    first_repo.add(contact)
+    first_repo.close()
+
+    # ACT
+    second_repo = SqliteContactRepository(path)
+
+    # ASSERT
+    assert second_repo.list() == [contact]
+    second_repo.close()
+
+
+def test_sqlite_repository_pages_in_insertion_order(repo: SqliteContactRepository):
+    """
+    Tests offset paging and keyset paging on the rowid.
+    """
+    # ARRANGE
+    contacts = [Contact(contact_id=uuid.uuid4(), name=f"Person {i}") for i in range(5)]
+    repo.add_many(contacts)
+    repo.delete(contacts[1].contact_id)
+
+    # ACT & ASSERT
+    assert repo.list_page(1, 2) == contacts[2:4]
+    assert repo.list_after(None, 2) == [contacts[0], contacts[2]]
+    assert repo.list_after(contacts[2].contact_id, 5) == contacts[3:]
+    with pytest.raises(ValueError, match="Contact not found."):
+        repo.list_after(contacts[1].contact_id, 2)
+
+
+def test_sqlite_repository_search_scans_contacts(repo: SqliteContactRepository):
+    """
+    Tests the default scanning search on a repository without an index.
+    """
+    # ARRANGE
+    john = Contact(contact_id=uuid.uuid4(), name="John Smith", email="jsmith@example.com")
+    jane = Contact(contact_id=uuid.uuid4(), name="Jane Doe")
+    repo.add_many([john, jane])
+
+    # ACT & ASSERT
+    assert repo.search("smith", 10) == [john]
+    assert repo.search("J", 10) == [jane, john]
+    assert repo.search("nobody", 10) == []
+
+
+def test_sqlite_repository_finds_contacts_by_id_prefix(repo: SqliteContactRepository):
+    """Tests that ID prefixes of any length are resolved by a key range scan."""
+    # ARRANGE
+    first = Contact(contact_id=uuid.UUID("abcd1234-0000-4000-8000-000000000001"), name="First")
+    second = Contact(contact_id=uuid.UUID("abcd5678-0000-4000-8000-000000000002"), name="Second")
+    repo.add_many([second, first])
+
+    # ACT & ASSERT
+    assert repo.find_by_id_prefix("abcd", 10) == [first, second]
+    assert repo.find_by_id_prefix("abcd5", 10) == [second]
+    assert repo.find_by_id_prefix("abcd", 1) == [first]
+    assert repo.find_by_id_prefix(first.contact_id.hex, 2) == [first]
+    assert repo.find_by_id_prefix("abce", 10) == []
@@ -0,0 +1,174 @@
+# contact_book_app/tests/test_transaction.py
+"""Tests for ContactService transactions and repository batch writes."""
+
+import pytest
+from unittest.mock import MagicMock
+from contact_book_app.domain.events import ContactAdded, ContactDeleted, ContactUpdated
+from contact_book_app.domain.model import ContactService
+from contact_book_app.domain.observer import Observer
+from contact_book_app.domain.repository import AbstractContactRepository
+from contact_book_app.infrastructure.compact_repository import ColumnarContactRepository
+from contact_book_app.infrastructure.durable_repository import DurableContactRepository
+from contact_book_app.infrastructure.in_memory_repository import InMemoryContactRepository
+from contact_book_app.infrastructure.sharded_repository import ShardedContactRepository
+from contact_book_app.infrastructure.sqlite_repository import SqliteContactRepository
+
+
+def _emails(service: ContactService):
+    return {c.name: c.email for c in service.get_all_contacts()}
+
+
+def test_transaction_stages_changes_and_notifies_once():
+    """
+    Tests that nothing is written until the block exits, and that observers
+    then receive one notification with the net change of each contact.
+    """
+    # ARRANGE
+    service = ContactService(InMemoryContactRepository())
+    kept = service.add_contact("Kept", "kept@example.com")
+    gone = service.add_contact("Gone", "gone@example.com")
+    observer = MagicMock(spec=Observer)
+    service.attach(observer)
+
+    # ACT
+    with service.transaction():
+        new = service.add_contact("New", "new@example.com")
+        service.update_contact(kept.contact_id, "Kept Renamed", "kept@example.com")
+        service.delete_contact(gone.contact_id)
+        temporary = service.add_contact("Temporary", "temp@example.com")
+        service.delete_contact(temporary.contact_id)
+        assert len(service.get_all_contacts()) == 2  # Not written yet
+        observer.update.assert_not_called()
+
+    # ASSERT
+    assert _emails(service) == {"Kept Renamed": "kept@example.com", "New": "new@example.com"}
+    observer.update.assert_called_once()
+    events = observer.update.call_args.args[1]
+    assert [type(e) for e in events] == [ContactAdded, ContactUpdated, ContactDeleted]
+    assert events[0].contact == new
+    assert events[1].previous.name == "Kept"
+
+
+def test_transaction_rolls_back_when_the_block_raises():
+    """Tests that an exception inside the block discards every staged change."""
+    # ARRANGE
+    service = ContactService(InMemoryContactRepository())
+    existing = service.add_contact("Existing", "a@example.com")
+    observer = MagicMock(spec=Observer)
+    service.attach(observer)
+
+    # ACT
+    with pytest.raises(ValueError, match="Email already exists."):
+        with service.transaction():
+            service.delete_contact(existing.contact_id)
+            service.add_contact("First", "b@example.com")
+            service.add_contact("Second", "b@example.com")
+
+    # ASSERT
+    assert _emails(service) == {"Existing": "a@example.com"}
+    observer.update.assert_not_called()
+
+
+@pytest.mark.parametrize("make_repo", [
+    InMemoryContactRepository,
+    SqliteContactRepository,
+    ColumnarContactRepository,
+    lambda: ShardedContactRepository([InMemoryContactRepository() for _ in range(3)]),
+])
+def test_transaction_validates_emails_against_staged_state(make_repo):
+    """
+    Tests that emails freed within a transaction can be reused in it, so two
+    contacts can swap addresses, on every backend.
+    """
+    # ARRANGE
+    service = ContactService(make_repo())
+    ann = service.add_contact("Ann", "ann@example.com")
+    bob = service.add_contact("Bob", "bob@example.com")
+    old = service.add_contact("Old", "old@example.com")
+
+    # ACT
+    with service.transaction():
+        service.update_contact(ann.contact_id, "Ann", None)
+        service.update_contact(bob.contact_id, "Bob", "ann@example.com")
+        service.update_contact(ann.contact_id, "Ann", "bob@example.com")
+        service.delete_contact(old.contact_id)
+        service.add_contact("Successor", "old@example.com")
+        with pytest.raises(ValueError, match="Email already exists."):
+            service.add_contact("Clash", "ann@example.com")
+
+    # ASSERT
+    assert _emails(service) == {"Ann": "bob@example.com", "Bob": "ann@example.com",
+                                "Successor": "old@example.com"}
+    assert service.find_by_email("ann@example.com").name == "Bob"
+
+
+class _DefaultBatchSqliteRepository(SqliteContactRepository):
+    """SQLite, which enforces unique emails, writing batches one change at a time."""
+    apply_changes = AbstractContactRepository.apply_changes
+
+
+@pytest.mark.parametrize("make_repo", [
+    InMemoryContactRepository,
+    SqliteContactRepository,
+    _DefaultBatchSqliteRepository,
+])
+def test_email_can_move_to_a_contact_updated_earlier_in_the_transaction(make_repo):
+    """
+    Tests that an address given up by one contact can go to a contact first
+    touched before it, both in SQLite's batch and in the default one.
+    """
+    # ARRANGE
+    service = ContactService(make_repo())
+    ann = service.add_contact("Ann", "a@example.com")
+    bob = service.add_contact("Bob", None)
+
+    # ACT
+    with service.transaction():
+        service.update_contact(bob.contact_id, "Robert", None)
+        service.update_contact(ann.contact_id, "Ann", None)
+        service.update_contact(bob.contact_id, "Robert", "a@example.com")
+
+    # ASSERT
+    assert _emails(service) == {"Ann": None, "Robert": "a@example.com"}
+    assert service.find_by_email("a@example.com").contact_id == bob.contact_id
+
+
+def test_sqlite_apply_changes_is_atomic():
+    """Tests that a batch failing in SQLite leaves the database untouched."""
+    # ARRANGE
+    repo = SqliteContactRepository()
+    service = ContactService(repo)
+    ann = service.add_contact("Ann", "ann@example.com")
+    service.add_contact("Bob", "bob@example.com")
+    ann.name = "Ann Renamed"
+    clash = service.add_contact("Clash", None)
+    clash.email = "bob@example.com"  # Bypasses the service's validation
+
+    # ACT
+    with pytest.raises(ValueError, match="Email already exists."):
+        repo.apply_changes([], [ann, clash], [])
+
+    # ASSERT
+    assert repo.get(ann.contact_id).name == "Ann"
+    assert repo.get(clash.contact_id).email is None
+
+
+def test_durable_transaction_is_logged_as_one_record(tmp_path):
+    """Tests that a committed transaction is one log record and survives a restart."""
+    # ARRANGE
+    repo = DurableContactRepository(str(tmp_path))
+    service = ContactService(repo)
+    ann = service.add_contact("Ann", "ann@example.com")
+    repo.sync()
+    log_lines = (tmp_path / "contacts.log").read_bytes().count(b"\n")
+
+    # ACT
+    with service.transaction():
+        service.update_contact(ann.contact_id, "Ann", "ann.old@example.com")
+        service.add_contact("Bob", "ann@example.com")
+    repo.close()
+
+    # ASSERT
+    assert (tmp_path / "contacts.log").read_bytes().count(b"\n") == log_lines + 1
+    reopened = ContactService(DurableContactRepository(str(tmp_path)))
+    assert _emails(reopened) == {"Ann": "ann.old@example.com", "Bob": "ann@example.com"}